@@ -0,0 +1,253 @@
+"""
+Banco de pruebas de rendimiento de los motores de planificación, sin interfaz gráfica.
+
+Mide RRController.simular_rr y SRTFController.simular_srtf sobre cargas sintéticas de
+10 a 1.000.000 procesos con distintos patrones de llegada, y guarda los resultados en
+JSON para comparar entre commits.
+
+Uso:
+    python -m app.benchmark                                   # todo, hasta 1M procesos
+    python -m app.benchmark --hasta 10000 --salida base.json
+    python -m app.benchmark --casos srtf --patrones expropiaciones
+    python -m app.benchmark --comparar base.json --salida nuevo.json
+
+Patrones de llegada (las ráfagas son uniformes entre 1 y 9):
+    simultaneas     todos llegan en t=0
+    uniformes       una llegada cada ~1 unidad: llega más trabajo del que la CPU atiende
+    rafagas         grupos de llegadas casi simultáneas separados por pausas largas
+    dispersas       llegadas espaciadas: la CPU queda ociosa entre procesos
+    expropiaciones  una llegada por unidad, cada una más corta que lo que le queda al
+                    proceso en ejecución: peor caso de expropiaciones para SRTF
+
+Casos: rr-q1 (Round Robin con quantum 1, el peor caso en cantidad de segmentos) y srtf.
+Cada caso se mide en modo 'columnar' (ResultadoSimulacion con los segmentos) y en modo
+'metricas' (solo_metricas=True). El tiempo es el mínimo y la mediana de --repeticiones
+corridas; la memoria pico se mide aparte, en una corrida más con tracemalloc (que la
+hace más lenta), y descuenta la carga de entrada. Si un caso tarda más de --limite
+segundos, se omiten sus tamaños siguientes.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+from datetime import datetime, timezone
+
+from app.controllers.rr_controller import RRController
+from app.controllers.srtf_controller import SRTFController
+from app.models.generador_cargas import generar_carga, interpretar_distribucion
+from app.models.tabla_procesos import TablaProcesos
+from app.utils.helpers import NombresProceso
+
+
+TAMANOS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+RAFAGAS = "uniforme:1,9"
+# Patrón -> distribución de los tiempos entre llegadas (ver app.models.generador_cargas)
+PATRONES = {
+    'simultaneas': "fija:0",
+    'uniformes': "uniforme:0,2",
+    'rafagas': "bimodal:0.05,40,0.1",
+    'dispersas': "exponencial:20",
+    'expropiaciones': None, # Determinista, ver _carga_expropiaciones
+}
+# Caso -> (algoritmo, quantum, patrones por defecto)
+CASOS = {
+    'rr-q1': ('rr', 1, ('simultaneas', 'uniformes', 'rafagas', 'dispersas')),
+    'srtf': ('srtf', None, ('simultaneas', 'uniformes', 'rafagas', 'dispersas', 'expropiaciones')),
+}
+MODOS = ('columnar', 'metricas')
+FORMATO = 1 # Versión del formato del JSON de resultados
+
+
+def _carga_expropiaciones(cantidad):
+    # El proceso i llega en t=i con ráfaga 2(n-i)-1 y al que se está ejecutando (el i-1,
+    # que llegó con 2(n-i)+1) le quedan 2(n-i): cada llegada lo expropia y la cola crece hasta n
+    llegada = array('q', range(cantidad))
+    duracion = array('q', (2 * (cantidad - i) - 1 for i in range(cantidad)))
+    return TablaProcesos.desde_columnas(NombresProceso(cantidad), llegada, duracion)
+
+
+def generar(patron, cantidad):
+    """Carga de `cantidad` procesos con el `patron` de llegadas; la misma en cada corrida."""
+    if patron == 'expropiaciones':
+        return _carga_expropiaciones(cantidad)
+    return generar_carga(cantidad, interpretar_distribucion(PATRONES[patron]),
+                         interpretar_distribucion(RAFAGAS), random.Random(f"{patron}:{cantidad}"))
+
+
+def _simular(algoritmo, quantum, tabla, modo):
+    """Corre la simulación y devuelve la cantidad de segmentos que produjo."""
+    solo_metricas = modo == 'metricas'
+    if algoritmo == 'rr':
+        resultado = RRController.simular_rr(tabla, quantum, columnar=True, solo_metricas=solo_metricas)
+    else:
+        resultado = SRTFController.simular_srtf(tabla, columnar=True, solo_metricas=solo_metricas)
+    return resultado.segmentos if solo_metricas else len(resultado)
+
+
+def medir(algoritmo, quantum, tabla, modo, repeticiones):
+    """Devuelve (tiempos en segundos, memoria pico en bytes, segmentos) de un caso."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        segmentos = _simular(algoritmo, quantum, tabla, modo)
+        tiempos.append(time.perf_counter() - inicio)
+        # El resultado se libera antes de la corrida siguiente
+
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        _simular(algoritmo, quantum, tabla, modo)
+        pico = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return tiempos, pico, segmentos
+
+
+def _commit():
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return salida.stdout.strip() or None
+
+
+def ejecutar(casos, patrones, tamanos, modos, repeticiones, limite, progreso=None):
+    """
+    Corre las combinaciones pedidas y devuelve la lista de resultados (diccionarios).
+    `progreso`, si se da, recibe cada resultado en cuanto está listo.
+    """
+    resultados = []
+    for caso in casos:
+        algoritmo, quantum, patrones_caso = CASOS[caso]
+        for patron in (p for p in patrones if p in patrones_caso):
+            for modo in modos:
+                for cantidad in tamanos:
+                    tabla = generar(patron, cantidad)
+                    tiempos, pico, segmentos = medir(algoritmo, quantum, tabla, modo, repeticiones)
+                    resultado = {
+                        'caso': caso, 'patron': patron, 'modo': modo, 'procesos': cantidad,
+                        'segmentos': segmentos,
+                        'tiempo_min_s': min(tiempos), 'tiempo_mediana_s': statistics.median(tiempos),
+                        'memoria_pico_bytes': pico,
+                    }
+                    resultados.append(resultado)
+                    if progreso:
+                        progreso(resultado)
+                    if min(tiempos) > limite:
+                        break # Los tamaños siguientes tardarían todavía más
+    return resultados
+
+
+def _clave(resultado):
+    return resultado['caso'], resultado['patron'], resultado['modo'], resultado['procesos']
+
+
+def comparar(base, resultados, salida):
+    """Escribe la razón nuevo/base de tiempo y memoria de los casos presentes en ambos."""
+    anteriores = {_clave(r): r for r in base['resultados']}
+    salida.write(f"\nComparación con {base.get('commit') or 'la base'} (razón nuevo / base; < 1 es mejor)\n")
+    salida.write(f"{'caso':<8} {'patron':<15} {'modo':<9} {'procesos':>9} {'tiempo':>8} {'memoria':>8}\n")
+    for resultado in resultados:
+        anterior = anteriores.get(_clave(resultado))
+        if anterior is None:
+            continue
+        razon_tiempo = resultado['tiempo_min_s'] / anterior['tiempo_min_s'] if anterior['tiempo_min_s'] else float('nan')
+        razon_memoria = resultado['memoria_pico_bytes'] / anterior['memoria_pico_bytes'] \
+            if anterior['memoria_pico_bytes'] else float('nan')
+        salida.write(f"{resultado['caso']:<8} {resultado['patron']:<15} {resultado['modo']:<9} "
+                     f"{resultado['procesos']:>9} {razon_tiempo:>8.2f} {razon_memoria:>8.2f}\n")
+
+
+def _escribir_fila(resultado, salida=sys.stderr):
+    salida.write(f"{resultado['caso']:<8} {resultado['patron']:<15} {resultado['modo']:<9} "
+                 f"{resultado['procesos']:>9} {resultado['segmentos']:>10} "
+                 f"{resultado['tiempo_min_s'] * 1000:>11.2f} {resultado['memoria_pico_bytes'] / 2**20:>10.2f}\n")
+    salida.flush()
+
+
+def _lista(opciones):
+    def convertir(texto):
+        valores = [v.strip() for v in texto.split(',') if v.strip()]
+        desconocidos = [v for v in valores if v not in opciones]
+        if desconocidos or not valores:
+            raise argparse.ArgumentTypeError(f"valores no válidos: {', '.join(desconocidos) or texto!r}; "
+                                             f"use {', '.join(opciones)}")
+        return valores
+    return convertir
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m app.benchmark",
+                                     description="Rendimiento de los motores RR y SRTF con cargas sintéticas.")
+    parser.add_argument("--casos", type=_lista(CASOS), default=list(CASOS),
+                        help=f"Casos separados por comas (por defecto: {','.join(CASOS)})")
+    parser.add_argument("--patrones", type=_lista(PATRONES), default=list(PATRONES),
+                        help="Patrones de llegada separados por comas (por defecto: todos)")
+    parser.add_argument("--modos", type=_lista(MODOS), default=list(MODOS),
+                        help="Modos separados por comas: columnar, metricas (por defecto: ambos)")
+    parser.add_argument("--hasta", type=int, default=TAMANOS[-1],
+                        help="Cantidad máxima de procesos (por defecto 1000000)")
+    parser.add_argument("--repeticiones", "-r", type=int, default=3, help="Corridas cronometradas por medición (por defecto 3)")
+    parser.add_argument("--limite", type=float, default=60.0,
+                        help="Segundos de una corrida a partir de los cuales no se prueban tamaños mayores (por defecto 60)")
+    parser.add_argument("--salida", "-o", default="benchmark.json",
+                        help="Archivo JSON de resultados (por defecto benchmark.json; '-' para la salida estándar)")
+    parser.add_argument("--comparar", metavar="BASE", help="JSON de una corrida anterior con el que comparar")
+    return parser
+
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.repeticiones < 1:
+        parser.error("se necesita al menos una repetición")
+    tamanos = [n for n in TAMANOS if n <= args.hasta]
+    if not tamanos:
+        parser.error(f"--hasta debe ser al menos {TAMANOS[0]}")
+
+    base = None
+    if args.comparar:
+        try:
+            with open(args.comparar, encoding="utf-8") as archivo:
+                base = json.load(archivo)
+        except (OSError, ValueError) as e:
+            print(f"Error: No se pudo leer {args.comparar}: {e}", file=sys.stderr)
+            return 1
+
+    sys.stderr.write(f"{'caso':<8} {'patron':<15} {'modo':<9} {'procesos':>9} {'segmentos':>10} "
+                     f"{'tiempo (ms)':>11} {'pico (MiB)':>10}\n")
+    resultados = ejecutar(args.casos, args.patrones, tamanos, args.modos, args.repeticiones, args.limite,
+                          progreso=_escribir_fila)
+    informe = {
+        'formato': FORMATO,
+        'commit': _commit(),
+        'fecha': datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'repeticiones': args.repeticiones,
+        'resultados': resultados,
+    }
+    texto = json.dumps(informe, indent=2, ensure_ascii=False) + "\n"
+    if args.salida == "-":
+        sys.stdout.write(texto)
+    else:
+        try:
+            with open(args.salida, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+        except OSError as e:
+            print(f"Error: No se pudo escribir {args.salida}: {e}", file=sys.stderr)
+            return 1
+    if base is not None:
+        comparar(base, resultados, sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+"""
+Simulación por línea de comandos, sin interfaz gráfica.
+
+Solo importa los controladores (y los modelos que usan), nunca customtkinter,
+matplotlib ni PIL, así que arranca rápido y funciona en servidores sin display.
+
+Uso:
+    python -m app.cli rr --quantum 2 carga.csv
+    python -m app.cli rr --quantum 1 carga.csv --segmentos --fusionar
+    python -m app.cli srtf carga.csv --segmentos
+    cat carga.csv | python -m app.cli srtf
+    python -m app.cli barrido --quantums 1:20 carga.csv --grafico barrido.png
+    python -m app.cli lote --cargas 1000 --procesos 50 --llegadas poisson:0.5 --rafagas pareto:1.5,2 -q 2
+    python -m app.cli prioridad --envejecimiento 5 carga_prioridades.csv
+    python -m app.cli mlfq --quantums 2,4,8 --boost 100 carga.csv
+    python -m app.cli --perfil srtf.prof srtf carga.csv
+
+El subcomando barrido simula Round Robin con cada quantum en procesos paralelos e
+imprime una fila de métricas promedio por quantum; con --grafico también guarda el
+gráfico (solo entonces se importa matplotlib). El subcomando lote genera cargas
+aleatorias, las simula con RR y con SRTF en procesos paralelos e imprime la media y
+el intervalo de confianza de cada métrica (ver ComparacionController).
+
+El subcomando prioridad simula la planificación por prioridades expropiativa (0 es la
+máxima), con envejecimiento opcional; lee un CSV con una cuarta columna, prioridad.
+El subcomando mlfq simula colas multinivel con retroalimentación: un quantum por nivel
+(--quantums), cuánto puede ejecutar un proceso en cada nivel antes de bajar
+(--asignaciones, por defecto un quantum) y el boost periódico al nivel 0 (--boost).
+
+Con --perfil se escribe en la salida de errores el tiempo y las llamadas de cada fase
+(lectura, simulación, salida; ver app.utils.perfilado) y, si se da una ruta, un
+volcado de cProfile para pstats.
+
+El archivo de entrada es un CSV con columnas nombre, llegada, duracion (la fila de
+encabezado es opcional), un archivo JSON Lines (.jsonl) o un .npy; ver app.models.carga.
+Sin archivo, o con "-", se lee CSV de la entrada estándar.
+"""
+import argparse
+import csv
+import math
+import sys
+
+from app.controllers.rr_controller import RRController
+from app.controllers.srtf_controller import SRTFController
+from app.controllers.prioridad_controller import PrioridadController
+from app.controllers.mlfq_controller import MLFQController
+from app.models.carga import cargar_carga, leer_csv, leer_csv_con_prioridad
+from app.models.eventos import EventoSegmento
+from app.utils.perfilado import fase, perfilar
+
+
+def _numero(texto):
+    """Convierte un campo a int si es entero y a float en otro caso; rechaza NaN e infinito."""
+    try:
+        return int(texto)
+    except ValueError:
+        valor = float(texto)
+    if not math.isfinite(valor): # nan pasaría las comparaciones '<= 0' de los parámetros
+        raise argparse.ArgumentTypeError(f"valor no válido: {texto!r}; debe ser un número finito")
+    return valor
+
+
+def _escribir_segmentos(eventos, salida):
+    """Escribe los segmentos a medida que la simulación incremental los produce (sin acumularlos)."""
+    escritor = csv.writer(salida, lineterminator="\n")
+    escritor.writerow(["proceso", "comienzo", "final"])
+    for evento in eventos:
+        if type(evento) is EventoSegmento:
+            escritor.writerow(evento)
+
+
+def _escribir_metricas(tabla, metricas, salida):
+    escritor = csv.writer(salida, lineterminator="\n")
+    escritor.writerow(["proceso", "llegada", "cpu", "finalizacion", "espera", "turnaround"])
+    filas = zip(tabla.nombres, tabla.llegada, tabla.duracion, tabla.finalizacion, tabla.espera, tabla.turnaround)
+    if -1 in tabla.finalizacion: # Los que nunca terminan (ráfaga 0) se marcan como en la GUI
+        filas = (fila if fila[3] != -1 else fila[:3] + ("No Term.",) * 3 for fila in filas)
+    escritor.writerows(filas)
+    if len(tabla):
+        salida.write(f"# Espera promedio: {metricas.espera_promedio:.4f}\n")
+        salida.write(f"# Turnaround promedio: {metricas.turnaround_promedio:.4f}\n")
+
+
+def _quantums(texto):
+    from app.models.barrido_quantum import interpretar_quantums # Solo con el subcomando barrido
+    try:
+        return interpretar_quantums(texto)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _distribucion(texto):
+    from app.models.generador_cargas import interpretar_distribucion # Solo con el subcomando lote
+    try:
+        return interpretar_distribucion(texto)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _niveles(texto):
+    """Lista de números separados por comas, uno por nivel (ej. 2,4,8)."""
+    try:
+        valores = [_numero(v) for v in texto.split(',') if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valores no válidos: {texto!r}; use números separados por comas")
+    if not valores or any(v <= 0 for v in valores):
+        raise argparse.ArgumentTypeError("se necesita al menos un valor y todos deben ser mayores que 0")
+    return valores
+
+
+def _escribir_lote(configuracion, resumen, confianza, salida):
+    from app.controllers.comparacion_controller import METRICAS_LOTE, SERIES_LOTE
+    salida.write(f"# {configuracion.cargas} cargas de {configuracion.procesos} procesos, quantum {configuracion.quantum}, "
+                 f"intervalos al {confianza:.0%}\n")
+    escritor = csv.writer(salida, lineterminator="\n")
+    escritor.writerow(["metrica"] + [f"{serie}_{valor}" for serie in SERIES_LOTE for valor in ("media", "margen")])
+    for metrica in METRICAS_LOTE:
+        fila = [metrica]
+        for serie in SERIES_LOTE:
+            intervalo = resumen[metrica, serie].intervalo(confianza)
+            fila += [f"{intervalo.media:.4f}", f"{intervalo.margen:.4f}"]
+        escritor.writerow(fila)
+
+
+def _escribir_barrido(filas, salida):
+    escritor = csv.writer(salida, lineterminator="\n")
+    escritor.writerow(["quantum", "espera_promedio", "turnaround_promedio", "respuesta_promedio", "cambios_contexto"])
+    for quantum, metricas in filas:
+        escritor.writerow([quantum, f"{metricas.espera_promedio:.4f}", f"{metricas.turnaround_promedio:.4f}",
+                           f"{metricas.respuesta_promedio:.4f}", metricas.cambios_contexto])
+
+
+def _guardar_grafico_barrido(filas, ruta):
+    import matplotlib
+    matplotlib.use("Agg") # Sin display: solo se guarda el archivo
+    from matplotlib.figure import Figure
+    from app.utils.visualizer import dibujar_barrido_quantum
+    fig = Figure(figsize=(10, 7))
+    dibujar_barrido_quantum(fig, filas)
+    fig.savefig(ruta)
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m app.cli",
+                                     description="Simulador de planificación RR/SRTF sin interfaz gráfica.")
+    parser.add_argument("--perfil", nargs="?", const="", default=None, metavar="VOLCADO",
+                        help="Informar el tiempo de cada fase en la salida de errores; "
+                             "con VOLCADO, guardar también las estadísticas de cProfile")
+    subparsers = parser.add_subparsers(dest="algoritmo", required=True)
+
+    parser_rr = subparsers.add_parser("rr", help="Round Robin")
+    parser_rr.add_argument("--quantum", "-q", type=_numero, required=True, help="Quantum de tiempo (> 0)")
+    parser_rr.add_argument("--fusionar", action="store_true",
+                           help="Con --segmentos, unir los quantums consecutivos de un mismo proceso en un segmento")
+    parser_srtf = subparsers.add_parser("srtf", help="Shortest Remaining Time First")
+    parser_prioridad = subparsers.add_parser("prioridad", help="Prioridades expropiativo, con envejecimiento opcional")
+    parser_prioridad.add_argument("--envejecimiento", "-e", type=_numero, default=None,
+                                  help="Cada cuántas unidades de espera mejora en 1 la prioridad de un listo (por defecto, nunca)")
+    parser_prioridad.add_argument("archivo", nargs="?", default="-",
+                                  help="CSV con nombre, llegada, duracion, prioridad (por defecto, la entrada estándar)")
+    parser_mlfq = subparsers.add_parser("mlfq", help="Colas multinivel con retroalimentación")
+    parser_mlfq.add_argument("--quantums", "-q", type=_niveles, required=True,
+                             help="Quantum de cada nivel, del más prioritario al último, separados por comas (ej. 2,4,8)")
+    parser_mlfq.add_argument("--asignaciones", "-a", type=_niveles, default=None,
+                             help="Tiempo de CPU en cada nivel antes de bajar al siguiente (por defecto, un quantum)")
+    parser_mlfq.add_argument("--boost", "-b", type=_numero, default=None,
+                             help="Cada cuánto suben todos los procesos listos al primer nivel (por defecto, nunca)")
+    parser_barrido = subparsers.add_parser("barrido", help="Round Robin con un rango de quantums, en paralelo")
+    parser_barrido.add_argument("--quantums", "-q", type=_quantums, required=True,
+                                help="Quantums a probar: inicio:fin[:paso] y/o valores separados por comas (ej. 1:20)")
+    parser_barrido.add_argument("--trabajadores", "-j", type=int, default=None,
+                                help="Procesos de trabajo (por defecto, uno por núcleo)")
+    parser_barrido.add_argument("--grafico", metavar="RUTA", help="Guardar también el gráfico (.png, .svg, .pdf)")
+
+    parser_lote = subparsers.add_parser("lote", help="Comparación Monte Carlo de RR y SRTF sobre cargas aleatorias")
+    parser_lote.add_argument("--cargas", "-n", type=int, default=1000, help="Cantidad de cargas a generar (por defecto 1000)")
+    parser_lote.add_argument("--procesos", "-p", type=int, default=50, help="Procesos por carga (por defecto 50)")
+    parser_lote.add_argument("--llegadas", type=_distribucion, default="poisson:0.5",
+                             help="Distribución de los tiempos entre llegadas (por defecto poisson:0.5)")
+    parser_lote.add_argument("--rafagas", type=_distribucion, default="exponencial:4",
+                             help="Distribución de las ráfagas: exponencial:media, bimodal:corta,larga,p, "
+                                  "pareto:alfa,minimo, uniforme:min,max o fija:valor (por defecto exponencial:4)")
+    parser_lote.add_argument("--quantum", "-q", type=_numero, default=2, help="Quantum de RR (por defecto 2)")
+    parser_lote.add_argument("--semilla", type=int, default=None, help="Semilla para repetir el experimento")
+    parser_lote.add_argument("--confianza", type=float, default=0.95, help="Nivel de los intervalos (por defecto 0.95)")
+    parser_lote.add_argument("--trabajadores", "-j", type=int, default=None,
+                             help="Procesos de trabajo (por defecto, uno por núcleo)")
+
+    for sub in (parser_rr, parser_srtf, parser_mlfq, parser_barrido):
+        sub.add_argument("archivo", nargs="?", default="-",
+                         help="Archivo de procesos .csv, .jsonl o .npy (por defecto, CSV por la entrada estándar)")
+    for sub in (parser_rr, parser_srtf, parser_prioridad, parser_mlfq):
+        sub.add_argument("--segmentos", action="store_true",
+                         help="Imprimir los segmentos del diagrama de Gantt en lugar de las métricas por proceso")
+    return parser
+
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.perfil is None:
+        return _ejecutar(parser, args)
+    with perfilar(args.perfil or None) as perfil:
+        codigo = _ejecutar(parser, args)
+    sys.stderr.write(perfil.texto())
+    return codigo
+
+
+def _ejecutar(parser, args):
+    if args.algoritmo == "rr" and args.quantum <= 0:
+        parser.error("el quantum debe ser mayor que 0")
+    if args.algoritmo == "prioridad" and args.envejecimiento is not None and args.envejecimiento <= 0:
+        parser.error("el intervalo de envejecimiento debe ser mayor que 0")
+    if args.algoritmo == "mlfq":
+        if args.asignaciones is not None and len(args.asignaciones) != len(args.quantums):
+            parser.error("debe haber una asignación por cada quantum")
+        if args.boost is not None and args.boost <= 0:
+            parser.error("el intervalo de boost debe ser mayor que 0")
+    if args.algoritmo in ("barrido", "lote") and args.trabajadores is not None and args.trabajadores < 1:
+        parser.error("la cantidad de trabajadores debe ser al menos 1")
+
+    if args.algoritmo == "lote":
+        if args.cargas < 1 or args.procesos < 1:
+            parser.error("la cantidad de cargas y de procesos debe ser al menos 1")
+        if args.quantum <= 0:
+            parser.error("el quantum debe ser mayor que 0")
+        if not 0 < args.confianza < 1:
+            parser.error("la confianza debe estar entre 0 y 1")
+        # Import diferido: el lote carga concurrent.futures y multiprocessing
+        from app.controllers.comparacion_controller import ComparacionController, ConfiguracionLote
+        configuracion = ConfiguracionLote(args.cargas, args.procesos, args.llegadas, args.rafagas, args.quantum, args.semilla)
+        resumen = ComparacionController.ejecutar_lote(configuracion, args.trabajadores)
+        _escribir_lote(configuracion, resumen, args.confianza, sys.stdout)
+        return 0
+
+    if args.algoritmo == "prioridad":
+        return _ejecutar_prioridad(args)
+
+    try:
+        # La carga va directo a una TablaProcesos, sin un diccionario por proceso
+        with fase("cli.leer_carga"):
+            procesos = leer_csv(sys.stdin) if args.archivo == "-" else cargar_carga(args.archivo)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not procesos:
+        print("Error: No hay procesos para simular.", file=sys.stderr)
+        return 1
+
+    if args.algoritmo == "barrido":
+        filas = RRController.barrido_quantum(procesos, args.quantums, args.trabajadores)
+        _escribir_barrido(filas, sys.stdout)
+        if args.grafico:
+            try:
+                _guardar_grafico_barrido(filas, args.grafico)
+            except (OSError, ValueError) as e: # Ruta no escribible o formato no soportado
+                print(f"Error: No se pudo guardar el gráfico: {e}", file=sys.stderr)
+                return 1
+        return 0
+
+    if args.segmentos:
+        # Simulación incremental: cada segmento se escribe en cuanto se decide
+        if args.algoritmo == "rr":
+            eventos = RRController.iter_rr(procesos, args.quantum, args.fusionar)
+        elif args.algoritmo == "mlfq":
+            eventos = MLFQController.iter_mlfq(procesos, args.quantums, args.asignaciones, args.boost)
+        else:
+            eventos = SRTFController.iter_srtf(procesos)
+        with fase("cli.simulacion_y_salida"): # Incremental: cada segmento se escribe al decidirse
+            _escribir_segmentos(eventos, sys.stdout)
+        return 0
+
+    # Solo métricas: la tabla queda completa sin generar los segmentos
+    if args.algoritmo == "rr":
+        modelo = RRController.modelo_rr(procesos, args.quantum)
+    elif args.algoritmo == "mlfq":
+        modelo = MLFQController.modelo_mlfq(procesos, args.quantums, args.asignaciones, args.boost)
+    else:
+        modelo = SRTFController.modelo_srtf(procesos)
+    with fase("cli.planificacion"):
+        metricas = modelo.metricas()
+    with fase("cli.salida"):
+        _escribir_metricas(modelo.tabla, metricas, sys.stdout)
+    return 0
+
+
+def _ejecutar_prioridad(args):
+    try:
+        with fase("cli.leer_carga"):
+            if args.archivo == "-":
+                procesos, prioridades = leer_csv_con_prioridad(sys.stdin)
+            else:
+                with open(args.archivo, newline="", encoding="utf-8") as archivo:
+                    procesos, prioridades = leer_csv_con_prioridad(archivo)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not procesos:
+        print("Error: No hay procesos para simular.", file=sys.stderr)
+        return 1
+
+    if args.segmentos:
+        eventos = PrioridadController.iter_prioridad(procesos, args.envejecimiento, prioridades)
+        with fase("cli.simulacion_y_salida"):
+            _escribir_segmentos(eventos, sys.stdout)
+        return 0
+
+    modelo = PrioridadController.modelo_prioridad(procesos, args.envejecimiento, prioridades)
+    with fase("cli.planificacion"):
+        metricas = modelo.metricas()
+    with fase("cli.salida"):
+        _escribir_metricas(modelo.tabla, metricas, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
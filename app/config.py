@@ -50,6 +50,6 @@ COLOR_TEXTO_BLANCO = "#FFFFFF"
 
 # --- Constantes de la Simulación ---
 MIN_PROCESOS_RR = 3 # Mínimo de procesos para Round Robin
-MAX_PROCESOS_RR = 20 # Máximo de procesos para Round Robin
+MAX_PROCESOS_RR = 10000 # Máximo de procesos para Round Robin (el editor de entradas es virtualizado)
 MIN_PROCESOS_SRTF = 3 # Mínimo de procesos para SRTF
-MAX_PROCESOS_SRTF = 20 # Máximo de procesos para SRTF
+MAX_PROCESOS_SRTF = 10000 # Máximo de procesos para SRTF
@@ -0,0 +1,5 @@
+from app.controllers.rr_controller import RRController, MockRRController
+from app.controllers.srtf_controller import SRTFController, MockSRTFController
+from app.controllers.comparacion_controller import ComparacionController
+from app.controllers.prioridad_controller import PrioridadController
+from app.controllers.mlfq_controller import MLFQController
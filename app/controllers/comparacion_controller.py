@@ -0,0 +1,115 @@
+import os
+from collections import namedtuple
+from itertools import islice
+
+from app.controllers.rr_controller import RRController
+from app.controllers.srtf_controller import SRTFController
+from app.models.estadistica import EstadisticaEnLinea
+from app.models.generador_cargas import generar_carga, rng_de_carga
+
+
+# Parámetros de un lote: cantidad de cargas, procesos por carga, Distribucion de los
+# tiempos entre llegadas y de las ráfagas, quantum de RR y semilla (None: no reproducible)
+ConfiguracionLote = namedtuple('ConfiguracionLote', 'cargas procesos llegadas rafagas quantum semilla')
+
+# Métricas comparadas (campos de MetricasSimulacion)
+METRICAS_LOTE = ('espera_promedio', 'turnaround_promedio', 'respuesta_promedio', 'cambios_contexto')
+SERIES_LOTE = ('rr', 'srtf', 'diferencia')
+
+
+def nuevo_resumen():
+    """
+    Acumuladores vacíos de un lote: para cada métrica, uno de RR, uno de SRTF y uno de
+    la diferencia RR - SRTF en la misma carga (comparación pareada, con intervalos más
+    estrechos que comparar los de cada algoritmo por separado).
+    """
+    return {(metrica, serie): EstadisticaEnLinea() for metrica in METRICAS_LOTE for serie in SERIES_LOTE}
+
+
+def _simular_cargas(configuracion, desde, hasta):
+    """Tarea de un trabajador: simula las cargas [desde, hasta) y devuelve sus acumuladores."""
+    resumen = nuevo_resumen()
+    for k in range(desde, hasta):
+        tabla = generar_carga(configuracion.procesos, configuracion.llegadas, configuracion.rafagas,
+                              rng_de_carga(configuracion.semilla, k))
+        metricas_rr = RRController.simular_rr(tabla, configuracion.quantum, solo_metricas=True)
+        metricas_srtf = SRTFController.simular_srtf(tabla, solo_metricas=True)
+        for metrica in METRICAS_LOTE:
+            valor_rr, valor_srtf = getattr(metricas_rr, metrica), getattr(metricas_srtf, metrica)
+            resumen[metrica, 'rr'].agregar(valor_rr)
+            resumen[metrica, 'srtf'].agregar(valor_srtf)
+            resumen[metrica, 'diferencia'].agregar(valor_rr - valor_srtf)
+    return hasta - desde, resumen
+
+
+class ComparacionController:
+    """
+    Comparación Monte Carlo de RR contra SRTF: genera muchas cargas aleatorias (ver
+    app.models.generador_cargas), simula cada una con ambos algoritmos y agrega las
+    métricas en línea, sin guardar cargas ni resultados individuales.
+
+    El lote se reparte en tareas de CARGAS_POR_TAREA cargas entre procesos de trabajo.
+    Cada tarea genera sus cargas a partir de la semilla (la carga k es siempre la misma)
+    y devuelve solo sus acumuladores; el proceso principal los combina a medida que
+    llegan. Las tareas se envían de a poco (a lo sumo TAREAS_EN_CURSO_POR_TRABAJADOR
+    pendientes por trabajador) y cada una se descarta en cuanto se combinan sus
+    acumuladores, así que la memoria no depende de la cantidad de cargas.
+    """
+    CARGAS_POR_TAREA = 32
+    TAREAS_EN_CURSO_POR_TRABAJADOR = 2 # Suficiente para que ningún trabajador espere una tarea
+
+    @staticmethod
+    def iter_lote(configuracion, max_trabajadores=None, contexto=None):
+        """
+        Ejecuta el lote y produce (cargas completadas, resumen) cada vez que termina una
+        tarea; el último corresponde al lote completo. El resumen (ver nuevo_resumen) es
+        el mismo diccionario, actualizado en el lugar. `contexto` es el contexto de
+        multiprocessing del pool. Si se deja de consumir el generador, las tareas
+        pendientes se cancelan.
+        """
+        por_tarea = ComparacionController.CARGAS_POR_TAREA
+        total_tareas = -(-configuracion.cargas // por_tarea)
+        tareas = ((desde, min(desde + por_tarea, configuracion.cargas))
+                  for desde in range(0, configuracion.cargas, por_tarea))
+        resumen = nuevo_resumen()
+        completadas = 0
+        trabajadores = min(max_trabajadores or os.cpu_count() or 1, total_tareas)
+        if trabajadores <= 1:
+            for desde, hasta in tareas:
+                cantidad, parcial = _simular_cargas(configuracion, desde, hasta)
+                for clave, estadistica in parcial.items():
+                    resumen[clave].combinar(estadistica)
+                completadas += cantidad
+                yield completadas, resumen
+            return
+
+        # Import diferido: el paquete de controladores se importa al arrancar la CLI y la GUI
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        ventana = ComparacionController.TAREAS_EN_CURSO_POR_TRABAJADOR * trabajadores
+        en_curso = set()
+        with ProcessPoolExecutor(max_workers=trabajadores, mp_context=contexto) as pool:
+            try:
+                while True:
+                    # Reponer la ventana: se envía una tarea nueva por cada una que terminó
+                    for desde, hasta in islice(tareas, ventana - len(en_curso)):
+                        en_curso.add(pool.submit(_simular_cargas, configuracion, desde, hasta))
+                    if not en_curso:
+                        break
+                    terminados, en_curso = wait(en_curso, return_when=FIRST_COMPLETED)
+                    for futuro in terminados:
+                        cantidad, parcial = futuro.result()
+                        for clave, estadistica in parcial.items():
+                            resumen[clave].combinar(estadistica)
+                        completadas += cantidad
+                        yield completadas, resumen
+            finally:
+                for futuro in en_curso:
+                    futuro.cancel()
+
+    @staticmethod
+    def ejecutar_lote(configuracion, max_trabajadores=None, contexto=None):
+        """Ejecuta el lote completo y devuelve el resumen final."""
+        resumen = nuevo_resumen()
+        for _completadas, resumen in ComparacionController.iter_lote(configuracion, max_trabajadores, contexto):
+            pass
+        return resumen
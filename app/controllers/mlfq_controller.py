@@ -0,0 +1,65 @@
+from app.models.tabla_procesos import TablaProcesos
+from app.models.resultado import ResultadoSimulacion
+from app.models.metricas import MetricasSimulacion
+from app.models.mlfq_model import ModeloMLFQ
+from app.models.eventos import eventos_con_nombres
+from app.utils.perfilado import fase
+
+
+class MLFQController:
+    """
+    Controlador para simular colas multinivel con retroalimentación (MLFQ); ver ModeloMLFQ.
+    Recibe la misma entrada que RRController.simular_rr (lista de diccionarios o
+    TablaProcesos) y devuelve los mismos diccionarios de segmento, así que ResultsView
+    los muestra sin cambios.
+
+    quantums: quantum de cada nivel, del 0 (mayor prioridad) al último.
+    asignaciones: tiempo que un proceso puede ejecutar en cada nivel antes de bajar al
+                  siguiente (por defecto, un quantum del nivel).
+    intervalo_boost: cada cuánto suben todos los procesos listos al nivel 0 (None = nunca).
+
+    Las fases mlfq.preparar_tabla, mlfq.planificacion, mlfq.metricas y mlfq.segmentos_dict
+    se miden con app.utils.perfilado, si está activo.
+    """
+    @staticmethod
+    def simular_mlfq(procesos_iniciales, quantums, asignaciones=None, intervalo_boost=None,
+                     columnar=False, solo_metricas=False):
+        if not procesos_iniciales:
+            if solo_metricas:
+                return MetricasSimulacion(0, 0.0, 0.0, 0.0, 0, 0)
+            return ResultadoSimulacion(TablaProcesos([], [], [])) if columnar else []
+
+        with fase("mlfq.preparar_tabla"):
+            modelo = MLFQController.modelo_mlfq(procesos_iniciales, quantums, asignaciones, intervalo_boost)
+        if solo_metricas:
+            with fase("mlfq.metricas"):
+                return modelo.metricas()
+        with fase("mlfq.planificacion"):
+            resultado = modelo.simular()
+        if columnar:
+            return resultado
+        with fase("mlfq.segmentos_dict"):
+            return resultado.a_dicts()
+
+    @staticmethod
+    def iter_mlfq(procesos_iniciales, quantums, asignaciones=None, intervalo_boost=None):
+        """Versión incremental de simular_mlfq (EventoSegmento / EventoFin); ver RRController.iter_rr."""
+        if not procesos_iniciales:
+            return
+        modelo = MLFQController.modelo_mlfq(procesos_iniciales, quantums, asignaciones, intervalo_boost)
+        yield from eventos_con_nombres(modelo.tabla, modelo.eventos())
+
+    @staticmethod
+    def modelo_mlfq(procesos_iniciales, quantums, asignaciones=None, intervalo_boost=None):
+        """Devuelve el ModeloMLFQ listo para simular (sin ejecutarlo); ver RRController.modelo_rr."""
+        if not quantums or any(q <= 0 for q in quantums):
+            raise ValueError("MLFQController: se necesita al menos un nivel y todos los quantums deben ser mayores que 0.")
+        if asignaciones is not None:
+            if len(asignaciones) != len(quantums):
+                raise ValueError("MLFQController: debe haber una asignación por nivel.")
+            if any(a <= 0 for a in asignaciones):
+                raise ValueError("MLFQController: las asignaciones deben ser mayores que 0.")
+        if intervalo_boost is not None and intervalo_boost <= 0:
+            raise ValueError("MLFQController: el intervalo de boost debe ser mayor que 0.")
+        tabla = TablaProcesos.preparar(procesos_iniciales, origen="MLFQController")
+        return ModeloMLFQ(tabla, quantums, asignaciones, intervalo_boost)
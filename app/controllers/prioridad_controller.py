@@ -0,0 +1,74 @@
+from app.models.tabla_procesos import TablaProcesos
+from app.models.resultado import ResultadoSimulacion
+from app.models.metricas import MetricasSimulacion
+from app.models.prioridad_model import ModeloPrioridad
+from app.models.eventos import eventos_con_nombres
+from app.utils.perfilado import fase
+
+
+class PrioridadController:
+    """
+    Controlador para simular la planificación por prioridades expropiativa, con
+    envejecimiento opcional (ver ModeloPrioridad). Recibe los mismos diccionarios de
+    proceso que RRController y SRTFController más la clave 'prioridad' (entero >= 0;
+    0 es la máxima) y devuelve los mismos diccionarios de segmento, así que ResultsView
+    los muestra sin cambios.
+    Si la entrada es una TablaProcesos (por ejemplo, una carga importada), las
+    prioridades se pasan aparte en `prioridades`, una por proceso.
+    `envejecimiento`: cada cuántas unidades de espera mejora en 1 la prioridad de un
+    proceso listo (None = sin envejecimiento).
+    Las fases prioridad.preparar_tabla, prioridad.planificacion, prioridad.metricas y
+    prioridad.segmentos_dict se miden con app.utils.perfilado, si está activo.
+    """
+    @staticmethod
+    def simular_prioridad(procesos_iniciales, envejecimiento=None, columnar=False, solo_metricas=False, prioridades=None):
+        if not procesos_iniciales:
+            if solo_metricas:
+                return MetricasSimulacion(0, 0.0, 0.0, 0.0, 0, 0)
+            return ResultadoSimulacion(TablaProcesos([], [], [])) if columnar else []
+
+        with fase("prioridad.preparar_tabla"):
+            modelo = PrioridadController.modelo_prioridad(procesos_iniciales, envejecimiento, prioridades)
+        if solo_metricas:
+            with fase("prioridad.metricas"):
+                return modelo.metricas()
+        with fase("prioridad.planificacion"):
+            resultado = modelo.simular()
+        if columnar:
+            return resultado
+        with fase("prioridad.segmentos_dict"):
+            return resultado.a_dicts()
+
+    @staticmethod
+    def iter_prioridad(procesos_iniciales, envejecimiento=None, prioridades=None):
+        """Versión incremental de simular_prioridad (EventoSegmento / EventoFin); ver RRController.iter_rr."""
+        if not procesos_iniciales:
+            return
+        modelo = PrioridadController.modelo_prioridad(procesos_iniciales, envejecimiento, prioridades)
+        yield from eventos_con_nombres(modelo.tabla, modelo.eventos())
+
+    @staticmethod
+    def modelo_prioridad(procesos_iniciales, envejecimiento=None, prioridades=None):
+        """Devuelve el ModeloPrioridad listo para simular (sin ejecutarlo); ver RRController.modelo_rr."""
+        if envejecimiento is not None and envejecimiento <= 0:
+            raise ValueError("PrioridadController: el intervalo de envejecimiento debe ser mayor que 0.")
+        tabla = TablaProcesos.preparar(procesos_iniciales, origen="PrioridadController")
+        if prioridades is None:
+            prioridades = PrioridadController._prioridades(procesos_iniciales)
+        if any(type(p) is not int or p < 0 for p in prioridades):
+            raise ValueError("PrioridadController: las prioridades deben ser enteros >= 0.")
+        return ModeloPrioridad(tabla, prioridades, envejecimiento)
+
+    @staticmethod
+    def _prioridades(procesos_iniciales):
+        if isinstance(procesos_iniciales, TablaProcesos):
+            raise ValueError("PrioridadController: con una TablaProcesos hay que indicar las prioridades.")
+        prioridades = []
+        for i, p_orig in enumerate(procesos_iniciales):
+            if 'prioridad' not in p_orig:
+                print(f"ADVERTENCIA (PrioridadController): Proceso {p_orig.get('nombre', f'Proceso_{i+1}')} "
+                      f"no tiene clave 'prioridad'. Asumiendo 0.")
+                prioridades.append(0)
+            else:
+                prioridades.append(p_orig['prioridad'])
+        return prioridades
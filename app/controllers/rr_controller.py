@@ -1,141 +1,108 @@
-import heapq # Para SRTF, si se usa un heap para la cola de listos (opcional)
+from app.models.tabla_procesos import TablaProcesos
+from app.models.resultado import ResultadoSimulacion
+from app.models.metricas import MetricasSimulacion
+from app.models.rr_model import ModeloRR
+from app.models.eventos import eventos_con_nombres
+from app.utils.perfilado import fase
 
 class RRController:
     """
     Controlador para simular el algoritmo de planificación Round Robin (RR).
-    Este es el código que proporcionaste.
     Nota: La salida de este controlador debe ser compatible con lo que espera
-    ResultsView para generar la tabla y el diagrama de Gantt.
-    Específicamente, la lista de resultados debe contener diccionarios con claves como:
-    'proceso', 'llegada', 'cpu' (ráfaga original), 'comienzo', 'final', 'espera', 'turnaround'.
-    El código original de ResultsView espera 'cpu_total' para la ráfaga original y
-    'comienzos_segmento'/'fines_segmento' si un proceso tiene múltiples segmentos.
-    Este controlador parece generar un resultado final por proceso, no por segmento.
-    Para un Gantt detallado, se necesitarían los segmentos de ejecución individuales.
-    Ajustaré la salida para que sea una lista de segmentos, similar a MockRRController.
+    ResultsView para generar la tabla y el diagrama de Gantt: una lista de segmentos
+    de ejecución con las claves 'proceso', 'llegada', 'cpu_original', 'comienzo',
+    'final', 'espera_final' y 'turnaround_final'.
+    La simulación en sí la hace ModeloRR sobre una TablaProcesos columnar; aquí solo
+    se convierte la entrada y la salida desde/hacia diccionarios.
+    Con columnar=True se devuelve directamente el ResultadoSimulacion (columnas de
+    índice/comienzo/final más la tabla de procesos), que genera los diccionarios
+    de segmento solo cuando se recorren.
+    Con solo_metricas=True no se generan segmentos: se devuelve la MetricasSimulacion
+    (promedios de espera, turnaround y respuesta, cambios de contexto) calculada
+    directamente por ModeloRR.metricas().
+    Con fusionar_segmentos=True los quantums consecutivos de un mismo proceso salen como
+    un único segmento (ver ModeloRR); el tiempo de cada proceso no cambia.
+    Con la instrumentación activa (app.utils.perfilado) se miden las fases
+    rr.preparar_tabla, rr.planificacion, rr.metricas y rr.segmentos_dict.
     """
     @staticmethod
-    def simular_rr(procesos_iniciales, quantum):
-        results_list_of_segments = []
+    def simular_rr(procesos_iniciales, quantum, columnar=False, solo_metricas=False, fusionar_segmentos=False):
+        if solo_metricas:
+            if not procesos_iniciales:
+                return MetricasSimulacion(0, 0.0, 0.0, 0.0, 0, 0)
+            with fase("rr.preparar_tabla"):
+                tabla = TablaProcesos.preparar(procesos_iniciales, origen="RRController")
+            with fase("rr.metricas"):
+                return ModeloRR(tabla, quantum, fusionar_segmentos).metricas()
         if not procesos_iniciales:
-            return []
-
-        # Copiar procesos para no modificar la lista original y añadir campos necesarios
-        procesos_para_simular = []
-        for p_orig in procesos_iniciales:
-            p_copy = p_orig.copy() # nombre, llegada, duracion (o duracion_original)
-            # Asegurar que la clave de duración sea consistente, ej. 'duracion_original'
-            duracion_key = 'duracion_original' if 'duracion_original' in p_copy else 'duracion'
-            if duracion_key not in p_copy:
-                 print(f"ADVERTENCIA (RRController): Proceso {p_copy.get('nombre')} no tiene clave de duración ('duracion' o 'duracion_original'). Asumiendo 1.")
-                 p_copy[duracion_key] = 1
-
-            p_copy['restante'] = p_copy[duracion_key]
-            p_copy['duracion_original_calc'] = p_copy[duracion_key] # Guardar para cálculo final
-            p_copy['tiempo_finalizacion_calc'] = 0
-            p_copy['tiempo_espera_final_calc'] = "Calc..."
-            p_copy['turnaround_final_calc'] = "Calc..."
-            # p_copy['primer_comienzo_ejecucion'] = -1 # No usado directamente en esta versión de salida por segmento
-            procesos_para_simular.append(p_copy)
-
-        procesos_para_simular.sort(key=lambda p: p['llegada'])
-
-        tiempo_actual = 0
-        cola_listos = []
-        idx_proceso_entrante = 0
-        procesos_terminados_count = 0
-
-        # Diccionario para almacenar las estadísticas finales calculadas para cada proceso
-        stats_finales_procesos = {p['nombre']: {} for p in procesos_para_simular}
-
-
-        while procesos_terminados_count < len(procesos_para_simular):
-            # Añadir procesos que han llegado a la cola de listos
-            while idx_proceso_entrante < len(procesos_para_simular) and \
-                  procesos_para_simular[idx_proceso_entrante]['llegada'] <= tiempo_actual:
-                proceso_a_encolar = procesos_para_simular[idx_proceso_entrante]
-                if proceso_a_encolar not in cola_listos: # Evitar duplicados si ya está
-                    cola_listos.append(proceso_a_encolar)
-                idx_proceso_entrante += 1
-
-            if not cola_listos:
-                if idx_proceso_entrante < len(procesos_para_simular):
-                    tiempo_actual = procesos_para_simular[idx_proceso_entrante]['llegada']
-                else: # No hay más procesos por llegar y la cola está vacía
-                    break
-                continue # Re-evaluar llegadas con el nuevo tiempo_actual
-
-            proceso_actual_ref = cola_listos.pop(0)
-            tiempo_inicio_segmento = tiempo_actual
-
-            tiempo_ejecucion_este_quantum = min(proceso_actual_ref['restante'], quantum)
-            proceso_actual_ref['restante'] -= tiempo_ejecucion_este_quantum
-            tiempo_actual += tiempo_ejecucion_este_quantum
-            tiempo_fin_segmento = tiempo_actual
+            return ResultadoSimulacion(TablaProcesos([], [], [])) if columnar else []
 
-            results_list_of_segments.append({
-                'proceso': proceso_actual_ref['nombre'],
-                'llegada': proceso_actual_ref['llegada'],
-                'cpu_original': proceso_actual_ref['duracion_original_calc'], # Ráfaga total original
-                'comienzo': tiempo_inicio_segmento,
-                'final': tiempo_fin_segmento,
-                'espera_final': "Calc...", # Se actualizará después
-                'turnaround_final': "Calc..." # Se actualizará después
-            })
+        with fase("rr.preparar_tabla"):
+            tabla = TablaProcesos.preparar(procesos_iniciales, origen="RRController") # Lista de dicts o TablaProcesos
+        with fase("rr.planificacion"):
+            resultado = ModeloRR(tabla, quantum, fusionar_segmentos).simular()
+        if columnar:
+            return resultado
+        with fase("rr.segmentos_dict"):
+            return resultado.a_dicts()
 
-            # Volver a añadir procesos que pudieron haber llegado MIENTRAS este se ejecutaba
-            # Esto es importante para que no se "salten" llegadas y se coloquen correctamente en la cola.
-            nuevos_llegados_durante_ejecucion = []
-            while idx_proceso_entrante < len(procesos_para_simular) and \
-                  procesos_para_simular[idx_proceso_entrante]['llegada'] <= tiempo_actual:
-                proceso_nuevo_llegado = procesos_para_simular[idx_proceso_entrante]
-                if proceso_nuevo_llegado not in cola_listos and proceso_nuevo_llegado['restante'] > 0:
-                    nuevos_llegados_durante_ejecucion.append(proceso_nuevo_llegado)
-                idx_proceso_entrante += 1
-            
-            # Añadir el proceso actual de nuevo a la cola si aún tiene restante
-            if proceso_actual_ref['restante'] > 0:
-                cola_listos.append(proceso_actual_ref)
-            else: # Proceso terminado
-                proceso_actual_ref['tiempo_finalizacion_calc'] = tiempo_actual
-                turnaround_final = proceso_actual_ref['tiempo_finalizacion_calc'] - proceso_actual_ref['llegada']
-                espera_final = turnaround_final - proceso_actual_ref['duracion_original_calc']
-
-                stats_finales_procesos[proceso_actual_ref['nombre']]['espera'] = espera_final
-                stats_finales_procesos[proceso_actual_ref['nombre']]['turnaround'] = turnaround_final
-                procesos_terminados_count += 1
+    @staticmethod
+    def iter_rr(procesos_iniciales, quantum, fusionar_segmentos=False):
+        """
+        Versión incremental de simular_rr: generador que produce un EventoSegmento por
+        cada segmento en cuanto se decide y un EventoFin (con espera y turnaround) cuando
+        un proceso termina. No acumula los segmentos, así que sirve para escribirlos a
+        disco o a una vista en vivo con memoria acotada por la cola de listos.
+        Acepta lo mismo que simular_rr (lista de diccionarios o TablaProcesos).
+        """
+        if not procesos_iniciales:
+            return
+        tabla = TablaProcesos.preparar(procesos_iniciales, origen="RRController")
+        yield from eventos_con_nombres(tabla, ModeloRR(tabla, quantum, fusionar_segmentos).eventos())
 
-            # Añadir los nuevos llegados (después del proceso actual si no ha terminado)
-            # para mantener el orden RR (los que llegan se añaden al final de la cola)
-            for p_nl in nuevos_llegados_durante_ejecucion:
-                 if p_nl not in cola_listos : # Doble chequeo por si acaso
-                    cola_listos.append(p_nl)
+    @staticmethod
+    def modelo_rr(procesos_iniciales, quantum, fusionar_segmentos=False):
+        """
+        Devuelve el ModeloRR listo para simular (sin ejecutarlo), para quien necesite
+        recorrer sus eventos() por índice, como la simulación en segundo plano de la GUI.
+        """
+        return ModeloRR(TablaProcesos.preparar(procesos_iniciales, origen="RRController"), quantum, fusionar_segmentos)
 
+    @staticmethod
+    def barrido_quantum(procesos_iniciales, quantums, max_trabajadores=None):
+        """
+        Simula la misma carga con cada quantum de `quantums` en procesos de trabajo
+        paralelos (ver app.models.barrido_quantum) y devuelve una lista de
+        (quantum, MetricasSimulacion) ordenada por quantum.
+        """
+        if not procesos_iniciales:
+            return []
+        # Import diferido: el barrido carga concurrent.futures y multiprocessing
+        from app.models.barrido_quantum import iter_barrido_quantum
+        tabla = TablaProcesos.preparar(procesos_iniciales, origen="RRController")
+        return sorted(iter_barrido_quantum(tabla, quantums, max_trabajadores), key=lambda fila: fila[0])
 
-        # Actualizar 'espera_final' y 'turnaround_final' en todos los segmentos con los valores calculados
-        for segment in results_list_of_segments:
-            nombre_proceso_segmento = segment['proceso']
-            if nombre_proceso_segmento in stats_finales_procesos and stats_finales_procesos[nombre_proceso_segmento]:
-                segment['espera_final'] = stats_finales_procesos[nombre_proceso_segmento].get('espera', 'Error E')
-                segment['turnaround_final'] = stats_finales_procesos[nombre_proceso_segmento].get('turnaround', 'Error T')
-            else: # Si un proceso no terminó (no debería pasar si la lógica es correcta)
-                # O si el proceso terminó pero no se encontró en stats_finales_procesos
-                proceso_obj = next((p for p in procesos_para_simular if p['nombre'] == nombre_proceso_segmento), None)
-                if proceso_obj and proceso_obj['restante'] <= 0: # Si terminó
-                    segment['espera_final'] = proceso_obj.get('tiempo_espera_final_calc', 'No Term. (obj)')
-                    segment['turnaround_final'] = proceso_obj.get('turnaround_final_calc', 'No Term. (obj)')
-                else:
-                    segment['espera_final'] = "No Term."
-                    segment['turnaround_final'] = "No Term."
-        
-        return results_list_of_segments
+    @staticmethod
+    def simular_rr_lote(llegadas, rafagas, quantum):
+        """
+        Simula muchas cargas independientes a la vez con el motor vectorizado (ver
+        app.models.motor_vectorizado): `llegadas` y `rafagas` son matrices (cargas, procesos).
+        Devuelve una MetricasLote con las métricas de cada carga.
+        """
+        from app.models.motor_vectorizado import simular_rr_lote # Import diferido: carga numpy
+        return simular_rr_lote(llegadas, rafagas, quantum)
     
 
 class MockRRController:
     @staticmethod
-    def simular_rr(procesos_iniciales, quantum):
+    def simular_rr(procesos_iniciales, quantum, columnar=False, solo_metricas=False, fusionar_segmentos=False):
         # Reutiliza la lógica de RRController o una versión simplificada si es necesario
         # Para este ejemplo, simplemente llamaremos al RRController real.
         # Si RRController no estuviera listo, aquí iría una simulación mock.
         print("ADVERTENCIA: Usando MockRRController que llama a RRController. Asegúrate que RRController esté implementado.")
-        return RRController.simular_rr(procesos_iniciales, quantum)
\ No newline at end of file
+        return RRController.simular_rr(procesos_iniciales, quantum, columnar, solo_metricas, fusionar_segmentos)
+
+    @staticmethod
+    def modelo_rr(procesos_iniciales, quantum, fusionar_segmentos=False):
+        print("ADVERTENCIA: Usando MockRRController que llama a RRController. Asegúrate que RRController esté implementado.")
+        return RRController.modelo_rr(procesos_iniciales, quantum, fusionar_segmentos)
@@ -0,0 +1,147 @@
+import multiprocessing
+import queue
+import threading
+import traceback
+
+import customtkinter as ctk
+
+from app.config import (
+    COLOR_ROJO, COLOR_AMARILLO, COLOR_ROJO_OSCURO, COLOR_AMARILLO_OSCURO,
+    COLOR_FONDO_SECUNDARIO, COLOR_FONDO_GANTT
+)
+from app.gui.tabla_virtual import TablaVirtual
+from app.models.barrido_quantum import interpretar_quantums, iter_barrido_quantum
+
+
+class VentanaBarridoQuantum(ctk.CTkToplevel):
+    """
+    Ventana de barrido de quantum para Round Robin: simula la carga de RRView con un
+    rango de quantums en procesos paralelos (ver app.models.barrido_quantum) y muestra
+    una tabla y un gráfico con las métricas promedio por quantum.
+
+    El barrido lo consume un hilo que pasa cada resultado por una cola; la ventana la
+    vacía con after(), así que la tabla se completa a medida que terminan los quantums
+    sin bloquear la interfaz.
+    """
+    INTERVALO_MS = 100
+    ENCABEZADOS = ["Quantum", "Espera Prom.", "Turnaround Prom.", "Respuesta Prom.", "Cambios de Contexto"]
+
+    def __init__(self, master, tabla_procesos, quantums_iniciales="1:16"):
+        super().__init__(master)
+        self.title("Barrido de Quantum - Round Robin")
+        self.geometry("980x760")
+        self.configure(fg_color=COLOR_FONDO_SECUNDARIO)
+        self.tabla_procesos = tabla_procesos
+        self.filas = [] # (quantum, MetricasSimulacion), ordenadas por quantum
+        self.total_quantums = 0
+        self._cola = queue.Queue()
+        self._cancelar = threading.Event()
+        self._drenado = None
+        self.canvas_grafico = None
+
+        controles = ctk.CTkFrame(self, fg_color="transparent")
+        controles.pack(fill="x", padx=10, pady=(10, 0))
+        ctk.CTkLabel(controles, text="Quantums (inicio:fin[:paso] o lista):", text_color=COLOR_AMARILLO,
+                     font=("Arial", 13)).pack(side="left")
+        self.entrada_quantums = ctk.CTkEntry(controles, width=160, justify="center")
+        self.entrada_quantums.insert(0, quantums_iniciales)
+        self.entrada_quantums.pack(side="left", padx=10)
+        self.boton_iniciar = ctk.CTkButton(controles, text="Iniciar Barrido", command=self._iniciar, width=130,
+                                           fg_color="transparent", border_width=2, border_color=COLOR_ROJO,
+                                           text_color=COLOR_AMARILLO, hover_color=COLOR_ROJO_OSCURO)
+        self.boton_iniciar.pack(side="left")
+        self.etiqueta_estado = ctk.CTkLabel(controles, text=f"{len(tabla_procesos)} procesos", text_color=COLOR_AMARILLO_OSCURO,
+                                            font=("Arial", 12))
+        self.etiqueta_estado.pack(side="left", padx=10)
+
+        self.tabla = TablaVirtual(self, self.ENCABEZADOS, [], formatear_celda=self._formatear_celda, ordenado=True,
+                                  filas_visibles=8, color_encabezado=COLOR_ROJO, color_texto=COLOR_AMARILLO)
+        self.tabla.pack(fill="x", padx=10, pady=10)
+        self.marco_grafico = ctk.CTkFrame(self, fg_color=COLOR_FONDO_GANTT, corner_radius=10)
+        self.marco_grafico.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self.after(100, self.lift) # CTkToplevel puede quedar detrás de la ventana principal
+
+    @staticmethod
+    def _formatear_celda(columna, valor):
+        return f"{valor:.2f}" if isinstance(valor, float) and columna else str(valor)
+
+    def _iniciar(self):
+        try:
+            quantums = interpretar_quantums(self.entrada_quantums.get())
+        except ValueError as e:
+            print(f"Error: {e}")
+            self.etiqueta_estado.configure(text=str(e))
+            return
+        self.boton_iniciar.configure(state="disabled")
+        self.filas = []
+        self._cancelar.clear()
+        self.total_quantums = len(quantums)
+        self.etiqueta_estado.configure(text=f"Simulando 0 de {len(quantums)} quantums...")
+        threading.Thread(target=self._trabajar, args=(quantums,), name="barrido-quantum", daemon=True).start()
+        self._drenado = self.after(self.INTERVALO_MS, self._drenar)
+
+    def _trabajar(self, quantums):
+        try:
+            # spawn: no bifurcar (fork) un proceso que tiene Tk y otros hilos en marcha
+            barrido = iter_barrido_quantum(self.tabla_procesos, quantums, contexto=multiprocessing.get_context("spawn"))
+            for fila in barrido:
+                if self._cancelar.is_set():
+                    barrido.close() # Cancela los quantums pendientes
+                    return
+                self._cola.put(("fila", fila))
+            self._cola.put(("fin", None))
+        except Exception as e:
+            print(f"ERROR (VentanaBarridoQuantum): El barrido falló: {e}")
+            traceback.print_exc()
+            self._cola.put(("error", e))
+
+    def _drenar(self):
+        self._drenado = None
+        fin = None
+        nuevas = False
+        try:
+            while fin is None:
+                tipo, datos = self._cola.get_nowait()
+                if tipo == "fila":
+                    self.filas.append(datos)
+                    nuevas = True
+                else:
+                    fin = (tipo, datos)
+        except queue.Empty:
+            pass
+        if nuevas:
+            self.filas.sort(key=lambda fila: fila[0])
+            self.tabla.actualizar_filas([(q, m.espera_promedio, m.turnaround_promedio, m.respuesta_promedio, m.cambios_contexto)
+                                         for q, m in self.filas], ordenado=True)
+            self.etiqueta_estado.configure(text=f"Simulando {len(self.filas)} de {self.total_quantums} quantums...")
+        if fin is None:
+            self._drenado = self.after(self.INTERVALO_MS, self._drenar)
+            return
+        self.boton_iniciar.configure(state="normal")
+        if fin[0] == "error":
+            self.etiqueta_estado.configure(text=f"Error en el barrido: {fin[1]}")
+            return
+        self.etiqueta_estado.configure(text=f"Barrido completo: {len(self.filas)} quantums")
+        self._mostrar_grafico()
+
+    def _mostrar_grafico(self):
+        from app.gui.views import cargar_backend_graficos # Import diferido: views importa esta ventana
+        from app.utils.visualizer import dibujar_barrido_quantum
+        Figure, FigureCanvasTkAgg, _NavigationToolbar2Tk = cargar_backend_graficos()
+        if self.canvas_grafico: self.canvas_grafico.get_tk_widget().destroy()
+        fig = Figure(figsize=(10, 5))
+        dibujar_barrido_quantum(fig, self.filas, color_ejes=COLOR_AMARILLO, color_fondo=COLOR_FONDO_GANTT)
+        self.canvas_grafico = FigureCanvasTkAgg(fig, master=self.marco_grafico)
+        self.canvas_grafico.draw()
+        self.canvas_grafico.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+
+    def destroy(self):
+        self._cancelar.set()
+        if self._drenado is not None:
+            self.after_cancel(self._drenado)
+            self._drenado = None
+        if self.canvas_grafico:
+            self.canvas_grafico.get_tk_widget().destroy()
+            self.canvas_grafico = None
+        super().destroy()
@@ -0,0 +1,144 @@
+import customtkinter as ctk
+from PIL import Image
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CacheImagenes:
+    """
+    Caché LRU de imágenes ya decodificadas y escaladas, compartida por todas las vistas.
+
+    La clave es (ruta, (ancho, alto)). Para cada clave se guarda la imagen PIL escalada y
+    el CTkImage construido con ella; reutilizar el mismo CTkImage también reutiliza los
+    PhotoImage que CustomTkinter cachea internamente, así que volver a una vista ya vista
+    no decodifica ni escala nada.
+
+    La decodificación y el escalado pueden adelantarse en un hilo de trabajo con
+    precargar(); los CTkImage se crean siempre en el hilo de Tk, en obtener_ctk(). Con
+    un callback, obtener_ctk() no escala en el hilo de Tk: lo hace en el hilo de trabajo
+    y entrega la imagen con after() cuando está lista.
+    """
+    INTERVALO_MS = 30 # Cada cuánto revisa el hilo de Tk si terminó un escalado pendiente
+
+    def __init__(self, capacidad=8):
+        self.capacidad = capacidad
+        self._imagenes_pil = OrderedDict()
+        self._imagenes_ctk = OrderedDict()
+        self._pendientes = {}
+        self._pedidas = weakref.WeakKeyDictionary() # widget -> última clave pedida (solo hilo de Tk)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-imagenes")
+
+    @staticmethod
+    def _decodificar(ruta, tamano):
+        imagen = Image.open(ruta)
+        # Para JPEG, draft() permite que el decodificador reduzca la escala al leer,
+        # mucho más barato que decodificar a tamaño completo y luego escalar.
+        imagen.draft("RGB", tamano)
+        imagen = imagen.convert("RGBA" if "A" in imagen.getbands() else "RGB")
+        if imagen.size != tamano:
+            imagen = imagen.resize(tamano, Image.LANCZOS)
+        return imagen
+
+    def precargar(self, ruta, tamano):
+        """Decodifica y escala la imagen en segundo plano (sin tocar Tk). Devuelve un Future."""
+        clave = (ruta, tuple(tamano))
+        with self._lock:
+            if clave in self._pendientes:
+                return self._pendientes[clave]
+            futuro = self._executor.submit(self._obtener_pil, ruta, clave[1])
+            self._pendientes[clave] = futuro
+        futuro.add_done_callback(lambda _f: self._quitar_pendiente(clave))
+        return futuro
+
+    def _quitar_pendiente(self, clave):
+        with self._lock:
+            self._pendientes.pop(clave, None)
+
+    def _obtener_pil(self, ruta, tamano):
+        clave = (ruta, tamano)
+        with self._lock:
+            if clave in self._imagenes_pil:
+                self._imagenes_pil.move_to_end(clave)
+                return self._imagenes_pil[clave]
+        imagen = self._decodificar(ruta, tamano) # Fuera del lock: es la parte lenta
+        with self._lock:
+            self._imagenes_pil[clave] = imagen
+            self._imagenes_pil.move_to_end(clave)
+            self._desalojar(self._imagenes_pil)
+        return imagen
+
+    def _desalojar(self, cache):
+        while len(cache) > self.capacidad:
+            cache.popitem(last=False)
+
+    def obtener_ctk(self, ruta, tamano, widget=None, al_cargar=None):
+        """
+        Devuelve un CTkImage de la imagen escalada a `tamano`. Debe llamarse desde el hilo de Tk.
+
+        Sin `al_cargar` la imagen se escala en el momento si no está en caché (para iconos
+        pequeños); si hay una precarga en curso para la misma clave, espera su resultado.
+        Lanza la excepción de PIL si el archivo no se puede abrir.
+
+        Con `widget` y `al_cargar`, si la imagen de ese tamaño aún no está escalada se
+        devuelve enseguida la de la misma ruta con el tamaño más parecido ya en caché (o
+        None), el escalado se hace en el hilo de trabajo y al terminar se llama a
+        al_cargar(imagen_ctk) en el hilo de Tk, salvo que `widget` ya no exista o haya
+        pedido otra imagen después.
+        """
+        clave = (ruta, tuple(tamano))
+        if widget is not None:
+            self._pedidas[widget] = clave # Una entrega anterior pendiente ya no se aplica
+        with self._lock:
+            if clave in self._imagenes_ctk:
+                self._imagenes_ctk.move_to_end(clave)
+                return self._imagenes_ctk[clave]
+            imagen = self._imagenes_pil.get(clave)
+            futuro = self._pendientes.get(clave)
+        if imagen is not None:
+            return self._crear_ctk(clave, imagen)
+        if al_cargar is None:
+            imagen = futuro.result() if futuro is not None else self._obtener_pil(ruta, clave[1])
+            return self._crear_ctk(clave, imagen)
+        self._entregar(widget, self.precargar(ruta, clave[1]), clave, al_cargar)
+        return self._mas_parecida(clave)
+
+    def _crear_ctk(self, clave, imagen):
+        imagen_ctk = ctk.CTkImage(light_image=imagen, dark_image=imagen, size=clave[1])
+        with self._lock:
+            self._imagenes_ctk[clave] = imagen_ctk
+            self._desalojar(self._imagenes_ctk)
+        return imagen_ctk
+
+    def _mas_parecida(self, clave):
+        ruta, (ancho, alto) = clave
+        with self._lock:
+            candidatas = [(abs(w - ancho) + abs(h - alto), imagen_ctk)
+                          for (r, (w, h)), imagen_ctk in self._imagenes_ctk.items() if r == ruta]
+        return min(candidatas, key=lambda c: c[0])[1] if candidatas else None
+
+    def _entregar(self, widget, futuro, clave, al_cargar):
+        # El sondeo se programa en la ventana principal: los after() de un widget
+        # destruido dejan de existir con él
+        ventana = widget.winfo_toplevel()
+
+        def revisar():
+            if not futuro.done():
+                ventana.after(self.INTERVALO_MS, revisar)
+                return
+            if not widget.winfo_exists() or self._pedidas.get(widget) != clave:
+                return
+            try:
+                imagen = futuro.result()
+            except Exception as e:
+                print(f"ERROR (CacheImagenes): No se pudo escalar '{clave[0]}' a {clave[1]}: {e}")
+                return
+            al_cargar(self._crear_ctk(clave, imagen))
+
+        ventana.after(self.INTERVALO_MS, revisar)
+
+
+# Instancia compartida por todas las vistas
+cache_imagenes = CacheImagenes()
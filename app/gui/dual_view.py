@@ -0,0 +1,211 @@
+import multiprocessing
+import queue
+import threading
+import traceback
+
+import customtkinter as ctk
+
+from app.config import (
+    COLOR_ROJO, COLOR_VERDE, COLOR_AMARILLO, COLOR_AMARILLO_OSCURO,
+    COLOR_FONDO_PRINCIPAL, COLOR_FONDO_SECUNDARIO
+)
+from app.controllers.comparacion_controller import ComparacionController, ConfiguracionLote, METRICAS_LOTE
+from app.gui.tabla_virtual import TablaVirtual
+from app.models.generador_cargas import interpretar_distribucion
+
+
+NOMBRES_METRICAS = {
+    'espera_promedio': "Espera promedio",
+    'turnaround_promedio': "Turnaround promedio",
+    'respuesta_promedio': "Respuesta promedio",
+    'cambios_contexto': "Cambios de contexto",
+}
+
+
+class DualView(ctk.CTkFrame):
+    """
+    Vista RR vs SRTF: compara ambos algoritmos sobre muchas cargas aleatorias
+    (ComparacionController) y muestra, por métrica, la media con su intervalo de
+    confianza para RR, para SRTF y para la diferencia RR - SRTF en la misma carga.
+
+    El lote corre en procesos de trabajo; un hilo consume sus resultados parciales y
+    los pasa por una cola que la vista vacía con after(), así que la tabla se actualiza
+    mientras avanza y el lote se puede cancelar.
+    """
+    INTERVALO_MS = 100
+    CONFIANZA = 0.95
+    ENCABEZADOS = ["Métrica", "RR", "SRTF", "Diferencia (RR - SRTF)"]
+
+    def __init__(self, master, volver_callback_menu_principal):
+        super().__init__(master, fg_color=COLOR_FONDO_PRINCIPAL)
+        self.master_window = master
+        self.volver_callback_menu_principal = volver_callback_menu_principal
+        self.entradas = {}
+        self._cola = queue.Queue()
+        self._cancelar = threading.Event()
+        self._drenado = None
+        self.configuracion = None
+
+        contenido = ctk.CTkFrame(self, fg_color="transparent")
+        contenido.pack(fill="both", expand=True, padx=20, pady=20)
+        try:
+            ctk.CTkLabel(contenido, text="RR vs SRTF", font=("Star Jedi", 32), text_color=COLOR_AMARILLO).pack(pady=(10, 20))
+        except Exception:
+            ctk.CTkLabel(contenido, text="RR vs SRTF", font=("Arial", 28, "bold"), text_color=COLOR_AMARILLO).pack(pady=(10, 20))
+        ctk.CTkButton(contenido, text=" Volver al Menú", command=self.volver_callback_menu_principal, fg_color="transparent",
+                      border_color=COLOR_AMARILLO, border_width=2, text_color=COLOR_AMARILLO,
+                      hover_color=COLOR_AMARILLO_OSCURO).place(x=10, y=10)
+
+        self._crear_formulario(contenido)
+
+        progreso = ctk.CTkFrame(contenido, fg_color="transparent")
+        progreso.pack(fill="x", padx=10, pady=5)
+        self.barra_progreso = ctk.CTkProgressBar(progreso, progress_color=COLOR_AMARILLO)
+        self.barra_progreso.set(0)
+        self.barra_progreso.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        self.etiqueta_estado = ctk.CTkLabel(progreso, text="", text_color=COLOR_AMARILLO, font=("Arial", 12), width=280)
+        self.etiqueta_estado.pack(side="left")
+
+        self.tabla = TablaVirtual(contenido, self.ENCABEZADOS, [], ordenado=True, filas_visibles=len(METRICAS_LOTE),
+                                  color_encabezado=COLOR_AMARILLO, color_texto=COLOR_AMARILLO)
+        self.tabla.pack(fill="x", padx=10, pady=10)
+        ctk.CTkLabel(contenido, text=f"Media ± margen del intervalo de confianza al {self.CONFIANZA:.0%}. "
+                                     "La diferencia se mide en cada carga (comparación pareada).",
+                     text_color=COLOR_AMARILLO_OSCURO, font=("Arial", 11)).pack(padx=10, anchor="w")
+
+        self.pack(fill="both", expand=True)
+
+    def _crear_formulario(self, parent):
+        formulario = ctk.CTkFrame(parent, fg_color=COLOR_FONDO_SECUNDARIO, corner_radius=10)
+        formulario.pack(pady=10, padx=10)
+        campos = (
+            ("cargas", "Cargas", "1000"),
+            ("procesos", "Procesos por carga", "50"),
+            ("quantum", "Quantum RR", "2"),
+            ("llegadas", "Entre llegadas", "poisson:0.5"),
+            ("rafagas", "Ráfagas", "exponencial:4"),
+            ("semilla", "Semilla (opcional)", ""),
+        )
+        for posicion, (clave, texto, valor) in enumerate(campos):
+            fila, columna = divmod(posicion, 3)
+            ctk.CTkLabel(formulario, text=texto, text_color=COLOR_AMARILLO, font=("Arial", 13)).grid(
+                row=fila * 2, column=columna, padx=12, pady=(8, 0), sticky="w")
+            entrada = ctk.CTkEntry(formulario, width=170, justify="center")
+            entrada.insert(0, valor)
+            entrada.grid(row=fila * 2 + 1, column=columna, padx=12, pady=(0, 8))
+            self.entradas[clave] = entrada
+        ctk.CTkLabel(formulario, text="Distribuciones: exponencial:media, poisson:tasa, bimodal:corta,larga,p, "
+                                      "pareto:alfa,minimo, uniforme:min,max, fija:valor",
+                     text_color=COLOR_AMARILLO_OSCURO, font=("Arial", 11)).grid(row=4, column=0, columnspan=3, padx=12, sticky="w")
+
+        botones = ctk.CTkFrame(formulario, fg_color="transparent")
+        botones.grid(row=5, column=0, columnspan=3, pady=10)
+        self.boton_ejecutar = ctk.CTkButton(botones, text="Ejecutar Comparación", command=self._ejecutar,
+                                            fg_color="transparent", border_width=2, border_color=COLOR_ROJO,
+                                            text_color=COLOR_VERDE, hover_color=COLOR_AMARILLO_OSCURO)
+        self.boton_ejecutar.pack(side="left", padx=10)
+        self.boton_cancelar = ctk.CTkButton(botones, text="Cancelar", command=self._cancelar_lote, state="disabled",
+                                            fg_color="transparent", border_width=2, border_color=COLOR_VERDE,
+                                            text_color=COLOR_ROJO, hover_color=COLOR_AMARILLO_OSCURO)
+        self.boton_cancelar.pack(side="left", padx=10)
+
+    def _leer_configuracion(self):
+        """Devuelve la ConfiguracionLote del formulario o None (con el error en consola y en la vista)."""
+        valores = {clave: entrada.get().strip() for clave, entrada in self.entradas.items()}
+        try:
+            cargas, procesos = int(valores["cargas"]), int(valores["procesos"])
+            quantum = float(valores["quantum"])
+            if quantum == int(quantum):
+                quantum = int(quantum)
+            semilla = int(valores["semilla"]) if valores["semilla"] else None
+            if cargas < 1 or procesos < 1 or quantum <= 0:
+                raise ValueError("Cargas y procesos deben ser al menos 1 y el quantum mayor que 0.")
+            llegadas = interpretar_distribucion(valores["llegadas"])
+            rafagas = interpretar_distribucion(valores["rafagas"])
+        except ValueError as e:
+            print(f"Error (DualView): {e}")
+            self.etiqueta_estado.configure(text=f"Datos no válidos: {e}")
+            return None
+        return ConfiguracionLote(cargas, procesos, llegadas, rafagas, quantum, semilla)
+
+    def _ejecutar(self):
+        configuracion = self._leer_configuracion()
+        if configuracion is None:
+            return
+        self.configuracion = configuracion
+        self._cancelar.clear()
+        self.boton_ejecutar.configure(state="disabled")
+        self.boton_cancelar.configure(state="normal", text="Cancelar")
+        self.barra_progreso.set(0)
+        self.etiqueta_estado.configure(text=f"Simulando 0 de {configuracion.cargas} cargas...")
+        threading.Thread(target=self._trabajar, args=(configuracion,), name="lote-rr-srtf", daemon=True).start()
+        self._drenado = self.after(self.INTERVALO_MS, self._drenar)
+
+    def _cancelar_lote(self):
+        self._cancelar.set()
+        self.boton_cancelar.configure(state="disabled", text="Cancelando...")
+
+    def _trabajar(self, configuracion):
+        try:
+            # spawn: no bifurcar (fork) un proceso que tiene Tk y otros hilos en marcha
+            lote = ComparacionController.iter_lote(configuracion, contexto=multiprocessing.get_context("spawn"))
+            for completadas, resumen in lote:
+                # Copia de las filas ya formateadas: el resumen sigue cambiando en este hilo
+                self._cola.put(("avance", (completadas, self._filas_resumen(resumen))))
+                if self._cancelar.is_set():
+                    lote.close() # Cancela las tareas pendientes
+                    self._cola.put(("cancelado", None))
+                    return
+            self._cola.put(("fin", None))
+        except Exception as e:
+            print(f"ERROR (DualView): El lote falló: {e}")
+            traceback.print_exc()
+            self._cola.put(("error", e))
+
+    def _filas_resumen(self, resumen):
+        filas = []
+        for metrica in METRICAS_LOTE:
+            celdas = [NOMBRES_METRICAS[metrica]]
+            for serie in ("rr", "srtf", "diferencia"):
+                intervalo = resumen[metrica, serie].intervalo(self.CONFIANZA)
+                celdas.append(f"{intervalo.media:.3f} ± {intervalo.margen:.3f}")
+            filas.append(tuple(celdas))
+        return filas
+
+    def _drenar(self):
+        self._drenado = None
+        ultimo_avance = None
+        fin = None
+        try:
+            while fin is None:
+                tipo, datos = self._cola.get_nowait()
+                if tipo == "avance":
+                    ultimo_avance = datos # Solo importa el más reciente
+                else:
+                    fin = (tipo, datos)
+        except queue.Empty:
+            pass
+        total = self.configuracion.cargas
+        if ultimo_avance is not None:
+            completadas, filas = ultimo_avance
+            self.tabla.actualizar_filas(filas, ordenado=True)
+            self.barra_progreso.set(completadas / total)
+            self.etiqueta_estado.configure(text=f"Simulando {completadas} de {total} cargas...")
+        if fin is None:
+            self._drenado = self.after(self.INTERVALO_MS, self._drenar)
+            return
+        self.boton_ejecutar.configure(state="normal")
+        self.boton_cancelar.configure(state="disabled", text="Cancelar")
+        if fin[0] == "fin":
+            self.etiqueta_estado.configure(text=f"Comparación completa: {total} cargas")
+        elif fin[0] == "cancelado":
+            self.etiqueta_estado.configure(text="Comparación cancelada (resultados parciales)")
+        else:
+            self.etiqueta_estado.configure(text=f"Error en la comparación: {fin[1]}")
+
+    def destroy(self):
+        self._cancelar.set()
+        if self._drenado is not None:
+            self.after_cancel(self._drenado)
+            self._drenado = None
+        super().destroy()
@@ -0,0 +1,267 @@
+import re
+
+import customtkinter as ctk
+
+from app.config import COLOR_FONDO_SECUNDARIO, COLOR_AMARILLO, COLOR_AMARILLO_OSCURO
+from app.utils.helpers import nombre_proceso
+
+
+# Separadores aceptados al pegar: tabulador (hojas de cálculo), coma, punto y coma o espacios
+_SEPARADORES_PEGADO = re.compile(r"\t|;|,|\s+")
+
+
+def _es_numero(texto):
+    try:
+        float(texto)
+        return True
+    except ValueError:
+        return False
+
+
+def _entero(texto):
+    try:
+        return int(texto)
+    except ValueError:
+        return None
+
+
+def interpretar_texto_pegado(texto):
+    """
+    Convierte texto pegado en filas (nombre o None, llegada, ráfaga); los campos se dejan
+    como texto y se validan al calcular. Acepta por línea 3 campos (nombre, llegada, ráfaga),
+    2 (llegada, ráfaga) o 1 (un solo valor, devuelto como (None, valor, None)). Se saltan las
+    líneas vacías y una fila de encabezado sin números.
+    """
+    filas = []
+    for linea in texto.splitlines():
+        campos = [c.strip() for c in _SEPARADORES_PEGADO.split(linea.strip()) if c.strip()]
+        if not campos:
+            continue
+        if not filas and not any(_es_numero(c) for c in campos): # Encabezado
+            continue
+        if len(campos) >= 3:
+            filas.append((campos[0], campos[1], campos[2]))
+        elif len(campos) == 2:
+            filas.append((None, campos[0], campos[1]))
+        else:
+            filas.append((None, campos[0], None))
+    return filas
+
+
+class EditorProcesos(ctk.CTkFrame):
+    """
+    Editor tipo hoja de cálculo para (nombre, llegada, ráfaga) de muchos procesos.
+
+    Los valores viven en tres listas; en pantalla solo hay un conjunto fijo de filas de
+    widgets (etiqueta + dos CTkEntry) que se reutilizan al desplazarse, así que la cantidad
+    de widgets no depende de la cantidad de procesos. Antes de cambiar las filas mostradas
+    se guarda en las listas lo escrito en las entradas visibles.
+
+    Permite pegar desde el portapapeles (Ctrl+V en una celda o el botón "Pegar"): cada
+    línea es una fila y las filas que no caben agregan procesos, hasta `maximo`.
+    """
+    def __init__(self, master, cantidad, maximo, color_nombre=COLOR_AMARILLO, titulo=None, fuente_titulo=None,
+                 filas_visibles=6, **kwargs):
+        kwargs.setdefault("fg_color", COLOR_FONDO_SECUNDARIO)
+        kwargs.setdefault("corner_radius", 10)
+        super().__init__(master, **kwargs)
+        self.maximo = maximo
+        self.nombres = [nombre_proceso(i) for i in range(cantidad)]
+        self.llegadas = [""] * cantidad
+        self.rafagas = [""] * cantidad
+        self.desplazamiento = 0
+
+        if titulo:
+            ctk.CTkLabel(self, text=titulo, font=fuente_titulo, text_color=COLOR_AMARILLO).grid(row=0, column=0, columnspan=4, pady=(8, 0))
+        header_texts = ["Proceso", "Tiempo de Llegada", "Ráfaga de CPU"]
+        for i, h_text in enumerate(header_texts):
+            ctk.CTkLabel(self, text=h_text, font=("Arial", 16, "bold"), text_color=COLOR_AMARILLO).grid(row=1, column=i, padx=15, pady=10, sticky="nsew")
+
+        self.filas_pool = []
+        for fila_pool in range(max(1, min(filas_visibles, cantidad))):
+            etiqueta = ctk.CTkLabel(self, text="", font=("Arial", 14, "bold"), text_color=color_nombre)
+            etiqueta.grid(row=fila_pool + 2, column=0, padx=15, pady=8)
+            entradas = []
+            for col in (1, 2):
+                entrada = ctk.CTkEntry(self, width=120, justify="center", font=("Arial", 14))
+                entrada.grid(row=fila_pool + 2, column=col, padx=15, pady=8)
+                entrada.bind("<<Paste>>", lambda _e, f=fila_pool, c=col: self._pegar(f, c))
+                entrada.bind("<Down>", lambda _e, f=fila_pool, c=col: self._mover_foco(f, c, 1))
+                entrada.bind("<Up>", lambda _e, f=fila_pool, c=col: self._mover_foco(f, c, -1))
+                entrada.bind("<Return>", lambda _e, f=fila_pool, c=col: self._mover_foco(f, c, 1))
+                entrada.bind("<MouseWheel>", self._rueda)
+                entrada.bind("<Button-4>", self._rueda)
+                entrada.bind("<Button-5>", self._rueda)
+                entradas.append(entrada)
+            etiqueta.bind("<MouseWheel>", self._rueda)
+            etiqueta.bind("<Button-4>", self._rueda)
+            etiqueta.bind("<Button-5>", self._rueda)
+            self.filas_pool.append((etiqueta, entradas[0], entradas[1]))
+
+        self.barra = ctk.CTkScrollbar(self, command=self._comando_barra, button_color=COLOR_AMARILLO_OSCURO)
+        self.barra.grid(row=2, column=3, rowspan=len(self.filas_pool), padx=(0, 6), pady=4, sticky="ns")
+
+        pie = ctk.CTkFrame(self, fg_color="transparent")
+        pie.grid(row=len(self.filas_pool) + 2, column=0, columnspan=4, padx=10, pady=(0, 8), sticky="we")
+        ctk.CTkButton(pie, text="Pegar", width=80, command=self._pegar_desde_boton, fg_color="transparent",
+                      border_width=1, border_color=COLOR_AMARILLO_OSCURO, text_color=COLOR_AMARILLO,
+                      hover_color=COLOR_AMARILLO_OSCURO).pack(side="left")
+        self.etiqueta_estado = ctk.CTkLabel(pie, text="", text_color=COLOR_AMARILLO_OSCURO, font=("Arial", 11))
+        self.etiqueta_estado.pack(side="left", padx=10)
+
+        for col in range(3): self.grid_columnconfigure(col, weight=1)
+        self._refrescar()
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def filas(self):
+        """Devuelve la lista de (nombre, llegada, ráfaga) con los textos ingresados."""
+        self._guardar_visibles()
+        return list(zip(self.nombres, self.llegadas, self.rafagas))
+
+    def leer_procesos(self):
+        """
+        Valida las filas (enteros, llegada >= 0, ráfaga > 0) y devuelve (procesos, error):
+        la lista de diccionarios de proceso y None, o None y el mensaje de la primera fila
+        no válida. En ese caso el editor se desplaza hasta esa fila y pone el foco en la
+        celda, para que se vea entre miles de filas pegadas.
+        """
+        procesos = []
+        for posicion, (nombre, llegada_str, rafaga_str) in enumerate(self.filas()):
+            llegada, rafaga = _entero(llegada_str), _entero(rafaga_str)
+            if llegada is None or llegada < 0:
+                columna, error = 1, f"la llegada debe ser un entero >= 0 (hay '{llegada_str}')"
+            elif rafaga is None or rafaga <= 0:
+                columna, error = 2, f"la ráfaga debe ser un entero > 0 (hay '{rafaga_str}')"
+            else:
+                procesos.append({"nombre": nombre, "llegada": llegada, "duracion_original": rafaga})
+                continue
+            self.mostrar_celda(posicion, columna)
+            return None, f"Fila {posicion + 1} ({nombre}): {error}."
+        return procesos, None
+
+    def mostrar_celda(self, posicion, columna):
+        """Desplaza la vista hasta la fila `posicion` y pone el foco en su `columna` (1 o 2)."""
+        self.desplazar_a(posicion - len(self.filas_pool) // 2) # Centrada, si se puede
+        entrada = self.filas_pool[posicion - self.desplazamiento][columna]
+        entrada.focus_set()
+        entrada.select_range(0, "end")
+
+    # --- Sincronización entre entradas visibles y datos ---
+
+    def _guardar_visibles(self):
+        for fila_pool, (_etiqueta, e_llegada, e_rafaga) in enumerate(self.filas_pool):
+            posicion = self.desplazamiento + fila_pool
+            if posicion < len(self.nombres):
+                self.llegadas[posicion] = e_llegada.get()
+                self.rafagas[posicion] = e_rafaga.get()
+
+    def _refrescar(self):
+        total = len(self.nombres)
+        for fila_pool, (etiqueta, e_llegada, e_rafaga) in enumerate(self.filas_pool):
+            posicion = self.desplazamiento + fila_pool
+            visible = posicion < total
+            etiqueta.configure(text=self.nombres[posicion] if visible else "")
+            for entrada, columna in ((e_llegada, self.llegadas), (e_rafaga, self.rafagas)):
+                entrada.configure(state="normal") # Una entrada deshabilitada no se puede vaciar
+                entrada.delete(0, "end")
+                if visible:
+                    entrada.insert(0, columna[posicion])
+                else:
+                    entrada.configure(state="disabled")
+        filas_pool = len(self.filas_pool)
+        if total:
+            self.barra.set(self.desplazamiento / total, min(1.0, (self.desplazamiento + filas_pool) / total))
+        else:
+            self.barra.set(0.0, 1.0)
+        primera = min(self.desplazamiento + 1, total)
+        self.etiqueta_estado.configure(text=f"{total} procesos (mostrando {primera}-{min(self.desplazamiento + filas_pool, total)})")
+
+    def desplazar_a(self, primera_fila):
+        maximo_desplazamiento = max(0, len(self.nombres) - len(self.filas_pool))
+        primera_fila = max(0, min(int(primera_fila), maximo_desplazamiento))
+        if primera_fila != self.desplazamiento:
+            self._guardar_visibles()
+            self.desplazamiento = primera_fila
+            self._refrescar()
+
+    def _comando_barra(self, accion, *args):
+        if accion == "moveto":
+            self.desplazar_a(round(float(args[0]) * len(self.nombres)))
+        elif accion == "scroll":
+            paso = int(args[0]) * (len(self.filas_pool) if len(args) > 1 and args[1] == "pages" else 1)
+            self.desplazar_a(self.desplazamiento + paso)
+
+    def _rueda(self, evento):
+        if getattr(evento, "num", None) == 4 or getattr(evento, "delta", 0) > 0:
+            self.desplazar_a(self.desplazamiento - 3)
+        else:
+            self.desplazar_a(self.desplazamiento + 3)
+        return "break"
+
+    def _mover_foco(self, fila_pool, columna, paso):
+        """Flechas/Enter: baja o sube de celda, desplazando la vista al llegar al borde."""
+        destino = fila_pool + paso
+        if destino < 0 or destino >= len(self.filas_pool):
+            self.desplazar_a(self.desplazamiento + paso)
+            destino = fila_pool
+        if self.desplazamiento + destino < len(self.nombres):
+            self.filas_pool[destino][columna].focus_set()
+        return "break"
+
+    # --- Pegado masivo ---
+
+    def _pegar_desde_boton(self):
+        # Pega en la celda con el foco; si ninguna celda del editor lo tiene, desde la primera fila
+        foco = self.focus_get()
+        for fila_pool, fila in enumerate(self.filas_pool):
+            for columna in (1, 2):
+                if fila[columna] is foco or getattr(fila[columna], "_entry", None) is foco:
+                    return self._pegar(fila_pool, columna)
+        self._guardar_visibles()
+        self.pegar_texto(self._leer_portapapeles(), 0, 1)
+        return "break"
+
+    def _leer_portapapeles(self):
+        try:
+            return self.clipboard_get()
+        except Exception: # Portapapeles vacío o sin texto
+            return ""
+
+    def _pegar(self, fila_pool, columna):
+        texto = self._leer_portapapeles()
+        if "\n" not in texto.strip() and not _SEPARADORES_PEGADO.search(texto.strip()):
+            return None # Un solo valor: pegado normal de la entrada
+        self._guardar_visibles()
+        self.pegar_texto(texto, self.desplazamiento + fila_pool, columna)
+        return "break"
+
+    def pegar_texto(self, texto, fila_inicial, columna):
+        """
+        Escribe las filas de `texto` desde `fila_inicial`. Un solo valor por línea va a
+        `columna` (1 = llegada, 2 = ráfaga); con más valores se llenan ambas columnas.
+        """
+        filas = interpretar_texto_pegado(texto)
+        if not filas:
+            return 0
+        necesarias = min(fila_inicial + len(filas), self.maximo)
+        for i in range(len(self.nombres), necesarias):
+            self.nombres.append(nombre_proceso(i))
+            self.llegadas.append("")
+            self.rafagas.append("")
+        pegadas = 0
+        for posicion, (nombre, llegada, rafaga) in enumerate(filas, start=fila_inicial):
+            if posicion >= necesarias:
+                break
+            if nombre is not None:
+                self.nombres[posicion] = nombre
+            if rafaga is None: # Un valor: a la columna donde se pegó
+                (self.llegadas if columna == 1 else self.rafagas)[posicion] = llegada
+            else:
+                self.llegadas[posicion], self.rafagas[posicion] = llegada, rafaga
+            pegadas += 1
+        if pegadas < len(filas):
+            print(f"ADVERTENCIA (EditorProcesos): Se pegaron {pegadas} de {len(filas)} filas (máximo {self.maximo} procesos).")
+        self._refrescar()
+        return pegadas
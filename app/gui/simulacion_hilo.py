@@ -0,0 +1,125 @@
+import queue
+import threading
+import traceback
+
+from app.models.resultado import ResultadoSimulacion
+from app.utils.perfilado import fase
+
+
+class SimulacionEnHilo:
+    """
+    Ejecuta la simulación de un modelo (ModeloRR, ModeloSRTF) en un hilo de trabajo para
+    que la ventana siga respondiendo mientras tanto.
+
+    El hilo recorre modelo.eventos() y manda los segmentos por lotes a una cola
+    (queue.Queue, segura entre hilos). El hilo de Tk la vacía cada INTERVALO_MS con
+    after(), agrega los lotes a `resultado` (un ResultadoSimulacion que solo se modifica
+    en el hilo de Tk) y avisa con al_avanzar / al_terminar. Cancelar detiene el hilo al
+    terminar el lote en curso; lo ya simulado queda en `resultado`.
+
+    El progreso es el tiempo de CPU ya ejecutado sobre la suma de las ráfagas.
+    """
+    SEGMENTOS_POR_LOTE = 4096
+    INTERVALO_MS = 50
+
+    def __init__(self, widget, modelo, al_avanzar=None, al_terminar=None):
+        self.widget = widget # Widget de Tk cuyo after() vacía la cola
+        self.modelo = modelo
+        self.resultado = ResultadoSimulacion(modelo.tabla)
+        self.al_avanzar = al_avanzar # f(simulacion) tras agregar segmentos nuevos
+        self.al_terminar = al_terminar # f(simulacion) al terminar, cancelarse o fallar
+        self.estado = "pendiente" # "ejecutando", "terminada", "cancelada" o "error"
+        self.error = None
+        self.cpu_total = 0
+        self.cpu_completada = 0
+        self._cola = queue.Queue()
+        self._cancelar = threading.Event()
+        self._drenado = None
+
+    @property
+    def progreso(self):
+        """Fracción (0 a 1) del tiempo total de CPU ya simulado."""
+        return min(1.0, self.cpu_completada / self.cpu_total) if self.cpu_total else 1.0
+
+    @property
+    def en_curso(self):
+        return self.estado == "ejecutando"
+
+    def iniciar(self):
+        self.cpu_total = sum(self.modelo.tabla.duracion)
+        self.estado = "ejecutando"
+        threading.Thread(target=self._trabajar, name="simulacion", daemon=True).start()
+        self._drenado = self.widget.after(self.INTERVALO_MS, self._drenar)
+
+    def cancelar(self):
+        """Pide al hilo que se detenga; al_terminar se llama cuando lo haga."""
+        self._cancelar.set()
+
+    def detener(self):
+        """Cancela sin volver a avisar (por ejemplo, al destruir la vista que la muestra)."""
+        self._cancelar.set()
+        self.al_avanzar = self.al_terminar = None
+        if self._drenado is not None:
+            try:
+                self.widget.after_cancel(self._drenado)
+            except Exception: # El widget ya pudo haberse destruido
+                pass
+            self._drenado = None
+
+    # --- Hilo de trabajo ---
+
+    def _trabajar(self):
+        cola, cancelar = self._cola, self._cancelar
+        tamano_lote = self.SEGMENTOS_POR_LOTE
+        indices, comienzos, finales = [], [], []
+        cpu_completada = 0
+        try:
+            with fase("hilo.planificacion"): # Incluye el envío de lotes a la cola
+                for idx_proceso, comienzo, final, _terminado in self.modelo.eventos():
+                    indices.append(idx_proceso)
+                    comienzos.append(comienzo)
+                    finales.append(final)
+                    cpu_completada += final - comienzo
+                    if len(indices) >= tamano_lote:
+                        cola.put(("lote", (indices, comienzos, finales, cpu_completada)))
+                        indices, comienzos, finales = [], [], []
+                        if cancelar.is_set():
+                            cola.put(("cancelada", None))
+                            return
+            if indices:
+                cola.put(("lote", (indices, comienzos, finales, cpu_completada)))
+            cola.put(("terminada", None))
+        except Exception as e:
+            print(f"ERROR (SimulacionEnHilo): La simulación falló: {e}")
+            traceback.print_exc()
+            cola.put(("error", e))
+
+    # --- Hilo de Tk ---
+
+    def _drenar(self):
+        self._drenado = None
+        resultado = self.resultado
+        hubo_segmentos = False
+        fin = None
+        try:
+            while fin is None:
+                tipo, datos = self._cola.get_nowait()
+                if tipo == "lote":
+                    indices, comienzos, finales, self.cpu_completada = datos
+                    resultado.indices.extend(indices)
+                    resultado.comienzos.extend(comienzos)
+                    resultado.finales.extend(finales)
+                    hubo_segmentos = True
+                else:
+                    fin = (tipo, datos)
+        except queue.Empty:
+            pass
+
+        if hubo_segmentos and self.al_avanzar is not None:
+            self.al_avanzar(self)
+        if fin is not None:
+            self.estado, self.error = fin
+            if self.al_terminar is not None:
+                self.al_terminar(self)
+            return
+        self._drenado = self.widget.after(self.INTERVALO_MS, self._drenar)
@@ -0,0 +1,198 @@
+import customtkinter as ctk
+
+from app.config import COLOR_FONDO_SECUNDARIO, COLOR_AMARILLO, COLOR_AMARILLO_OSCURO
+
+
+def clave_orden_mixta(valor):
+    """Clave de orden para columnas con números y textos ("No Term.", "-"): primero los números."""
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return (0, valor, "")
+    return (1, 0, str(valor))
+
+
+class TablaVirtual(ctk.CTkFrame):
+    """
+    Tabla de solo lectura que dibuja únicamente las filas visibles.
+
+    Crea una sola vez un conjunto fijo de celdas (filas_visibles x columnas) y, al
+    desplazarse, ordenar o filtrar, solo cambia su texto; el número de widgets de Tk no
+    depende del número de filas. El orden y el filtro se aplican sobre los datos (una
+    lista de índices de fila), no sobre widgets.
+
+    Args:
+        encabezados: Títulos de columna. Pulsar uno ordena por esa columna (otra vez: invierte).
+        filas: Secuencia de tuplas de valores sin formatear, una por fila (puede generarlas al pedirlas).
+        formatear_celda: f(columna, valor) -> str. Por defecto str(valor).
+        claves_orden: Opcional, dict columna -> f(valor) para ordenar; por defecto clave_orden_mixta.
+        al_activar_fila: Opcional, f(fila) llamada con doble clic sobre una fila.
+        columna_orden: Columna por la que se ordena inicialmente.
+        ordenado: Si las filas ya vienen en orden ascendente por columna_orden (evita el
+                  primer ordenamiento, que recorre todas las filas).
+    """
+    def __init__(self, master, encabezados, filas, formatear_celda=None, claves_orden=None,
+                 al_activar_fila=None, columna_orden=0, ordenado=False, filas_visibles=15,
+                 color_encabezado=COLOR_AMARILLO, color_texto=COLOR_AMARILLO, **kwargs):
+        kwargs.setdefault("fg_color", COLOR_FONDO_SECUNDARIO)
+        kwargs.setdefault("corner_radius", 10)
+        super().__init__(master, **kwargs)
+        self.encabezados = list(encabezados)
+        self.filas = filas
+        self.formatear_celda = formatear_celda or (lambda _col, valor: str(valor))
+        self.claves_orden = claves_orden or {}
+        self.al_activar_fila = al_activar_fila
+        self.color_encabezado = color_encabezado
+        self.color_texto = color_texto
+
+        self.orden = list(range(len(filas))) # Índices de fila visibles, ya ordenados y filtrados
+        self.columna_orden = columna_orden
+        self._columna_orden_inicial = columna_orden
+        self.orden_descendente = False
+        self.desplazamiento = 0 # Primera fila de self.orden que ocupa la celda superior
+        self._filtro_pendiente = None
+
+        num_columnas = len(self.encabezados)
+        # Sin textvariable: CTkEntry no muestra el placeholder si se le asigna una
+        self.entrada_filtro = ctk.CTkEntry(self, placeholder_text="Filtrar...", width=220, border_color=color_encabezado)
+        self.entrada_filtro.grid(row=0, column=0, columnspan=2, padx=10, pady=(8, 0), sticky="w")
+        self.entrada_filtro.bind("<KeyRelease>", lambda _e: self._programar_filtro())
+        self.etiqueta_estado = ctk.CTkLabel(self, text="", text_color=COLOR_AMARILLO_OSCURO, font=("Arial", 11))
+        self.etiqueta_estado.grid(row=0, column=2, columnspan=max(1, num_columnas - 2), padx=10, pady=(8, 0), sticky="e")
+
+        self.botones_encabezado = []
+        for col, titulo in enumerate(self.encabezados):
+            boton = ctk.CTkButton(self, text=titulo, text_color=color_encabezado, font=("Arial", 13, "bold"),
+                                  fg_color="transparent", hover_color=COLOR_FONDO_SECUNDARIO, anchor="w",
+                                  command=lambda c=col: self.ordenar_por(c))
+            boton.grid(row=1, column=col, padx=4, pady=8, sticky="we")
+            self.botones_encabezado.append(boton)
+
+        # Conjunto fijo de celdas reutilizadas (crece con actualizar_filas hasta filas_visibles)
+        self.filas_visibles = filas_visibles
+        self.celdas = []
+        self.barra = ctk.CTkScrollbar(self, command=self._comando_barra, button_color=COLOR_AMARILLO_OSCURO)
+        self._ampliar_pool()
+        for col in range(num_columnas):
+            self.grid_columnconfigure(col, weight=1)
+
+        self._aplicar_orden(ordenar=not ordenado)
+
+    def _ampliar_pool(self):
+        necesarias = max(1, min(self.filas_visibles, len(self.filas)))
+        for fila_pool in range(len(self.celdas), necesarias):
+            celdas_fila = []
+            for col in range(len(self.encabezados)):
+                celda = ctk.CTkLabel(self, text="", text_color=self.color_texto, font=("Arial", 12), anchor="w")
+                celda.grid(row=fila_pool + 2, column=col, padx=10, pady=3, sticky="we")
+                celda.bind("<MouseWheel>", self._rueda)
+                celda.bind("<Button-4>", self._rueda)
+                celda.bind("<Button-5>", self._rueda)
+                celda.bind("<Double-Button-1>", lambda _e, f=fila_pool: self._activar(f))
+                celdas_fila.append(celda)
+            self.celdas.append(celdas_fila)
+        self.num_filas_pool = len(self.celdas)
+        self.barra.grid(row=2, column=len(self.encabezados), rowspan=self.num_filas_pool, padx=(0, 6), pady=4, sticky="ns")
+
+    # --- Datos: orden y filtro ---
+
+    def actualizar_filas(self, filas, ordenado=False):
+        """
+        Reemplaza las filas (por ejemplo, por resultados parciales más completos)
+        conservando el orden elegido, el filtro escrito y la posición de desplazamiento.
+        `ordenado` como en el constructor: solo evita ordenar si el orden sigue siendo
+        el inicial (ascendente por la columna con la que se creó la tabla).
+        """
+        self.filas = filas
+        self._ampliar_pool()
+        self.orden = self._indices_filtrados()
+        ordenar = not ordenado or self.orden_descendente or self.columna_orden != self._columna_orden_inicial
+        self._aplicar_orden(ordenar, desplazamiento=self.desplazamiento)
+
+    def _clave_columna(self, columna):
+        clave = self.claves_orden.get(columna, clave_orden_mixta)
+        filas = self.filas
+        return lambda indice: clave(filas[indice][columna])
+
+    def ordenar_por(self, columna):
+        """Ordena por `columna`; si ya se ordenaba por ella, invierte el sentido."""
+        if columna == self.columna_orden:
+            self.orden_descendente = not self.orden_descendente
+        else:
+            self.columna_orden, self.orden_descendente = columna, False
+        self._aplicar_orden()
+
+    def _aplicar_orden(self, ordenar=True, desplazamiento=0):
+        if ordenar:
+            self.orden.sort(key=self._clave_columna(self.columna_orden), reverse=self.orden_descendente)
+        for col, boton in enumerate(self.botones_encabezado):
+            flecha = (" ▼" if self.orden_descendente else " ▲") if col == self.columna_orden else ""
+            boton.configure(text=self.encabezados[col] + flecha)
+        self.desplazamiento = max(0, min(desplazamiento, self._max_desplazamiento()))
+        self._refrescar()
+
+    def _programar_filtro(self):
+        # Esperar a que se deje de escribir para no refiltrar en cada tecla
+        if self._filtro_pendiente is not None:
+            self.after_cancel(self._filtro_pendiente)
+        self._filtro_pendiente = self.after(200, self._aplicar_filtro)
+
+    def _indices_filtrados(self):
+        texto = self.entrada_filtro.get().strip().lower()
+        if not texto:
+            return list(range(len(self.filas)))
+        formatear = self.formatear_celda
+        return [indice for indice, fila in enumerate(self.filas)
+                if any(texto in formatear(col, valor).lower() for col, valor in enumerate(fila))]
+
+    def _aplicar_filtro(self):
+        self._filtro_pendiente = None
+        self.orden = self._indices_filtrados()
+        self._aplicar_orden()
+
+    # --- Vista: desplazamiento y reutilización de celdas ---
+
+    def _max_desplazamiento(self):
+        return max(0, len(self.orden) - self.num_filas_pool)
+
+    def desplazar_a(self, primera_fila):
+        primera_fila = max(0, min(int(primera_fila), self._max_desplazamiento()))
+        if primera_fila != self.desplazamiento:
+            self.desplazamiento = primera_fila
+            self._refrescar()
+
+    def _comando_barra(self, accion, *args):
+        if accion == "moveto":
+            self.desplazar_a(round(float(args[0]) * len(self.orden)))
+        elif accion == "scroll":
+            paso = int(args[0]) * (self.num_filas_pool if len(args) > 1 and args[1] == "pages" else 1)
+            self.desplazar_a(self.desplazamiento + paso)
+
+    def _rueda(self, evento):
+        if getattr(evento, "num", None) == 4 or getattr(evento, "delta", 0) > 0:
+            self.desplazar_a(self.desplazamiento - 3)
+        else:
+            self.desplazar_a(self.desplazamiento + 3)
+        return "break" # No desplazar también el marco que contiene la tabla
+
+    def _refrescar(self):
+        formatear = self.formatear_celda
+        total = len(self.orden)
+        for fila_pool, celdas_fila in enumerate(self.celdas):
+            posicion = self.desplazamiento + fila_pool
+            fila = self.filas[self.orden[posicion]] if posicion < total else None
+            for col, celda in enumerate(celdas_fila):
+                texto = formatear(col, fila[col]) if fila is not None else ""
+                if celda.cget("text") != texto: # configure() redibuja: evitarlo si no cambió
+                    celda.configure(text=texto)
+        if total:
+            self.barra.set(self.desplazamiento / total, min(1.0, (self.desplazamiento + self.num_filas_pool) / total))
+        else:
+            self.barra.set(0.0, 1.0)
+        if total == len(self.filas):
+            self.etiqueta_estado.configure(text=f"{total} filas")
+        else:
+            self.etiqueta_estado.configure(text=f"{total} de {len(self.filas)} filas")
+
+    def _activar(self, fila_pool):
+        posicion = self.desplazamiento + fila_pool
+        if self.al_activar_fila is not None and posicion < len(self.orden):
+            self.al_activar_fila(self.filas[self.orden[posicion]])
@@ -1,13 +1,14 @@
 import customtkinter as ctk
-from PIL import Image # PIL.ImageTk no es necesario si CTkImage maneja la imagen PIL directamente
 import os
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
+import threading
+import time
 import traceback # Para trazas de error más detalladas
+from collections.abc import Sequence
+# matplotlib NO se importa aquí: es lo más lento de cargar y solo hace falta para el
+# Gantt. Ver cargar_backend_graficos() / precargar_backend_graficos().
 
 # Importar constantes y rutas desde config.py
-from config import (
+from app.config import (
     BG_IMAGE_RR_PATH, BG_IMAGE_SRTF_PATH,
     ICON_VOLVER_RR_PATH, ICON_VOLVER_SRTF_PATH,
     COLOR_ROJO, COLOR_AMARILLO, COLOR_ROJO_OSCURO, COLOR_AMARILLO_OSCURO,
@@ -16,17 +17,160 @@ from config import (
     MIN_PROCESOS_RR, MAX_PROCESOS_RR, MIN_PROCESOS_SRTF, MAX_PROCESOS_SRTF
 )
 # Importar controladores (las vistas los usarán)
-from controllers import RRController, SRTFController, MockRRController, MockSRTFController
+from app.gui.cache_imagenes import cache_imagenes
+from app.gui.barrido_view import VentanaBarridoQuantum
+from app.gui.editor_procesos import EditorProcesos
+from app.gui.simulacion_hilo import SimulacionEnHilo
+from app.gui.tabla_virtual import TablaVirtual, clave_orden_mixta
+from app.models.carga import cargar_carga, EXTENSIONES_CARGA
+from app.models.resultado import ResultadoSimulacion
+from app.models.tabla_procesos import TablaProcesos
+from app.utils.perfilado import fase
+from app.utils.visualizer import DiagramaGantt
+from app.controllers import RRController, SRTFController, MockRRController, MockSRTFController
 
 # Variable global para decidir si usar los controladores Mock o los reales
 # Cambia a False para usar los controladores reales (RRController, SRTFController)
 USAR_CONTROLADORES_MOCK = False
 
+# Backend de gráficos cargado bajo demanda: (Figure, FigureCanvasTkAgg, NavigationToolbar2Tk)
+_backend_graficos = None
+_backend_graficos_lock = threading.Lock()
+
+
+def cargar_backend_graficos():
+    """
+    Importa matplotlib la primera vez que se necesita y devuelve
+    (Figure, FigureCanvasTkAgg, NavigationToolbar2Tk).
+    Si la precarga en segundo plano ya lo está importando, espera a que termine.
+    Se usa Figure directamente (no pyplot) para no depender del estado global de pyplot.
+    """
+    global _backend_graficos
+    with _backend_graficos_lock:
+        if _backend_graficos is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+            _backend_graficos = (Figure, FigureCanvasTkAgg, NavigationToolbar2Tk)
+    return _backend_graficos
+
+
+def precargar_backend_graficos():
+    """Calienta el backend de gráficos en un hilo para que el primer Gantt no espere la importación."""
+    def _precargar():
+        try:
+            cargar_backend_graficos()
+        except Exception as e:
+            print(f"ADVERTENCIA (views): No se pudo precargar matplotlib: {e}")
+    threading.Thread(target=_precargar, name="precarga-matplotlib", daemon=True).start()
+
+
+def importar_carga_desde_dialogo(parent):
+    """
+    Pide un archivo de carga (.csv, .jsonl o .npy) y lo lee a una TablaProcesos.
+    Devuelve (tabla, error): (TablaProcesos, None) si se importó, (None, None) si se
+    canceló y (None, mensaje) si el archivo no es válido; la vista muestra el mensaje
+    en su etiqueta de carga, como los errores del editor.
+    """
+    from tkinter import filedialog
+    ruta = filedialog.askopenfilename(parent=parent, title="Importar carga de procesos",
+                                      filetypes=[("Cargas de procesos", " ".join("*" + e for e in EXTENSIONES_CARGA)),
+                                                 ("Todos los archivos", "*.*")])
+    if not ruta:
+        return None, None
+    nombre_archivo = os.path.basename(ruta)
+    try:
+        tabla = cargar_carga(ruta)
+    except (OSError, ValueError) as e:
+        return None, f"No se pudo importar '{nombre_archivo}': {e}"
+    if not len(tabla):
+        return None, f"El archivo '{nombre_archivo}' no contiene procesos."
+    return tabla, None
+
+
+def colocar_fondo(vista, imagen):
+    """
+    Pone `imagen` (CTkImage, o None mientras se escala) como fondo de `vista`, detrás del
+    resto de sus widgets. La usan ResultsView, RRView y SRTFView, también cuando la
+    imagen llega más tarde desde cache_imagenes.
+    """
+    if imagen is None:
+        return
+    vista.background_img_obj = imagen
+    if vista.background_label is None:
+        vista.background_label = ctk.CTkLabel(vista, image=imagen, text="")
+    else:
+        vista.background_label.configure(image=imagen)
+    vista.background_label.place(x=0, y=0, relwidth=1, relheight=1)
+    vista.background_label.lower()
+
+
+class ResumenSegmentos:
+    """
+    Lista de tiempos de segmento de un proceso para la tabla de resultados: guarda solo
+    los primeros valores y el total, y construye la lista completa con `cargar` al pedirla.
+    """
+    __slots__ = ('muestra', 'cantidad', 'cargar')
+    TAMANO_MUESTRA = 4
+
+    def __init__(self, muestra, cantidad, cargar):
+        self.muestra = muestra
+        self.cantidad = cantidad
+        self.cargar = cargar
+
+    @property
+    def primero(self):
+        return self.muestra[0] if self.muestra else ""
+
+    def todos(self):
+        return self.cargar()
+
+    def __str__(self):
+        texto = ", ".join(str(v) for v in self.muestra)
+        if self.cantidad > len(self.muestra):
+            texto += f", … (+{self.cantidad - len(self.muestra)})"
+        return texto
+
+
+class FilasResultado(Sequence):
+    """
+    Filas de la tabla de resultados (una por proceso con segmentos, ordenadas por nombre)
+    generadas al pedirlas a partir de un ResultadoSimulacion, usando su índice por proceso.
+    Así la tabla virtual no necesita construir de antemano una fila por proceso.
+    """
+    def __init__(self, resultado):
+        self.resultado = resultado
+        self.inicios, self.posiciones = resultado.indice_por_proceso()
+        nombres = resultado.tabla.nombres
+        inicios = self.inicios
+        self.procesos = sorted((i for i in range(len(resultado.tabla)) if inicios[i + 1] > inicios[i]),
+                               key=nombres.__getitem__)
+
+    def __len__(self):
+        return len(self.procesos)
+
+    def __getitem__(self, k):
+        resultado, tabla = self.resultado, self.resultado.tabla
+        i = self.procesos[k]
+        inicio, fin = self.inicios[i], self.inicios[i + 1]
+        muestra = self.posiciones[inicio:min(fin, inicio + ResumenSegmentos.TAMANO_MUESTRA)]
+        espera, turnaround = resultado.metricas(i)
+        return (tabla.nombres[i], tabla.llegada[i], tabla.duracion[i],
+                ResumenSegmentos([resultado.comienzos[p] for p in muestra], fin - inicio, lambda: resultado.tiempos_de_proceso(i)[0]),
+                ResumenSegmentos([resultado.finales[p] for p in muestra], fin - inicio, lambda: resultado.tiempos_de_proceso(i)[1]),
+                espera, turnaround)
+
 
 class ResultsView(ctk.CTkFrame):
-    def __init__(self, master, datos_resultado_lista, callback_to_previous_view, bg_image_path_to_use):
+    INTERVALO_REFRESCO_MIN = 0.5 # Segundos mínimos entre redibujados de tabla y Gantt con resultados parciales
+
+    def __init__(self, master, datos_resultado_lista, callback_to_previous_view, bg_image_path_to_use, simulacion=None):
         super().__init__(master, fg_color=COLOR_FONDO_PRINCIPAL)
         self.master_window = master
+        # Con `simulacion` (SimulacionEnHilo sin iniciar) los datos son su resultado, que se
+        # va llenando; la tabla y el Gantt se redibujan a medida que llegan segmentos.
+        self.simulacion = simulacion
+        if simulacion is not None:
+            datos_resultado_lista = simulacion.resultado
         self.datos_resultado_lista = datos_resultado_lista if datos_resultado_lista is not None else []
         self.callback_to_previous_view = callback_to_previous_view
         self.bg_image_path = bg_image_path_to_use # Ruta de fondo específica para esta vista
@@ -34,10 +178,22 @@ class ResultsView(ctk.CTkFrame):
         self.background_img_obj = None
         self.background_label = None
         self.canvas_widget = None # Para el widget del canvas de Matplotlib
+        self.toolbar_gantt = None # Barra de navegación (zoom/desplazamiento) del Gantt
+        self.diagrama_gantt = None
+        self.ax_gantt = None
+        self.sim_type = None
+        self._limites_automaticos = None # (xlim, ylim) puestos por el último dibujo, para respetar el zoom del usuario
+        self.tabla_resultados = None
+        self.barra_progreso = None
+        self.etiqueta_progreso = None
+        self.boton_cancelar = None
+        self._ultimo_refresco = 0.0
+        self._costo_refresco = 0.0
 
         # Asegurar que la ventana maestra tenga dimensiones antes de cargar el fondo
         self.master_window.update_idletasks()
-        self._load_background()
+        with fase("resultados.fondo"):
+            self._load_background()
 
         self.content_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.content_frame.pack(pady=20, padx=20, fill="both", expand=True)
@@ -52,19 +208,28 @@ class ResultsView(ctk.CTkFrame):
 
         self._crear_titulo_resultados(self.content_frame, f"Simulación {sim_type}")
         self._crear_boton_volver(self.content_frame, icon_volver_path, color_principal_sim)
+        if simulacion is not None:
+            self._crear_panel_progreso(self.content_frame, color_principal_sim)
 
         display_area = ctk.CTkScrollableFrame(self.content_frame, fg_color="transparent")
         # Ajustar pady para que el título y el botón no se superpongan
-        display_area.pack(fill="both", expand=True, pady=(60, 10)) # Aumentado pady superior
+        display_area.pack(fill="both", expand=True, pady=(60 if simulacion is None else 10, 10)) # Aumentado pady superior
 
-        self._mostrar_tabla_resultados(display_area, color_principal_sim)
-        self._mostrar_gantt(display_area, sim_type) # Pasar sim_type para el título del Gantt
+        with fase("resultados.tabla"):
+            self._mostrar_tabla_resultados(display_area, color_principal_sim)
+        with fase("resultados.gantt"):
+            self._mostrar_gantt(display_area, sim_type) # Pasar sim_type para el título del Gantt
 
         # Empaquetar el frame principal de la vista y bajar el fondo
         self.pack(fill="both", expand=True)
         if self.background_label:
             self.background_label.lower()
 
+        if simulacion is not None:
+            simulacion.al_avanzar = self._al_avanzar_simulacion
+            simulacion.al_terminar = self._al_terminar_simulacion
+            simulacion.iniciar()
+
     def _get_master_dimensions(self):
         try:
             self.master_window.update_idletasks() # Actualiza dimensiones pendientes
@@ -96,14 +261,11 @@ class ResultsView(ctk.CTkFrame):
             return
 
         try:
-            imagen_pil = Image.open(self.bg_image_path)
-            self.background_img_obj = ctk.CTkImage(light_image=imagen_pil, dark_image=imagen_pil, size=(master_width, master_height))
-            
-            if self.background_label is None:
-                self.background_label = ctk.CTkLabel(self, image=self.background_img_obj, text="")
-            else:
-                self.background_label.configure(image=self.background_img_obj)
-            self.background_label.place(x=0, y=0, relwidth=1, relheight=1)
+            # Imagen ya decodificada y escalada compartida entre vistas (ver cache_imagenes)
+            # Si ese tamaño aún no está escalado llega después, sin bloquear el hilo de Tk
+            imagen = cache_imagenes.obtener_ctk(self.bg_image_path, (master_width, master_height),
+                                                widget=self, al_cargar=lambda img: colocar_fondo(self, img))
+            colocar_fondo(self, imagen)
         except Exception as e:
             print(f"EXCEPCIÓN (ResultsView) al cargar fondo '{self.bg_image_path}': {e}")
             traceback.print_exc()
@@ -126,8 +288,7 @@ class ResultsView(ctk.CTkFrame):
         icono = None
         if os.path.exists(icon_path):
             try:
-                icono_img = Image.open(icon_path)
-                icono = ctk.CTkImage(light_image=icono_img, dark_image=icono_img, size=(20, 20))
+                icono = cache_imagenes.obtener_ctk(icon_path, (20, 20))
             except Exception as e:
                 print(f"ERROR (ResultsView): Excepción al cargar icono volver desde '{icon_path}': {e}")
         else:
@@ -146,20 +307,106 @@ class ResultsView(ctk.CTkFrame):
                           hover_color=COLOR_AMARILLO_OSCURO, font=font_boton
             ).place(x=15, y=15)
 
-    def _mostrar_tabla_resultados(self, parent_frame, color_header):
-        tabla_frame = ctk.CTkFrame(parent_frame, fg_color=COLOR_FONDO_SECUNDARIO, corner_radius=10)
-        tabla_frame.pack(pady=10, padx=10, fill="x")
+    # --- Simulación en curso: progreso, cancelación y resultados parciales ---
+
+    def _crear_panel_progreso(self, parent, color):
+        panel = ctk.CTkFrame(parent, fg_color="transparent")
+        panel.pack(fill="x", padx=10, pady=(5, 0))
+        self.barra_progreso = ctk.CTkProgressBar(panel, progress_color=color)
+        self.barra_progreso.set(0)
+        self.barra_progreso.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        self.etiqueta_progreso = ctk.CTkLabel(panel, text="Simulando... 0%", text_color=COLOR_AMARILLO, font=("Arial", 12), width=260)
+        self.etiqueta_progreso.pack(side="left")
+        self.boton_cancelar = ctk.CTkButton(panel, text="Cancelar", width=100, command=self._cancelar_simulacion,
+                                            fg_color="transparent", border_width=2, border_color=color, text_color=color,
+                                            hover_color=COLOR_AMARILLO_OSCURO)
+        self.boton_cancelar.pack(side="left", padx=(10, 0))
+
+    def _cancelar_simulacion(self):
+        if self.simulacion is not None and self.simulacion.en_curso:
+            self.simulacion.cancelar()
+            self.boton_cancelar.configure(text="Cancelando...", state="disabled")
+
+    def _al_avanzar_simulacion(self, simulacion):
+        progreso = simulacion.progreso
+        self.barra_progreso.set(progreso)
+        self.etiqueta_progreso.configure(text=f"Simulando... {progreso:.0%} ({len(simulacion.resultado)} segmentos)")
+        # Redibujar cuesta más cuantos más segmentos hay: espaciar los refrescos según su costo
+        if time.perf_counter() - self._ultimo_refresco >= max(self.INTERVALO_REFRESCO_MIN, 4 * self._costo_refresco):
+            self._refrescar_resultados()
+
+    def _al_terminar_simulacion(self, simulacion):
+        self._refrescar_resultados()
+        self.boton_cancelar.configure(state="disabled")
+        if simulacion.estado == "terminada":
+            self.barra_progreso.set(1)
+            texto = f"Simulación completa ({len(simulacion.resultado)} segmentos)"
+        elif simulacion.estado == "cancelada":
+            self.boton_cancelar.configure(text="Cancelada")
+            texto = f"Simulación cancelada al {simulacion.progreso:.0%} de la CPU"
+        else:
+            texto = f"Error en la simulación: {simulacion.error}"
+        self.etiqueta_progreso.configure(text=texto)
+
+    def _refrescar_resultados(self):
+        """Vuelve a mostrar tabla y Gantt con los segmentos recibidos hasta ahora."""
+        inicio = time.perf_counter()
+        if self.tabla_resultados is not None:
+            with fase("resultados.refresco_tabla"):
+                self.tabla_resultados.actualizar_filas(FilasResultado(self.datos_resultado_lista), ordenado=True)
+        ax = self.ax_gantt
+        if ax is not None:
+            with fase("resultados.refresco_gantt"):
+                # Si el usuario hizo zoom o se desplazó, se conserva su vista en lugar de la automática
+                limites = (ax.get_xlim(), ax.get_ylim())
+                vista_usuario = limites != self._limites_automaticos
+                ax.clear() # También quita los callbacks de límites del diagrama anterior
+                self._dibujar_gantt(ax, *self._diagrama_para_datos())
+                if vista_usuario:
+                    ax.set_xlim(*limites[0])
+                    ax.set_ylim(*limites[1])
+                self.diagrama_gantt.actualizar_vista(forzar=True)
+                self.canvas_widget.draw_idle()
+        self._ultimo_refresco = time.perf_counter()
+        self._costo_refresco = self._ultimo_refresco - inicio
 
+    def _mostrar_tabla_resultados(self, parent_frame, color_header):
         headers = ["Proceso", "Llegada", "CPU Total", "Comienzos Seg.", "Fines Seg.", "Espera Total", "Turnaround Total"]
-        for i, h in enumerate(headers):
-            ctk.CTkLabel(tabla_frame, text=h, text_color=color_header, font=("Arial", 13, "bold")).grid(row=0, column=i, padx=10, pady=8, sticky="w")
 
-        if not self.datos_resultado_lista:
+        if not self.datos_resultado_lista and self.simulacion is None:
+            tabla_frame = ctk.CTkFrame(parent_frame, fg_color=COLOR_FONDO_SECUNDARIO, corner_radius=10)
+            tabla_frame.pack(pady=10, padx=10, fill="x")
+            for i, h in enumerate(headers):
+                ctk.CTkLabel(tabla_frame, text=h, text_color=color_header, font=("Arial", 13, "bold")).grid(row=0, column=i, padx=10, pady=8, sticky="w")
             ctk.CTkLabel(tabla_frame, text="No hay datos de simulación para mostrar.", text_color=COLOR_AMARILLO).grid(row=1, column=0, columnspan=len(headers), pady=10)
             return
 
+        # Tabla virtual: solo existen las celdas de las filas visibles; las listas de
+        # segmentos se resumen y se ven completas con doble clic sobre la fila.
+        claves_segmentos = lambda resumen: clave_orden_mixta(resumen.primero)
+        filas = self._consolidar_procesos()
+        tabla = TablaVirtual(parent_frame, headers, filas, ordenado=isinstance(filas, FilasResultado),
+                             claves_orden={3: claves_segmentos, 4: claves_segmentos},
+                             al_activar_fila=self._mostrar_segmentos_proceso,
+                             color_encabezado=color_header, color_texto=COLOR_AMARILLO)
+        tabla.pack(pady=10, padx=10, fill="x")
+        self.tabla_resultados = tabla
+        ctk.CTkLabel(parent_frame, text="Doble clic en una fila para ver todos sus segmentos",
+                     text_color=COLOR_AMARILLO_OSCURO, font=("Arial", 11)).pack(padx=10, anchor="w")
+
+    def _consolidar_procesos(self):
+        """
+        Devuelve una fila por proceso con segmentos: (nombre, llegada, cpu, ResumenSegmentos
+        de comienzos, ResumenSegmentos de fines, espera, turnaround). Solo se guarda una
+        muestra de los tiempos de cada proceso; la lista completa se genera al pedirla.
+        Para un ResultadoSimulacion las filas se generan al mostrarlas (FilasResultado).
+        """
+        datos = self.datos_resultado_lista
+        if isinstance(datos, ResultadoSimulacion):
+            return FilasResultado(datos) # Filas generadas al mostrarlas, ya ordenadas por nombre
+
         procesos_consolidados = {}
-        for segmento in self.datos_resultado_lista:
+        for segmento in datos:
             nombre_proc = segmento.get("proceso", "N/A_Proc")
             if nombre_proc not in procesos_consolidados:
                 procesos_consolidados[nombre_proc] = {
@@ -171,8 +418,8 @@ class ResultsView(ctk.CTkFrame):
                     "turnaround_total": segmento.get("turnaround_final", "-")
                 }
             
-            procesos_consolidados[nombre_proc]["comienzos_segmento"].append(str(segmento.get("comienzo", "")))
-            procesos_consolidados[nombre_proc]["fines_segmento"].append(str(segmento.get("final", "")))
+            procesos_consolidados[nombre_proc]["comienzos_segmento"].append(segmento.get("comienzo", ""))
+            procesos_consolidados[nombre_proc]["fines_segmento"].append(segmento.get("final", ""))
             
             # Actualizar con los valores finales si este segmento los tiene (para asegurar que se toma el último cálculo)
             current_espera = segmento.get("espera_final", procesos_consolidados[nombre_proc]["espera_total"])
@@ -183,38 +430,89 @@ class ResultsView(ctk.CTkFrame):
             if isinstance(current_turnaround, (int, float)) or (isinstance(current_turnaround, str) and current_turnaround not in ["Calc...", "En Proceso", "No Term.", "Error T"]):
                  procesos_consolidados[nombre_proc]["turnaround_total"] = current_turnaround
 
-        nombres_procesos_ordenados = sorted(procesos_consolidados.keys())
-        row_idx = 1
-        for nombre_proc in nombres_procesos_ordenados:
-            data = procesos_consolidados[nombre_proc]
-            comienzos_str = ", ".join(filter(None, data["comienzos_segmento"])) # Filtrar Nones o vacíos
-            fines_str = ", ".join(filter(None, data["fines_segmento"]))
-
-            fila_a_mostrar = [
-                nombre_proc, data["llegada"], data["cpu_total"],
-                comienzos_str, fines_str, data["espera_total"], data["turnaround_total"]
-            ]
-            for col_idx, val in enumerate(fila_a_mostrar):
-                ctk.CTkLabel(tabla_frame, text=str(val), text_color=COLOR_AMARILLO, font=("Arial", 12)).grid(row=row_idx, column=col_idx, padx=10, pady=6, sticky="w")
-            row_idx += 1
-        
-        for i in range(len(headers)):
-            tabla_frame.grid_columnconfigure(i, weight=1)
+        filas = []
+        for nombre_proc, data in procesos_consolidados.items():
+            # Filtrar Nones o vacíos, como en la tabla original
+            comienzos = [v for v in data["comienzos_segmento"] if v is not None and v != ""]
+            fines = [v for v in data["fines_segmento"] if v is not None and v != ""]
+            filas.append((nombre_proc, data["llegada"], data["cpu_total"],
+                          ResumenSegmentos(comienzos[:ResumenSegmentos.TAMANO_MUESTRA], len(comienzos), lambda c=comienzos: c),
+                          ResumenSegmentos(fines[:ResumenSegmentos.TAMANO_MUESTRA], len(fines), lambda f=fines: f),
+                          data["espera_total"], data["turnaround_total"]))
+        return filas
+
+    def _mostrar_segmentos_proceso(self, fila):
+        """Ventana con la lista completa de segmentos de un proceso (se genera solo al pedirla)."""
+        nombre, comienzos, fines = fila[0], fila[3].todos(), fila[4].todos()
+        ventana = ctk.CTkToplevel(self)
+        ventana.title(f"Segmentos de {nombre}")
+        ventana.geometry("360x420")
+        ventana.configure(fg_color=COLOR_FONDO_SECUNDARIO)
+        ctk.CTkLabel(ventana, text=f"{nombre}: {len(comienzos)} segmentos", text_color=COLOR_AMARILLO,
+                     font=("Arial", 13, "bold")).pack(pady=(10, 5))
+        texto = ctk.CTkTextbox(ventana, text_color=COLOR_AMARILLO, font=("Courier New", 12))
+        texto.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        texto.insert("1.0", "\n".join(f"{c} - {f}" for c, f in zip(comienzos, fines)))
+        texto.configure(state="disabled")
+        ventana.after(100, ventana.lift) # CTkToplevel puede quedar detrás de la ventana principal
+
+    def _diagrama_para_datos(self):
+        """Devuelve (DiagramaGantt, datos_validos, datos_completos) para los datos actuales."""
+        gantt_items = self.datos_resultado_lista
+        # Lista de diccionarios o ResultadoSimulacion (secuencia que genera los diccionarios bajo demanda)
+        datos_validos = isinstance(gantt_items, ResultadoSimulacion) or \
+                        (isinstance(gantt_items, Sequence) and isinstance(gantt_items[0], dict))
+        datos_completos = datos_validos and (isinstance(gantt_items, ResultadoSimulacion) or
+                                             ('comienzo' in gantt_items[0] and 'final' in gantt_items[0]))
+        # Agrupar una sola vez los segmentos por proceso (sin crear diccionarios si el resultado es columnar)
+        return DiagramaGantt(gantt_items if datos_completos else []), datos_validos, datos_completos
 
     def _mostrar_gantt(self, parent_frame, sim_type):
         gantt_container_frame = ctk.CTkFrame(parent_frame, fg_color=COLOR_FONDO_GANTT, corner_radius=10)
         gantt_container_frame.pack(pady=20, padx=10, fill="both", expand=True)
         
         gantt_items = self.datos_resultado_lista if self.datos_resultado_lista is not None else []
-        if not gantt_items:
+        if not gantt_items and self.simulacion is None:
              ctk.CTkLabel(gantt_container_frame, text="No hay datos para el Diagrama de Gantt.", text_color=COLOR_AMARILLO, font=("Arial", 14)).pack(expand=True)
              return
 
-        num_unique_processes = len(set(item.get('proceso') for item in gantt_items if item and item.get('proceso')))
-        fig_height = max(4, num_unique_processes * 0.6 + 1.5) # +1.5 para márgenes y título
+        self.sim_type = sim_type
+        diagrama, datos_validos, datos_completos = self._diagrama_para_datos()
+
+        # Altura según las filas de la vista inicial (con muchos procesos, el resto se ve desplazando el eje Y).
+        # Con la simulación en curso aún no hay segmentos: se dimensiona por la cantidad de procesos.
+        filas_figura = diagrama.filas_iniciales
+        if self.simulacion is not None:
+            filas_figura = min(len(self.simulacion.resultado.tabla), DiagramaGantt.FILAS_VISIBLES_INICIALES)
+        fig_height = max(4, filas_figura * 0.6 + 1.5) # +1.5 para márgenes y título
         
-        fig, ax = plt.subplots(figsize=(12, fig_height)) # Ajustar figsize según necesidad
+        Figure, FigureCanvasTkAgg, NavigationToolbar2Tk = cargar_backend_graficos()
+        fig = Figure(figsize=(12, fig_height)) # Ajustar figsize según necesidad
+        ax = fig.add_subplot(111)
         fig.patch.set_facecolor(COLOR_FONDO_GANTT)
+        self.ax_gantt = ax
+        self._dibujar_gantt(ax, diagrama, datos_validos, datos_completos)
+        
+        fig.tight_layout(pad=1.5) # Añadir padding
+        diagrama.actualizar_vista(forzar=True) # Barras y etiquetas según el ancho real del eje tras el layout
+        if self.canvas_widget: self.canvas_widget.get_tk_widget().destroy()
+        if self.toolbar_gantt: self.toolbar_gantt.destroy()
+        self.canvas_widget = FigureCanvasTkAgg(fig, master=gantt_container_frame)
+        # Barra de zoom/desplazamiento de matplotlib y zoom con la rueda del ratón
+        self.toolbar_gantt = NavigationToolbar2Tk(self.canvas_widget, gantt_container_frame, pack_toolbar=False)
+        self.toolbar_gantt.update()
+        self.toolbar_gantt.pack(side=ctk.BOTTOM, fill=ctk.X, padx=5)
+        # Por self.diagrama_gantt: con resultados parciales el diagrama se reemplaza en cada refresco
+        self.canvas_widget.mpl_connect('scroll_event', lambda evento: self.diagrama_gantt.zoom_con_rueda(evento))
+        # Al redimensionar cambia el ancho en píxeles: recalcular el nivel de detalle
+        self.canvas_widget.mpl_connect('resize_event', lambda _evento: self.diagrama_gantt.actualizar_vista())
+        self.canvas_widget.draw()
+        self.canvas_widget.get_tk_widget().pack(side=ctk.TOP, fill=ctk.BOTH, expand=True, padx=5, pady=5)
+
+    def _dibujar_gantt(self, ax, diagrama, datos_validos, datos_completos):
+        """Dibuja el diagrama y el estilo del eje `ax` (vacío), y fija los límites iniciales."""
+        from matplotlib.ticker import MaxNLocator # matplotlib ya está importado en este punto
+        sim_type = self.sim_type
         ax.set_facecolor(COLOR_FONDO_GANTT)
         
         # Paleta de colores para Gantt (diferente para RR y SRTF si se desea)
@@ -226,46 +524,14 @@ class ResultsView(ctk.CTkFrame):
         default_color = "#BEBEBE" # Gris para procesos sin color asignado
         max_final_time = 0
         
-        if isinstance(gantt_items, list) and gantt_items and isinstance(gantt_items[0], dict):
-            if not ('comienzo' in gantt_items[0] and 'final' in gantt_items[0]):
-                ax.text(0.5, 0.5, "Datos de Gantt incompletos.", color=COLOR_AMARILLO, ha='center', va='center', transform=ax.transAxes)
-            else:
-                y_labels_unique = sorted(list(set(item.get("proceso", f"P_indef_{i}") for i, item in enumerate(gantt_items) if item)))
-                y_pos = {label: i for i, label in enumerate(y_labels_unique)}
-
-                for item_idx, item in enumerate(gantt_items):
-                    nombre = item.get("proceso", f"P_indef_{item_idx}")
-                    if nombre not in y_pos: # Asegurar que todos tengan y_pos (no debería pasar con la línea anterior)
-                        y_pos[nombre] = len(y_labels_unique)
-                        y_labels_unique.append(nombre)
-                    
-                    comienzo, final_val = item.get("comienzo", 0), item.get("final", item.get("comienzo", 0))
-                    # Validar que comienzo y final_val sean numéricos
-                    if not (isinstance(comienzo, (int, float)) and isinstance(final_val, (int, float))):
-                        print(f"ADVERTENCIA (Gantt): Segmento para '{nombre}' tiene tiempos no numéricos: comienzo={comienzo}, final={final_val}. Saltando segmento.")
-                        continue
-
-                    duracion = max(0.1, final_val - comienzo) # Mínima duración para visibilidad
-                    
-                    color_proceso = colores_gantt_usar.get(nombre, default_color)
-                    ax.barh(y_pos[nombre], duracion, left=comienzo, color=color_proceso, edgecolor=COLOR_FONDO_GANTT, height=0.6)
-                    
-                    if duracion > 0.3:
-                        try:
-                            hex_color = color_proceso.lstrip('#')
-                            r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-                            luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-                            text_color_in_bar = COLOR_FONDO_GANTT if luminance > 0.6 else COLOR_TEXTO_BLANCO # Ajustar umbral
-                        except:
-                            text_color_in_bar = COLOR_TEXTO_BLANCO # Fallback
-                        ax.text(comienzo + duracion / 2, y_pos[nombre], nombre, ha='center', va='center', color=text_color_in_bar, fontsize=9, fontweight='bold')
-                    
-                    if final_val > max_final_time: max_final_time = final_val
-                
-                ax.set_yticks(list(y_pos.values()))
-                ax.set_yticklabels(list(y_pos.keys()), color=COLOR_AMARILLO)
-        else:
+        if not datos_validos:
             ax.text(0.5, 0.5, "No hay datos válidos para Gantt.", color=COLOR_AMARILLO, ha='center', va='center', transform=ax.transAxes)
+        elif not datos_completos:
+            ax.text(0.5, 0.5, "Datos de Gantt incompletos.", color=COLOR_AMARILLO, ha='center', va='center', transform=ax.transAxes)
+        else:
+            # Una colección de barras por proceso; solo se dibuja lo visible con el zoom actual
+            max_final_time = diagrama.dibujar(ax, colores_gantt_usar, default_color, COLOR_FONDO_GANTT,
+                                              COLOR_FONDO_GANTT, COLOR_TEXTO_BLANCO, color_ejes=COLOR_AMARILLO)
 
         ax.set_xlabel("Tiempo", color=COLOR_AMARILLO, fontsize=12)
         ax.set_ylabel("Procesos", color=COLOR_AMARILLO, fontsize=12)
@@ -275,27 +541,26 @@ class ResultsView(ctk.CTkFrame):
         ax.tick_params(axis='y', colors=COLOR_AMARILLO)
         for spine_pos in ['bottom', 'top', 'left', 'right']: ax.spines[spine_pos].set_color(COLOR_AMARILLO_OSCURO)
         
+        # Marcas enteras (~15) que se recalculan al hacer zoom, en lugar de una lista fija
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=15, integer=True))
         if max_final_time > 0:
-            tick_step = np.ceil(max_final_time / 15) if max_final_time > 15 else 1.0
-            tick_step = max(1, int(tick_step)) # Asegurar que sea al menos 1 y entero
-            ax.set_xticks(np.arange(0, np.ceil(max_final_time / tick_step) * tick_step + tick_step, tick_step))
             ax.set_xlim(left=-0.5, right=max_final_time + 0.5)
         else:
-            ax.set_xticks(np.arange(0, 11, 1))
             ax.set_xlim(left=-0.5, right=10.5)
-        
-        plt.tight_layout(pad=1.5) # Añadir padding
-        if self.canvas_widget: self.canvas_widget.get_tk_widget().destroy()
-        self.canvas_widget = FigureCanvasTkAgg(fig, master=gantt_container_frame)
-        self.canvas_widget.draw()
-        self.canvas_widget.get_tk_widget().pack(side=ctk.TOP, fill=ctk.BOTH, expand=True, padx=5, pady=5)
-        plt.close(fig) # Cerrar la figura para liberar memoria
+        self._limites_automaticos = (ax.get_xlim(), ax.get_ylim())
+        self.diagrama_gantt = diagrama
 
     def destroy(self):
+        # Detener la simulación en curso (si la hay) antes de destruir los widgets que actualiza
+        if self.simulacion is not None:
+            self.simulacion.detener()
         # Limpiar el widget de Matplotlib si existe
         if self.canvas_widget:
             self.canvas_widget.get_tk_widget().destroy()
             self.canvas_widget = None
+        if self.toolbar_gantt:
+            self.toolbar_gantt.destroy()
+            self.toolbar_gantt = None
         # Limpiar la etiqueta de fondo si existe
         if self.background_label:
             self.background_label.destroy()
@@ -308,16 +573,18 @@ class RRView(ctk.CTkFrame):
         super().__init__(master, fg_color=COLOR_FONDO_PRINCIPAL)
         self.master_window = master
         self.volver_callback_menu_principal = volver_callback_menu_principal
-        self.proceso_entries = []
         self.cantidad_entry = None
         self.quantum_entry = None
         self.background_img_obj = None
         self.background_label = None
-        self.entrada_procesos_scrollable_frame = None
-        self.inner_entrada_frame = None
+        self.editor_procesos = None
+        self.carga_importada = None # TablaProcesos importada desde archivo (en lugar del editor)
+        self.etiqueta_carga = None
         self.results_view_instance = None
         self.main_content_frame = None
         self.btn_calcular = None
+        self.btn_barrido = None
+        self.ventana_barrido = None
 
         self.master_window.update_idletasks()
         self._cargar_fondo()
@@ -359,13 +626,9 @@ class RRView(ctk.CTkFrame):
             self.configure(fg_color=COLOR_FONDO_SECUNDARIO)
             return
         try:
-            imagen_pil = Image.open(ruta_fondo_actual)
-            self.background_img_obj = ctk.CTkImage(light_image=imagen_pil, dark_image=imagen_pil, size=(master_width, master_height))
-            if self.background_label is None:
-                self.background_label = ctk.CTkLabel(self, image=self.background_img_obj, text="")
-            else:
-                self.background_label.configure(image=self.background_img_obj)
-            self.background_label.place(x=0, y=0, relwidth=1, relheight=1)
+            imagen = cache_imagenes.obtener_ctk(ruta_fondo_actual, (master_width, master_height),
+                                                widget=self, al_cargar=lambda img: colocar_fondo(self, img))
+            colocar_fondo(self, imagen)
         except Exception as e:
             print(f"EXCEPCIÓN (RRView) al cargar fondo '{ruta_fondo_actual}': {e}")
             traceback.print_exc()
@@ -386,8 +649,7 @@ class RRView(ctk.CTkFrame):
         icon_path = ICON_VOLVER_RR_PATH # Específico para RRView
         if os.path.exists(icon_path):
             try:
-                icono_img = Image.open(icon_path)
-                icono = ctk.CTkImage(light_image=icono_img, dark_image=icono_img, size=(30, 30))
+                icono = cache_imagenes.obtener_ctk(icon_path, (30, 30))
             except Exception as e: print(f"ERROR (RRView): Excepción al cargar icono volver main: {e}")
         else: print(f"ERROR (RRView): Icono Volver Main NO ENCONTRADO en '{icon_path}'")
         
@@ -434,12 +696,26 @@ class RRView(ctk.CTkFrame):
                       border_color=COLOR_ROJO, text_color=COLOR_AMARILLO, hover_color=COLOR_ROJO_OSCURO
         ).pack(pady=(15,10))
         
+        ctk.CTkButton(self.formulario_inicial_frame, text="Importar Carga", command=self._importar_carga,
+                      border_width=2, fg_color="transparent", font=font_boton_form,
+                      border_color=COLOR_ROJO, text_color=COLOR_AMARILLO, hover_color=COLOR_ROJO_OSCURO
+        ).pack(pady=(0,10))
+        self.etiqueta_carga = ctk.CTkLabel(self.formulario_inicial_frame, text="", text_color=COLOR_AMARILLO, font=("Arial", 12))
+        self.etiqueta_carga.pack()
+        
         self.btn_calcular = ctk.CTkButton(self.formulario_inicial_frame, text="Calcular Round Robin", command=self._calcular_rr_and_show_results,
                                            border_width=2, fg_color="transparent", border_color=COLOR_AMARILLO, text_color=COLOR_ROJO,
                                            font=font_boton_form, hover_color=COLOR_AMARILLO_OSCURO, state="disabled"
         )
         self.btn_calcular.pack(pady=5)
 
+        # Barrido: la misma carga con un rango de quantums (sin el límite 1-4), en paralelo
+        self.btn_barrido = ctk.CTkButton(self.formulario_inicial_frame, text="Barrido de Quantum", command=self._abrir_barrido_quantum,
+                                         border_width=2, fg_color="transparent", border_color=COLOR_ROJO, text_color=COLOR_AMARILLO,
+                                         font=font_boton_form, hover_color=COLOR_ROJO_OSCURO, state="disabled"
+        )
+        self.btn_barrido.pack(pady=5)
+
     def _generar_tabla_inputs(self):
         try:
             cantidad_str = self.cantidad_entry.get()
@@ -460,52 +736,65 @@ class RRView(ctk.CTkFrame):
             print("Error: Cantidad y Quantum deben ser números enteros.")
             return
 
-        if self.entrada_procesos_scrollable_frame: self.entrada_procesos_scrollable_frame.destroy()
-        
-        dynamic_height = min(cantidad * 55 + 70, 350) # Ajustar altura máxima
-        
+        self._crear_editor_procesos(cantidad, MAX_PROCESOS_RR, COLOR_ROJO)
+        if self.btn_calcular: self.btn_calcular.configure(state="normal")
+        if self.btn_barrido: self.btn_barrido.configure(state="normal")
+
+    def _crear_editor_procesos(self, cantidad, maximo, color_nombre):
+        if self.editor_procesos: self.editor_procesos.destroy()
+        self.carga_importada = None
+        if self.etiqueta_carga: self.etiqueta_carga.configure(text="")
+
         font_label_scroll = ("space age", 14)
         try: ctk.CTkLabel(self.main_content_frame, text="", font=font_label_scroll).destroy()
         except: font_label_scroll = ("Arial", 12, "italic")
 
-        self.entrada_procesos_scrollable_frame = ctk.CTkScrollableFrame(self.main_content_frame,
-            label_text="Ingrese los Datos de los Procesos:", label_font=font_label_scroll,
-            label_text_color=COLOR_AMARILLO, fg_color=COLOR_FONDO_SECUNDARIO, 
-            corner_radius=10, height=dynamic_height
-        )
-        self.entrada_procesos_scrollable_frame.pack(pady=10, padx=20, fill="x", expand=False)
-        self.inner_entrada_frame = ctk.CTkFrame(self.entrada_procesos_scrollable_frame, fg_color="transparent")
-        self.inner_entrada_frame.pack(fill="x", expand=True)
-
-        self.proceso_entries = []
-        header_texts = ["Proceso", "Tiempo de Llegada", "Ráfaga de CPU"]
-        for i, h_text in enumerate(header_texts):
-            ctk.CTkLabel(self.inner_entrada_frame, text=h_text, font=("Arial", 16, "bold"), text_color=COLOR_AMARILLO).grid(row=0, column=i, padx=15, pady=10, sticky="nsew")
-        
-        for i in range(cantidad):
-            proceso_char = chr(65 + i)
-            ctk.CTkLabel(self.inner_entrada_frame, text=proceso_char, font=("Arial", 14, "bold"), text_color=COLOR_ROJO).grid(row=i + 1, column=0, padx=15, pady=8)
-            e_llegada = ctk.CTkEntry(self.inner_entrada_frame, width=120, justify="center", font=("Arial", 14)); e_llegada.grid(row=i + 1, column=1, padx=15, pady=8)
-            e_cpu = ctk.CTkEntry(self.inner_entrada_frame, width=120, justify="center", font=("Arial", 14)); e_cpu.grid(row=i + 1, column=2, padx=15, pady=8)
-            self.proceso_entries.append((proceso_char, e_llegada, e_cpu))
-        
-        for col in range(3): self.inner_entrada_frame.grid_columnconfigure(col, weight=1)
+        # Editor virtualizado: pocas filas de widgets reutilizadas, sin importar la cantidad de procesos
+        self.editor_procesos = EditorProcesos(self.main_content_frame, cantidad, maximo, color_nombre=color_nombre,
+                                              titulo="Ingrese los Datos de los Procesos:", fuente_titulo=font_label_scroll)
+        self.editor_procesos.pack(pady=10, padx=20, fill="x", expand=False)
+
+    def _importar_carga(self):
+        tabla, error = importar_carga_desde_dialogo(self)
+        if tabla is None:
+            if error: self.etiqueta_carga.configure(text=f"Error: {error}")
+            return
+        # La carga va directo a la simulación: no se crean widgets por proceso
+        if self.editor_procesos: self.editor_procesos.destroy(); self.editor_procesos = None
+        self.carga_importada = tabla
+        self.etiqueta_carga.configure(text=f"Carga importada: {len(tabla)} procesos")
         if self.btn_calcular: self.btn_calcular.configure(state="normal")
+        if self.btn_barrido: self.btn_barrido.configure(state="normal")
+
+    def _leer_procesos(self):
+        """
+        Devuelve los procesos a simular (la TablaProcesos importada o una lista de
+        diccionarios desde el editor) o None si algún dato no es válido.
+        """
+        if self.carga_importada is not None:
+            return self.carga_importada # TablaProcesos, ya validada al importar
+        if self.editor_procesos is None:
+            return None
+        # El error se muestra en la vista (y el editor va a la fila): con miles de filas
+        # pegadas, un mensaje en la consola no se ve
+        procesos_data_list, error = self.editor_procesos.leer_procesos()
+        self.etiqueta_carga.configure(text=f"Error: {error}" if error else "")
+        return procesos_data_list
+
+    def _abrir_barrido_quantum(self):
+        procesos = self._leer_procesos()
+        if not procesos:
+            print("Error: No hay procesos válidos para el barrido de quantum.")
+            return
+        if self.ventana_barrido is not None and self.ventana_barrido.winfo_exists():
+            self.ventana_barrido.destroy()
+        self.ventana_barrido = VentanaBarridoQuantum(self, TablaProcesos.preparar(procesos, origen="RRView"))
 
     def _calcular_rr_and_show_results(self):
-        procesos_data_list = []
+        procesos_data_list = self._leer_procesos()
+        if procesos_data_list is None:
+            return
         try:
-            for nombre, llegada_e, cpu_e in self.proceso_entries:
-                llegada_str, duracion_str = llegada_e.get(), cpu_e.get()
-                if not llegada_str or not duracion_str:
-                    print("Error: Todos los campos de llegada y CPU deben estar llenos.")
-                    return
-                llegada, duracion = int(llegada_str), int(duracion_str)
-                if llegada < 0 or duracion <= 0:
-                    print("Error: Tiempo de llegada debe ser >= 0 y Ráfaga de CPU debe ser > 0.")
-                    return
-                procesos_data_list.append({"nombre": nombre, "llegada": llegada, "duracion_original": duracion})
-            
             quantum_str = self.quantum_entry.get()
             if not quantum_str:
                 print("Error: Quantum no puede estar vacío.")
@@ -515,7 +804,7 @@ class RRView(ctk.CTkFrame):
                 print("Error: Quantum debe estar entre 1 y 4.")
                 return
         except ValueError:
-            print("Error: Todos los datos de llegada, CPU y Quantum deben ser números enteros.")
+            print("Error: El Quantum debe ser un número entero.")
             return
         
         if not procesos_data_list:
@@ -524,11 +813,7 @@ class RRView(ctk.CTkFrame):
         
         try:
             controlador_usar = RRController if not USAR_CONTROLADORES_MOCK else MockRRController
-            resultado_simulacion = controlador_usar.simular_rr(procesos_data_list, quantum)
-            
-            if resultado_simulacion is None: 
-                print("Error: La simulación RR no devolvió resultados.")
-                return
+            modelo = controlador_usar.modelo_rr(procesos_data_list, quantum)
         except Exception as e:
             print(f"Error en simulación RR: {e}")
             traceback.print_exc()
@@ -536,8 +821,10 @@ class RRView(ctk.CTkFrame):
         
         self.pack_forget()
         if self.results_view_instance: self.results_view_instance.destroy()
+        # La simulación corre en un hilo; ResultsView muestra el progreso y los resultados a medida que llegan
+        simulacion = SimulacionEnHilo(self.master_window, modelo)
         # Pasar la ruta de fondo correcta para RR
-        self.results_view_instance = ResultsView(self.master_window, resultado_simulacion, self._return_to_rr_view, BG_IMAGE_RR_PATH)
+        self.results_view_instance = ResultsView(self.master_window, None, self._return_to_rr_view, BG_IMAGE_RR_PATH, simulacion=simulacion)
 
     def _return_to_rr_view(self):
         if self.results_view_instance: self.results_view_instance.destroy(); self.results_view_instance = None
@@ -549,16 +836,19 @@ class RRView(ctk.CTkFrame):
         if self.background_label: self.background_label.lower()
         
         # Limpiar entradas para nueva simulación
-        if self.entrada_procesos_scrollable_frame: self.entrada_procesos_scrollable_frame.destroy(); self.entrada_procesos_scrollable_frame = None; self.inner_entrada_frame = None
+        if self.editor_procesos: self.editor_procesos.destroy(); self.editor_procesos = None
+        self.carga_importada = None
+        if self.etiqueta_carga: self.etiqueta_carga.configure(text="")
         if self.btn_calcular: self.btn_calcular.configure(state="disabled")
+        if self.btn_barrido: self.btn_barrido.configure(state="disabled")
         if self.cantidad_entry: self.cantidad_entry.delete(0, 'end')
         if self.quantum_entry: self.quantum_entry.delete(0, 'end')
-        self.proceso_entries = []
 
     def destroy(self):
+        if self.ventana_barrido is not None and self.ventana_barrido.winfo_exists(): self.ventana_barrido.destroy()
         if self.results_view_instance: self.results_view_instance.destroy()
         if self.background_label: self.background_label.destroy()
-        if self.entrada_procesos_scrollable_frame: self.entrada_procesos_scrollable_frame.destroy()
+        if self.editor_procesos: self.editor_procesos.destroy()
         super().destroy()
 
 
@@ -567,13 +857,13 @@ class SRTFView(ctk.CTkFrame): # Similar estructura a RRView
         super().__init__(master, fg_color=COLOR_FONDO_PRINCIPAL)
         self.master_window = master
         self.volver_callback_menu_principal = volver_callback_menu_principal
-        self.proceso_entries = []
         self.cantidad_entry = None
         # SRTF no usa Quantum_entry
         self.background_img_obj = None
         self.background_label = None
-        self.entrada_procesos_scrollable_frame = None
-        self.inner_entrada_frame = None
+        self.editor_procesos = None
+        self.carga_importada = None # TablaProcesos importada desde archivo (en lugar del editor)
+        self.etiqueta_carga = None
         self.results_view_instance = None
         self.main_content_frame = None
         self.btn_calcular = None
@@ -618,13 +908,9 @@ class SRTFView(ctk.CTkFrame): # Similar estructura a RRView
             self.configure(fg_color=COLOR_FONDO_SECUNDARIO)
             return
         try:
-            imagen_pil = Image.open(ruta_fondo_actual)
-            self.background_img_obj = ctk.CTkImage(light_image=imagen_pil, dark_image=imagen_pil, size=(master_width, master_height))
-            if self.background_label is None:
-                self.background_label = ctk.CTkLabel(self, image=self.background_img_obj, text="")
-            else:
-                self.background_label.configure(image=self.background_img_obj)
-            self.background_label.place(x=0, y=0, relwidth=1, relheight=1)
+            imagen = cache_imagenes.obtener_ctk(ruta_fondo_actual, (master_width, master_height),
+                                                widget=self, al_cargar=lambda img: colocar_fondo(self, img))
+            colocar_fondo(self, imagen)
         except Exception as e:
             print(f"EXCEPCIÓN (SRTFView) al cargar fondo '{ruta_fondo_actual}': {e}")
             traceback.print_exc()
@@ -644,8 +930,7 @@ class SRTFView(ctk.CTkFrame): # Similar estructura a RRView
         icon_path = ICON_VOLVER_SRTF_PATH # Específico para SRTFView
         if os.path.exists(icon_path):
             try:
-                icono_img = Image.open(icon_path)
-                icono = ctk.CTkImage(light_image=icono_img, dark_image=icono_img, size=(30, 30))
+                icono = cache_imagenes.obtener_ctk(icon_path, (30, 30))
             except Exception as e: print(f"ERROR (SRTFView): Excepción al cargar icono volver main: {e}")
         else: print(f"ERROR (SRTFView): Icono Volver Main NO ENCONTRADO en '{icon_path}'")
         
@@ -683,6 +968,13 @@ class SRTFView(ctk.CTkFrame): # Similar estructura a RRView
                       border_color=COLOR_VERDE, text_color=COLOR_AMARILLO, hover_color=COLOR_VERDE_OSCURO
         ).pack(pady=(15,10))
         
+        ctk.CTkButton(self.formulario_inicial_frame, text="Importar Carga", command=self._importar_carga,
+                      border_width=2, fg_color="transparent", font=font_boton_form,
+                      border_color=COLOR_VERDE, text_color=COLOR_AMARILLO, hover_color=COLOR_VERDE_OSCURO
+        ).pack(pady=(0,10))
+        self.etiqueta_carga = ctk.CTkLabel(self.formulario_inicial_frame, text="", text_color=COLOR_AMARILLO, font=("Arial", 12))
+        self.etiqueta_carga.pack()
+        
         self.btn_calcular = ctk.CTkButton(self.formulario_inicial_frame, text="Calcular SRTF", command=self._calcular_srtf_and_show_results,
                                            border_width=2, fg_color="transparent", border_color=COLOR_AMARILLO, text_color=COLOR_VERDE,
                                            font=font_boton_form, hover_color=COLOR_AMARILLO_OSCURO, state="disabled"
@@ -699,61 +991,57 @@ class SRTFView(ctk.CTkFrame): # Similar estructura a RRView
                 return
         except ValueError: print("Error: Cantidad debe ser un número entero."); return
 
-        if self.entrada_procesos_scrollable_frame: self.entrada_procesos_scrollable_frame.destroy()
-        
-        dynamic_height = min(cantidad * 55 + 70, 350)
+        self._crear_editor_procesos(cantidad, MAX_PROCESOS_SRTF, COLOR_VERDE) # Color Verde para SRTF
+        if self.btn_calcular: self.btn_calcular.configure(state="normal")
+
+    def _crear_editor_procesos(self, cantidad, maximo, color_nombre): # Igual que en RRView
+        if self.editor_procesos: self.editor_procesos.destroy()
+        self.carga_importada = None
+        if self.etiqueta_carga: self.etiqueta_carga.configure(text="")
+
         font_label_scroll = ("space age", 14)
         try: ctk.CTkLabel(self.main_content_frame, text="", font=font_label_scroll).destroy()
         except: font_label_scroll = ("Arial", 12, "italic")
 
-        self.entrada_procesos_scrollable_frame = ctk.CTkScrollableFrame(self.main_content_frame,
-            label_text="Ingrese los Datos de los Procesos:", label_font=font_label_scroll,
-            label_text_color=COLOR_AMARILLO, fg_color=COLOR_FONDO_SECUNDARIO, 
-            corner_radius=10, height=dynamic_height
-        )
-        self.entrada_procesos_scrollable_frame.pack(pady=10, padx=20, fill="x", expand=False)
-        self.inner_entrada_frame = ctk.CTkFrame(self.entrada_procesos_scrollable_frame, fg_color="transparent")
-        self.inner_entrada_frame.pack(fill="x", expand=True)
-
-        self.proceso_entries = []
-        header_texts = ["Proceso", "Tiempo de Llegada", "Ráfaga de CPU"]
-        for i, h_text in enumerate(header_texts):
-            ctk.CTkLabel(self.inner_entrada_frame, text=h_text, font=("Arial", 16, "bold"), text_color=COLOR_AMARILLO).grid(row=0, column=i, padx=15, pady=10, sticky="nsew")
-        
-        for i in range(cantidad):
-            proceso_char = chr(65 + i)
-            ctk.CTkLabel(self.inner_entrada_frame, text=proceso_char, font=("Arial", 14, "bold"), text_color=COLOR_VERDE).grid(row=i + 1, column=0, padx=15, pady=8) # Color Verde para SRTF
-            e_llegada = ctk.CTkEntry(self.inner_entrada_frame, width=120, justify="center", font=("Arial", 14)); e_llegada.grid(row=i + 1, column=1, padx=15, pady=8)
-            e_cpu = ctk.CTkEntry(self.inner_entrada_frame, width=120, justify="center", font=("Arial", 14)); e_cpu.grid(row=i + 1, column=2, padx=15, pady=8)
-            self.proceso_entries.append((proceso_char, e_llegada, e_cpu))
-        
-        for col in range(3): self.inner_entrada_frame.grid_columnconfigure(col, weight=1)
+        # Editor virtualizado: pocas filas de widgets reutilizadas, sin importar la cantidad de procesos
+        self.editor_procesos = EditorProcesos(self.main_content_frame, cantidad, maximo, color_nombre=color_nombre,
+                                              titulo="Ingrese los Datos de los Procesos:", fuente_titulo=font_label_scroll)
+        self.editor_procesos.pack(pady=10, padx=20, fill="x", expand=False)
+
+    def _importar_carga(self): # Igual que en RRView
+        tabla, error = importar_carga_desde_dialogo(self)
+        if tabla is None:
+            if error: self.etiqueta_carga.configure(text=f"Error: {error}")
+            return
+        # La carga va directo a la simulación: no se crean widgets por proceso
+        if self.editor_procesos: self.editor_procesos.destroy(); self.editor_procesos = None
+        self.carga_importada = tabla
+        self.etiqueta_carga.configure(text=f"Carga importada: {len(tabla)} procesos")
         if self.btn_calcular: self.btn_calcular.configure(state="normal")
 
     def _calcular_srtf_and_show_results(self): # Similar a RRView
-        procesos_data_list = []
-        try:
-            for nombre, llegada_e, cpu_e in self.proceso_entries:
-                llegada_str, duracion_str = llegada_e.get(), cpu_e.get()
-                if not llegada_str or not duracion_str: print("Error: Campos de llegada/CPU vacíos."); return
-                llegada, duracion = int(llegada_str), int(duracion_str)
-                if llegada < 0 or duracion <= 0: print("Error: Llegada >= 0 y CPU > 0."); return
-                procesos_data_list.append({"nombre": nombre, "llegada": llegada, "duracion_original": duracion})
-        except ValueError: print("Error: Datos deben ser enteros."); return
+        if self.carga_importada is not None:
+            procesos_data_list = self.carga_importada # TablaProcesos, ya validada al importar
+        elif self.editor_procesos is not None:
+            # Como en RRView._leer_procesos: el error y la fila se muestran en la vista
+            procesos_data_list, error = self.editor_procesos.leer_procesos()
+            self.etiqueta_carga.configure(text=f"Error: {error}" if error else "")
+            if error: return
+        else:
+            procesos_data_list = []
         
         if not procesos_data_list: print("Error: No hay procesos."); return
         
         try:
             controlador_usar = SRTFController if not USAR_CONTROLADORES_MOCK else MockSRTFController
-            resultado_simulacion = controlador_usar.simular_srtf(procesos_data_list) # SRTF no necesita quantum
-            
-            if resultado_simulacion is None: print("Error: Simulación SRTF no devolvió resultados."); return
+            modelo = controlador_usar.modelo_srtf(procesos_data_list) # SRTF no necesita quantum
         except Exception as e: print(f"Error en simulación SRTF: {e}"); traceback.print_exc(); return
         
         self.pack_forget()
         if self.results_view_instance: self.results_view_instance.destroy()
+        simulacion = SimulacionEnHilo(self.master_window, modelo) # En un hilo, como en RRView
         # Pasar la ruta de fondo correcta para SRTF
-        self.results_view_instance = ResultsView(self.master_window, resultado_simulacion, self._return_to_srtf_view, BG_IMAGE_SRTF_PATH)
+        self.results_view_instance = ResultsView(self.master_window, None, self._return_to_srtf_view, BG_IMAGE_SRTF_PATH, simulacion=simulacion)
 
     def _return_to_srtf_view(self): # Similar a RRView
         if self.results_view_instance: self.results_view_instance.destroy(); self.results_view_instance = None
@@ -763,13 +1051,14 @@ class SRTFView(ctk.CTkFrame): # Similar estructura a RRView
         self.pack(fill="both", expand=True)
         if self.background_label: self.background_label.lower()
         
-        if self.entrada_procesos_scrollable_frame: self.entrada_procesos_scrollable_frame.destroy(); self.entrada_procesos_scrollable_frame = None; self.inner_entrada_frame = None
+        if self.editor_procesos: self.editor_procesos.destroy(); self.editor_procesos = None
+        self.carga_importada = None
+        if self.etiqueta_carga: self.etiqueta_carga.configure(text="")
         if self.btn_calcular: self.btn_calcular.configure(state="disabled")
         if self.cantidad_entry: self.cantidad_entry.delete(0, 'end')
-        self.proceso_entries = []
 
     def destroy(self): # Similar a RRView
         if self.results_view_instance: self.results_view_instance.destroy()
         if self.background_label: self.background_label.destroy()
-        if self.entrada_procesos_scrollable_frame: self.entrada_procesos_scrollable_frame.destroy()
+        if self.editor_procesos: self.editor_procesos.destroy()
         super().destroy()
@@ -0,0 +1,135 @@
+"""
+Barrido de quantum para Round Robin: simula la misma carga con varios quantums en
+procesos de trabajo (ProcessPoolExecutor) y devuelve las métricas de cada uno.
+
+La carga se copia una sola vez a memoria compartida (multiprocessing.shared_memory):
+llegadas y duraciones en un bloque de 2n valores de 8 bytes. Cada trabajador lo lee al
+arrancar y arma su propia TablaProcesos, así que a cada tarea solo se le envía el
+quantum (y se recibe una MetricasSimulacion), sin serializar la carga por tarea. Las
+tareas son independientes, por lo que el barrido escala con la cantidad de núcleos.
+"""
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from app.models.rr_model import ModeloRR
+from app.models.tabla_procesos import TablaProcesos
+from app.utils.helpers import NombresProceso
+
+
+def interpretar_quantums(texto):
+    """
+    Convierte la especificación de quantums en una lista ordenada sin repetidos:
+    "inicio:fin" o "inicio:fin:paso" (fin incluido) y/o valores sueltos separados por
+    comas, por ejemplo "1:10", "0.5:4:0.5" o "1,2,4,8,16:32:8".
+    Lanza ValueError si no es válida o algún quantum no es > 0.
+    """
+    quantums = set()
+    for parte in texto.split(','):
+        parte = parte.strip()
+        if not parte:
+            continue
+        campos = [_numero(c) for c in parte.split(':')]
+        if len(campos) == 1:
+            quantums.add(campos[0])
+        elif len(campos) in (2, 3):
+            inicio, fin = campos[0], campos[1]
+            paso = campos[2] if len(campos) == 3 else 1
+            if paso <= 0:
+                raise ValueError(f"Paso no válido en '{parte}': debe ser > 0.")
+            # Por índice, no sumando el paso, para no acumular error con pasos flotantes
+            for k in range(int((fin - inicio) / paso + 1e-9) + 1):
+                valor = inicio + k * paso
+                quantums.add(round(valor, 9) if isinstance(valor, float) else valor)
+        else:
+            raise ValueError(f"Rango de quantums no válido: '{parte}'.")
+    if not quantums:
+        raise ValueError("No se indicó ningún quantum.")
+    if min(quantums) <= 0:
+        raise ValueError("Todos los quantums deben ser mayores que 0.")
+    return sorted(quantums)
+
+
+def _numero(texto):
+    try:
+        return int(texto)
+    except ValueError:
+        try:
+            valor = float(texto)
+        except ValueError:
+            raise ValueError(f"'{texto.strip()}' no es un número.")
+    if not math.isfinite(valor): # Un extremo infinito haría un rango sin fin
+        raise ValueError(f"'{texto.strip()}' no es un número finito.")
+    return valor
+
+
+# --- Procesos de trabajo ---
+
+_tabla_trabajador = None # TablaProcesos de la carga en cada proceso de trabajo
+
+
+def _iniciar_trabajador(nombre_memoria, cantidad, tipo):
+    global _tabla_trabajador
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    try:
+        # Una copia local por proceso (no por tarea): las columnas de la tabla deben ser
+        # independientes, porque 'restante' se crea copiando 'duracion'
+        llegada, duracion = array(tipo), array(tipo)
+        tamano = cantidad * llegada.itemsize
+        llegada.frombytes(memoria.buf[:tamano])
+        duracion.frombytes(memoria.buf[tamano:2 * tamano])
+    finally:
+        memoria.close()
+    _tabla_trabajador = TablaProcesos.desde_columnas(NombresProceso(cantidad), llegada, duracion)
+
+
+def _simular_quantum(quantum):
+    tabla = _tabla_trabajador.nueva_ejecucion()
+    return quantum, ModeloRR(tabla, quantum).metricas()
+
+
+def _columnas_compartibles(tabla):
+    # Enteros si ambas columnas lo son; si no (flotantes o listas mixtas), flotantes
+    if isinstance(tabla.llegada, array) and isinstance(tabla.duracion, array) \
+       and tabla.llegada.typecode == tabla.duracion.typecode == 'q':
+        return 'q', tabla.llegada, tabla.duracion
+    return 'd', array('d', tabla.llegada), array('d', tabla.duracion)
+
+
+def iter_barrido_quantum(tabla, quantums, max_trabajadores=None, contexto=None):
+    """
+    Generador de (quantum, MetricasSimulacion) para cada quantum, en el orden en que
+    terminan. `tabla` es la TablaProcesos de la carga (no se modifica). Con un solo
+    trabajador o un solo quantum se simula en este proceso, sin crear el pool.
+    `contexto` es el contexto de multiprocessing del pool (por defecto, el del sistema).
+    """
+    quantums = list(quantums)
+    trabajadores = min(max_trabajadores or os.cpu_count() or 1, len(quantums))
+    if trabajadores <= 1:
+        for quantum in quantums:
+            propia = tabla.nueva_ejecucion()
+            yield quantum, ModeloRR(propia, quantum).metricas()
+        return
+
+    tipo, llegada, duracion = _columnas_compartibles(tabla)
+    cantidad = len(tabla)
+    tamano = cantidad * llegada.itemsize
+    memoria = shared_memory.SharedMemory(create=True, size=max(1, 2 * tamano))
+    try:
+        memoria.buf[:tamano] = memoryview(llegada).cast('B')
+        memoria.buf[tamano:2 * tamano] = memoryview(duracion).cast('B')
+        with ProcessPoolExecutor(max_workers=trabajadores, mp_context=contexto, initializer=_iniciar_trabajador,
+                                 initargs=(memoria.name, cantidad, tipo)) as pool:
+            futuros = [pool.submit(_simular_quantum, quantum) for quantum in quantums]
+            try:
+                for futuro in as_completed(futuros):
+                    yield futuro.result()
+            finally:
+                # Si se deja de consumir el generador, no esperar a los quantums pendientes
+                for futuro in futuros:
+                    futuro.cancel()
+    finally:
+        memoria.close()
+        memoria.unlink()
@@ -0,0 +1,302 @@
+"""
+Carga de procesos desde archivos directamente a una TablaProcesos.
+
+Formatos (se elige por la extensión en cargar_carga):
+    .csv   nombre, llegada, duracion por fila (encabezado opcional, '#' comenta la línea)
+    .jsonl un objeto por línea: {"nombre": ..., "llegada": ..., "duracion": ...}
+           (también acepta "duracion_original", como los controladores)
+    .npy   arreglo estructurado con campos nombre/llegada/duracion, o arreglo numérico
+           de 2 columnas (llegada, duracion) con nombres A, B, ..., AA, ...
+
+Para el planificador por prioridades, leer_csv_con_prioridad lee además una cuarta
+columna 'prioridad' (entero >= 0) y la devuelve aparte de la tabla.
+
+Las filas se validan a medida que se leen (números finitos que caben en 64 bits,
+llegada >= 0, duración > 0) y se agregan a columnas compactas (array('q'), o array('d')
+desde el primer valor no entero), sin crear un diccionario por proceso ni copiar la carga
+más de una vez. Al terminar, si una columna quedó flotante la otra también pasa a
+array('d'): la tabla tiene un solo tipo (ver TablaProcesos).
+"""
+import csv
+import json
+import math
+import os
+from array import array
+
+from app.models.tabla_procesos import TablaProcesos
+from app.utils.helpers import nombre_proceso, NombresProceso
+
+
+EXTENSIONES_CARGA = (".csv", ".jsonl", ".npy")
+INT64_MAXIMO = 2**63 - 1
+
+
+class _Columnas:
+    """
+    Acumula nombre/llegada/duracion validando cada fila al agregarla. Los lectores
+    agregan directamente a las columnas en el caso común (dos enteros) y usan
+    agregar() para el resto.
+    """
+    __slots__ = ('nombres', 'llegada', 'duracion')
+
+    def __init__(self):
+        self.nombres = []
+        self.llegada = array('q')
+        self.duracion = array('q')
+
+    def agregar(self, num_linea, nombre, llegada, duracion):
+        # NaN e infinito pasan las comparaciones y dejarían a los motores sin terminar
+        if not (math.isfinite(llegada) and math.isfinite(duracion)):
+            raise ValueError(f"Línea {num_linea}: llegada y duración deben ser números finitos.")
+        if llegada < 0 or duracion <= 0:
+            raise ValueError(f"Línea {num_linea}: llegada debe ser >= 0 y duración > 0.")
+        try:
+            self.llegada = _agregar_valor(self.llegada, llegada)
+            self.duracion = _agregar_valor(self.duracion, duracion)
+        except OverflowError:
+            raise ValueError(_fuera_de_rango(num_linea))
+        self.nombres.append(nombre if nombre else nombre_proceso(len(self.nombres)))
+
+    def tabla(self):
+        # Una sola conversión al final si solo una de las columnas pasó a flotante
+        if self.llegada.typecode != self.duracion.typecode:
+            self.llegada, self.duracion = array('d', self.llegada), array('d', self.duracion)
+        return TablaProcesos.desde_columnas(self.nombres, self.llegada, self.duracion)
+
+
+def _fuera_de_rango(num_linea):
+    return f"Línea {num_linea}: llegada y duración deben caber en un entero de 64 bits."
+
+
+def _agregar_valor(columna, valor):
+    # Una columna entera pasa a flotante (una sola conversión) con el primer valor no entero
+    if columna.typecode == 'q' and type(valor) is not int:
+        columna = array('d', columna)
+    columna.append(valor)
+    return columna
+
+
+def _numero(texto):
+    """Convierte un campo a int si es entero y a float en otro caso."""
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def leer_csv(archivo):
+    """
+    Lee procesos (nombre, llegada, duracion) desde un archivo CSV de texto abierto.
+    Las líneas sin comillas se separan con str.split (mucho más rápido que el módulo csv);
+    las que tienen comillas se pasan por csv.reader. No se admiten campos con saltos de línea.
+    Lanza ValueError con el número de línea si una fila no es válida.
+    """
+    columnas = _Columnas()
+    nombres, llegada, duracion = columnas.nombres, columnas.llegada, columnas.duracion
+    for num_linea, linea in enumerate(archivo, start=1):
+        # Caso común: tres campos enteros sin comillas
+        fila = linea.split(',')
+        if len(fila) == 3 and '"' not in linea:
+            try:
+                valor_llegada, valor_duracion = int(fila[1]), int(fila[2])
+            except ValueError:
+                pass
+            else:
+                if valor_llegada < 0 or valor_duracion <= 0:
+                    raise ValueError(f"Línea {num_linea}: llegada debe ser >= 0 y duración > 0.")
+                try:
+                    llegada.append(valor_llegada)
+                    duracion.append(valor_duracion)
+                except OverflowError:
+                    raise ValueError(_fuera_de_rango(num_linea))
+                nombres.append(fila[0].strip() or nombre_proceso(len(nombres)))
+                continue
+
+        if '"' in linea:
+            fila = next(csv.reader([linea]), [])
+        if not fila or not "".join(fila).strip() or fila[0].lstrip().startswith('#'):
+            continue
+        if len(fila) < 3:
+            raise ValueError(f"Línea {num_linea}: se esperaban 3 columnas (nombre, llegada, duracion), hay {len(fila)}.")
+        try:
+            valor_llegada, valor_duracion = _numero(fila[1]), _numero(fila[2])
+        except ValueError:
+            if not nombres: # Fila de encabezado
+                continue
+            raise ValueError(f"Línea {num_linea}: llegada y duración deben ser numéricas ('{fila[1].strip()}', '{fila[2].strip()}').")
+        columnas.agregar(num_linea, fila[0].strip(), valor_llegada, valor_duracion)
+        # agregar() puede haber convertido una columna a flotante
+        llegada, duracion = columnas.llegada, columnas.duracion
+    return columnas.tabla()
+
+
+def leer_csv_con_prioridad(archivo):
+    """
+    Lee procesos con columnas nombre, llegada, duracion, prioridad desde un archivo CSV de
+    texto abierto (encabezado opcional, '#' comenta la línea).
+    Devuelve (TablaProcesos, prioridades en array('q')), en el mismo orden.
+    Lanza ValueError con el número de línea si una fila no es válida.
+    """
+    columnas = _Columnas()
+    prioridades = array('q')
+    for num_linea, fila in enumerate(csv.reader(archivo), start=1):
+        if not fila or not "".join(fila).strip() or fila[0].lstrip().startswith('#'):
+            continue
+        if len(fila) < 4:
+            raise ValueError(f"Línea {num_linea}: se esperaban 4 columnas (nombre, llegada, duracion, prioridad), hay {len(fila)}.")
+        try:
+            valor_llegada, valor_duracion, prioridad = _numero(fila[1]), _numero(fila[2]), int(fila[3])
+        except ValueError:
+            if not columnas.nombres: # Fila de encabezado
+                continue
+            raise ValueError(f"Línea {num_linea}: llegada y duración deben ser numéricas y la prioridad un entero.")
+        if prioridad < 0:
+            raise ValueError(f"Línea {num_linea}: la prioridad debe ser >= 0.")
+        columnas.agregar(num_linea, fila[0].strip(), valor_llegada, valor_duracion)
+        prioridades.append(prioridad)
+    return columnas.tabla(), prioridades
+
+
+LINEAS_POR_LOTE_JSONL = 65536
+
+
+def leer_jsonl(archivo):
+    """
+    Lee procesos desde JSON Lines (un objeto por línea). Las líneas se decodifican por
+    lotes, como un único arreglo JSON, lo que evita una llamada a json.loads por línea;
+    si un lote falla se decodifica línea por línea para informar la línea exacta.
+    Lanza ValueError si una línea no es válida.
+    """
+    columnas = _Columnas()
+    num_linea = 0
+    lote = []
+    for linea in archivo:
+        num_linea += 1
+        if linea.strip():
+            lote.append((num_linea, linea))
+        if len(lote) >= LINEAS_POR_LOTE_JSONL:
+            _agregar_lote_jsonl(columnas, lote)
+            lote = []
+    if lote:
+        _agregar_lote_jsonl(columnas, lote)
+    return columnas.tabla()
+
+
+def _agregar_lote_jsonl(columnas, lote):
+    try:
+        objetos = json.loads("[" + ",".join(linea for _, linea in lote) + "]")
+    except ValueError:
+        objetos = None
+    if objetos is None or len(objetos) != len(lote):
+        objetos = []
+        for num_linea, linea in lote:
+            try:
+                objetos.append(json.loads(linea))
+            except ValueError as e:
+                raise ValueError(f"Línea {num_linea}: JSON no válido ({e}).")
+    nombres, llegada, duracion = columnas.nombres, columnas.llegada, columnas.duracion
+    for (num_linea, _), obj in zip(lote, objetos):
+        try:
+            valor_duracion = obj['duracion_original'] if 'duracion_original' in obj else obj['duracion']
+            valor_llegada = obj['llegada']
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Línea {num_linea}: objeto no válido (falta {e}).")
+        tipo_llegada, tipo_duracion = type(valor_llegada), type(valor_duracion)
+        nombre = obj.get('nombre')
+        if nombre is not None and type(nombre) is not str:
+            nombre = str(nombre) # Los motores comparan nombres al desempatar: deben ser texto
+        if tipo_llegada is int and tipo_duracion is int and llegada.typecode == 'q' and duracion.typecode == 'q' \
+           and valor_llegada >= 0 and valor_duracion > 0:
+            try:
+                llegada.append(valor_llegada)
+                duracion.append(valor_duracion)
+            except OverflowError:
+                raise ValueError(_fuera_de_rango(num_linea))
+            nombres.append(nombre or nombre_proceso(len(nombres)))
+            continue
+        if tipo_llegada not in (int, float) or tipo_duracion not in (int, float):
+            raise ValueError(f"Línea {num_linea}: llegada y duración deben ser numéricas.")
+        columnas.agregar(num_linea, nombre, valor_llegada, valor_duracion)
+        llegada, duracion = columnas.llegada, columnas.duracion
+
+
+def _campo_npy(datos, nombres_posibles, posicion):
+    campos = datos.dtype.names
+    for nombre in nombres_posibles:
+        if nombre in campos:
+            return datos[nombre]
+    return datos[campos[posicion]]
+
+
+def leer_npy(ruta):
+    """
+    Lee procesos desde un archivo .npy (requiere numpy). El archivo se abre con mmap y
+    cada columna se copia una sola vez a su array compacto.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ValueError("Se necesita numpy para leer archivos .npy.")
+    datos = np.load(ruta, mmap_mode='r', allow_pickle=False)
+    if datos.dtype.names:
+        if len(datos.dtype.names) < 3:
+            raise ValueError("El arreglo estructurado debe tener campos nombre, llegada y duracion.")
+        nombres = _nombres_npy(_campo_npy(datos, ('nombre', 'name'), 0))
+        llegadas = _campo_npy(datos, ('llegada', 'arrival'), 1)
+        duraciones = _campo_npy(datos, ('duracion', 'duracion_original', 'burst'), 2)
+    else:
+        if datos.ndim != 2 or datos.shape[1] < 2:
+            raise ValueError(f"Se esperaba un arreglo de forma (n, 2) con llegada y duración, no {datos.shape}.")
+        nombres = NombresProceso(datos.shape[0]) # Generados al pedirlos, sin lista de 1M cadenas
+        llegadas, duraciones = datos[:, 0], datos[:, 1]
+
+    # Validación vectorizada; se informa la primera fila incorrecta (numerada desde 1)
+    invalidas = np.flatnonzero(~(np.isfinite(llegadas) & np.isfinite(duraciones)))
+    if invalidas.size:
+        raise ValueError(f"Fila {int(invalidas[0]) + 1}: llegada y duración deben ser números finitos.")
+    invalidas = np.flatnonzero((llegadas < 0) | (duraciones <= 0))
+    if invalidas.size:
+        raise ValueError(f"Fila {int(invalidas[0]) + 1}: llegada debe ser >= 0 y duración > 0.")
+    if (llegadas.dtype.kind == 'u' and llegadas.size and llegadas.max() > INT64_MAXIMO) or \
+       (duraciones.dtype.kind == 'u' and duraciones.size and duraciones.max() > INT64_MAXIMO):
+        raise ValueError("Llegada y duración deben caber en un entero de 64 bits.")
+    # Un solo tipo para la tabla: si una columna es flotante, las dos van a array('d')
+    flotante = llegadas.dtype.kind not in 'iu' or duraciones.dtype.kind not in 'iu'
+    return TablaProcesos.desde_columnas(nombres, _columna_npy(llegadas, flotante), _columna_npy(duraciones, flotante))
+
+
+def _nombres_npy(campo):
+    # Los nombres de un campo de bytes (dtype 'S') se decodifican; str(b'A') sería "b'A'"
+    if campo.dtype.kind == 'S':
+        return [n.decode('utf-8', errors='replace') for n in campo.tolist()]
+    return [str(n) for n in campo.tolist()]
+
+
+def _columna_npy(valores, flotante):
+    import numpy as np
+    # La columna se reserva del tamaño final y se llena a través de una vista de numpy
+    # sobre su buffer: la única copia es la que lee del archivo (con la conversión de
+    # tipo y el salto entre filas, si hace falta)
+    if flotante:
+        columna, tipo = array('d', [0.0]) * len(valores), '=f8'
+    else:
+        columna, tipo = array('q', [0]) * len(valores), '=i8'
+    np.frombuffer(columna, dtype=tipo)[:] = valores
+    return columna
+
+
+def cargar_carga(ruta):
+    """
+    Carga un archivo de procesos según su extensión y devuelve la TablaProcesos.
+    Lanza ValueError (formato o fila no válida) u OSError (no se pudo leer el archivo).
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".npy":
+        return leer_npy(ruta)
+    if extension == ".jsonl":
+        with open(ruta, encoding="utf-8") as archivo:
+            return leer_jsonl(archivo)
+    if extension == ".csv":
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            return leer_csv(archivo)
+    raise ValueError(f"Formato no soportado '{extension}'. Use uno de: {', '.join(EXTENSIONES_CARGA)}.")
@@ -0,0 +1,54 @@
+import math
+from collections import namedtuple
+from statistics import NormalDist
+
+
+# Intervalo de confianza de una media: (media, margen, n); el intervalo es media ± margen
+IntervaloConfianza = namedtuple('IntervaloConfianza', 'media margen n')
+
+
+class EstadisticaEnLinea:
+    """
+    Media y varianza en una sola pasada (algoritmo de Welford), con memoria constante.
+    Dos acumuladores de partes distintas de los datos se combinan con combinar()
+    (fórmula de Chan et al.), que es como se juntan los resultados de los trabajadores.
+    """
+    __slots__ = ('n', 'media', 'm2')
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def agregar(self, valor):
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+
+    def combinar(self, otra):
+        if not otra.n:
+            return
+        if not self.n:
+            self.n, self.media, self.m2 = otra.n, otra.media, otra.m2
+            return
+        n = self.n + otra.n
+        delta = otra.media - self.media
+        self.media += delta * otra.n / n
+        self.m2 += otra.m2 + delta * delta * self.n * otra.n / n
+        self.n = n
+
+    @property
+    def varianza(self):
+        """Varianza muestral (n - 1); 0 con menos de dos valores."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def intervalo(self, confianza=0.95):
+        """
+        Intervalo de confianza de la media con la aproximación normal, adecuada para las
+        cantidades de cargas de un experimento Monte Carlo (decenas o más).
+        """
+        if not self.n:
+            return IntervaloConfianza(float('nan'), float('nan'), 0)
+        z = NormalDist().inv_cdf(0.5 + confianza / 2)
+        return IntervaloConfianza(self.media, z * math.sqrt(self.varianza / self.n), self.n)
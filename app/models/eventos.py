@@ -0,0 +1,43 @@
+from collections import namedtuple
+
+
+# Eventos que producen las simulaciones incrementales (RRController.iter_rr,
+# SRTFController.iter_srtf), en orden cronológico.
+
+# Un segmento de ejecución, emitido en cuanto el motor lo decide.
+EventoSegmento = namedtuple('EventoSegmento', 'proceso comienzo final')
+
+# Fin de un proceso, emitido justo después de su último segmento, con las métricas ya
+# calculadas (mismos nombres que las claves de los diccionarios de segmento).
+EventoFin = namedtuple('EventoFin', 'proceso llegada cpu_original finalizacion espera_final turnaround_final')
+
+
+def eventos_con_nombres(tabla, eventos_motor):
+    """
+    Traduce las tuplas (índice, comienzo, final, terminado) de ModeloRR.eventos() o
+    ModeloSRTF.eventos() a EventoSegmento / EventoFin con el nombre del proceso.
+    """
+    nombres = tabla.nombres
+    for i, comienzo, final, terminado in eventos_motor:
+        yield EventoSegmento(nombres[i], comienzo, final)
+        if terminado:
+            yield EventoFin(nombres[i], tabla.llegada[i], tabla.duracion[i],
+                            tabla.finalizacion[i], tabla.espera[i], tabla.turnaround[i])
+
+
+def fusionar_adyacentes(eventos_motor):
+    """
+    Une los segmentos (índice, comienzo, final, terminado) consecutivos del mismo proceso
+    sin hueco entre ellos en uno solo, con el `terminado` del último. Cada segmento se
+    produce cuando llega el siguiente que no se le puede unir (o al terminar).
+    """
+    pendiente = None
+    for evento in eventos_motor:
+        if pendiente is not None:
+            if evento[0] == pendiente[0] and evento[1] == pendiente[2]:
+                pendiente = (pendiente[0], pendiente[1], evento[2], evento[3])
+                continue
+            yield pendiente
+        pendiente = evento
+    if pendiente is not None:
+        yield pendiente
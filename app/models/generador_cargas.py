@@ -0,0 +1,144 @@
+"""
+Generador de cargas aleatorias para experimentos Monte Carlo.
+
+Una carga son `n` procesos con tiempos entre llegadas y ráfagas tomados de dos
+distribuciones, escritas como "tipo:parametros":
+
+    exponencial:media         Exponencial con esa media.
+    poisson:tasa              Llegadas de Poisson: entre llegadas exponenciales de media 1/tasa.
+    bimodal:corta,larga,p     'larga' con probabilidad p y 'corta' en otro caso
+                              (cada una exponencial alrededor de su media).
+    pareto:alfa,minimo        Cola pesada (Pareto): valores >= minimo; con alfa <= 2 la
+                              varianza es infinita y aparecen ráfagas muy largas. Se
+                              exige alfa > 1 (con alfa <= 1 la media es infinita).
+    uniforme:minimo,maximo    Uniforme continua.
+    fija:valor                Siempre el mismo valor.
+
+Los tiempos se redondean a enteros (las llegadas acumuladas hacia abajo, las ráfagas
+hacia arriba con mínimo 1) para que las cargas sean iguales a las que se escriben a mano.
+Cada valor muestreado se limita a TIEMPO_MAXIMO: en la cola de una distribución pesada
+un valor puede ser enorme y no cabría en las columnas de enteros de 64 bits.
+Todo sale de un random.Random con semilla, así que cada carga es reproducible.
+"""
+import math
+import random
+from array import array
+from collections import namedtuple
+
+from app.models.tabla_procesos import TablaProcesos
+from app.utils.helpers import NombresProceso
+
+
+Distribucion = namedtuple('Distribucion', 'tipo parametros')
+
+# Tope de cada ráfaga y de cada tiempo entre llegadas muestreado. Con un millón de
+# procesos, la suma de todos los tiempos sigue cabiendo en un entero de 64 bits.
+TIEMPO_MAXIMO = 10**12
+
+# tipo -> cantidad de parámetros
+_PARAMETROS = {
+    'exponencial': 1,
+    'poisson': 1,
+    'bimodal': 3,
+    'pareto': 2,
+    'uniforme': 2,
+    'fija': 1,
+}
+
+
+def interpretar_distribucion(texto):
+    """
+    Convierte "tipo:p1,p2,..." en una Distribucion validada.
+    Lanza ValueError si el tipo no existe o los parámetros no son válidos.
+    """
+    tipo, _, resto = texto.strip().partition(':')
+    tipo = tipo.strip().lower()
+    if tipo not in _PARAMETROS:
+        raise ValueError(f"Distribución '{tipo}' no soportada. Use una de: {', '.join(_PARAMETROS)}.")
+    try:
+        parametros = tuple(float(p) for p in resto.split(',')) if resto.strip() else ()
+    except ValueError:
+        raise ValueError(f"Parámetros no numéricos en '{texto.strip()}'.")
+    if not all(math.isfinite(p) for p in parametros):
+        raise ValueError(f"Los parámetros de '{texto.strip()}' deben ser números finitos.")
+    if len(parametros) != _PARAMETROS[tipo]:
+        raise ValueError(f"La distribución '{tipo}' necesita {_PARAMETROS[tipo]} parámetro(s), se dieron {len(parametros)}.")
+    if tipo == 'bimodal':
+        corta, larga, probabilidad = parametros
+        if corta <= 0 or larga <= 0 or not 0 <= probabilidad <= 1:
+            raise ValueError("bimodal: las medias deben ser > 0 y la probabilidad estar entre 0 y 1.")
+    elif tipo == 'uniforme':
+        if not 0 <= parametros[0] <= parametros[1]:
+            raise ValueError("uniforme: se necesita 0 <= minimo <= maximo.")
+    elif tipo == 'fija':
+        if parametros[0] < 0:
+            raise ValueError("fija: el valor debe ser >= 0.")
+    elif min(parametros) <= 0:
+        raise ValueError(f"{tipo}: los parámetros deben ser > 0.")
+    elif tipo == 'pareto' and parametros[0] <= 1:
+        raise ValueError("pareto: alfa debe ser > 1 (con alfa <= 1 la media es infinita).")
+    return Distribucion(tipo, parametros)
+
+
+def muestreador(distribucion, rng):
+    """Devuelve una función sin argumentos que produce valores de `distribucion` con `rng`."""
+    tipo, parametros = distribucion
+    if tipo == 'exponencial':
+        tasa = 1.0 / parametros[0]
+        return lambda: rng.expovariate(tasa)
+    if tipo == 'poisson':
+        tasa = parametros[0]
+        return lambda: rng.expovariate(tasa)
+    if tipo == 'bimodal':
+        corta, larga, probabilidad = parametros
+        tasa_corta, tasa_larga = 1.0 / corta, 1.0 / larga
+        return lambda: rng.expovariate(tasa_larga if rng.random() < probabilidad else tasa_corta)
+    if tipo == 'pareto':
+        alfa, minimo = parametros
+
+        def pareto():
+            try:
+                return minimo * rng.paretovariate(alfa)
+            except OverflowError: # Con alfa muy chico la potencia se desborda
+                return math.inf
+        return pareto
+    if tipo == 'uniforme':
+        minimo, maximo = parametros
+        return lambda: rng.uniform(minimo, maximo)
+    valor = parametros[0]
+    return lambda: valor
+
+
+def generar_carga(cantidad, llegadas, rafagas, rng, tiempo_maximo=TIEMPO_MAXIMO):
+    """
+    Genera una TablaProcesos de `cantidad` procesos: `llegadas` es la Distribucion de
+    los tiempos entre llegadas y `rafagas` la de las ráfagas de CPU. El primer proceso
+    llega en 0. Los nombres (A, B, ..., AA, ...) se generan al pedirlos.
+    Cada ráfaga y cada tiempo entre llegadas se limita a `tiempo_maximo`.
+    """
+    siguiente_hueco = muestreador(llegadas, rng)
+    siguiente_rafaga = muestreador(rafagas, rng)
+    llegada, duracion = array('q'), array('q')
+    tiempo = 0.0
+    for i in range(cantidad):
+        if i:
+            tiempo += min(siguiente_hueco(), tiempo_maximo)
+        llegada.append(int(tiempo))
+        duracion.append(max(1, math.ceil(min(siguiente_rafaga(), tiempo_maximo))))
+    return TablaProcesos.desde_columnas(NombresProceso(cantidad), llegada, duracion)
+
+
+def generar_cargas(cantidad_cargas, cantidad_procesos, llegadas, rafagas, semilla=None):
+    """
+    Generador de `cantidad_cargas` cargas independientes. La carga k usa la semilla
+    (semilla, k), así que es la misma sin importar cuántas se generen ni en qué proceso.
+    """
+    for k in range(cantidad_cargas):
+        yield generar_carga(cantidad_procesos, llegadas, rafagas, rng_de_carga(semilla, k))
+
+
+def rng_de_carga(semilla, k):
+    """random.Random de la carga k de un experimento con `semilla` (None: no reproducible)."""
+    if semilla is None:
+        return random.Random()
+    return random.Random(f"{semilla}:{k}")
@@ -0,0 +1,62 @@
+from array import array
+from collections import namedtuple
+
+
+# Métricas agregadas de una simulación completa. `procesos` cuenta todos los procesos de
+# la tabla; los promedios son sobre los que terminaron (un proceso con ráfaga 0 puede no
+# terminar nunca, y su -1 de "sin terminar" no es un tiempo).
+#   respuesta: primer comienzo - llegada
+#   cambios_contexto: veces que la CPU pasa a un proceso distinto del último que ejecutó
+#                     (volver a despachar al mismo proceso no cuenta)
+MetricasSimulacion = namedtuple('MetricasSimulacion',
+                                'procesos espera_promedio turnaround_promedio respuesta_promedio cambios_contexto segmentos')
+
+
+def medir_eventos(tabla, eventos_motor):
+    """
+    Consume el generador eventos() de un modelo (ModeloRR, ModeloSRTF) sobre `tabla` y
+    devuelve sus MetricasSimulacion, sin guardar los segmentos: solo el primer comienzo
+    de cada proceso.
+    """
+    total = len(tabla)
+    primer_comienzo = array('d', [-1.0]) * total
+    cambios_contexto = 0
+    segmentos = 0
+    anterior = -1
+    for i, comienzo, _final, _terminado in eventos_motor:
+        if i != anterior:
+            if primer_comienzo[i] < 0:
+                primer_comienzo[i] = comienzo
+            if anterior != -1:
+                cambios_contexto += 1
+            anterior = i
+        segmentos += 1
+    return resumir_tabla(tabla, primer_comienzo, cambios_contexto, segmentos)
+
+
+def resumir_tabla(tabla, primer_comienzo, cambios_contexto, segmentos):
+    """
+    MetricasSimulacion de una tabla ya simulada, a partir del primer comienzo de cada
+    proceso (-1 si nunca se ejecutó) y de los contadores que llevó quien la simuló.
+    Los promedios se toman sobre los procesos terminados (finalizacion != -1).
+    """
+    total = len(tabla)
+    if not total:
+        return MetricasSimulacion(0, 0.0, 0.0, 0.0, 0, 0)
+    finalizacion = tabla.finalizacion
+    sin_terminar = finalizacion.count(-1)
+    terminados = total - sin_terminar
+    if not terminados:
+        return MetricasSimulacion(total, 0.0, 0.0, 0.0, cambios_contexto, segmentos)
+    llegada = tabla.llegada
+    if sin_terminar:
+        indices = [i for i in range(total) if finalizacion[i] != -1]
+        espera = sum(tabla.espera[i] for i in indices)
+        turnaround = sum(tabla.turnaround[i] for i in indices)
+    else:
+        espera = sum(tabla.espera)
+        turnaround = sum(tabla.turnaround)
+    # Solo los procesos que se ejecutaron tienen tiempo de respuesta; todos ellos terminan
+    respuesta = sum(primer_comienzo[i] - llegada[i] for i in range(total) if primer_comienzo[i] >= 0)
+    return MetricasSimulacion(total, espera / terminados, turnaround / terminados,
+                              respuesta / terminados, cambios_contexto, segmentos)
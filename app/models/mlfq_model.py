@@ -0,0 +1,170 @@
+from collections import deque # Una cola FIFO por nivel, con popleft/append/appendleft en O(1)
+
+from app.models.metricas import medir_eventos
+from app.models.resultado import ResultadoSimulacion
+
+
+class ModeloMLFQ:
+    """
+    Motor de simulación de colas multinivel con retroalimentación (MLFQ) sobre una
+    TablaProcesos. El nivel 0 es el de mayor prioridad.
+
+    Reglas:
+      - Los procesos llegan al nivel 0. Se despacha el primero del nivel no vacío más alto.
+      - En el nivel k un despacho dura a lo sumo quantums[k]. El tiempo ejecutado en el
+        nivel se acumula (aunque el proceso sea expropiado) y, al completar
+        asignaciones[k] (por defecto igual a quantums[k]), el proceso baja al nivel k + 1;
+        en el último nivel vuelve al final de la misma cola (Round Robin). Si agota el
+        quantum sin completar la asignación, vuelve al final de su nivel.
+      - Una llegada expropia al proceso en ejecución si este está en un nivel inferior al 0.
+        El expropiado vuelve al frente de su nivel, sin perder lo ya acumulado.
+      - Con intervalo_boost = S, en t = S, 2S, ... todos los procesos listos suben al nivel
+        0 (en orden de nivel y, dentro de cada nivel, en su orden) y su acumulado vuelve a
+        0. Un boost corta el segmento en curso: ese proceso vuelve al final de su nivel y
+        sube con los demás.
+      - Al terminar un quantum, el proceso vuelve a la cola antes que los que llegaron
+        mientras se ejecutaba, como en ModeloRR: con un solo nivel y sin boost la
+        planificación es la misma que Round Robin con ese quantum.
+      - Los procesos con ráfaga 0 nunca se ejecutan ni terminan (como en SRTF).
+
+    Las colas guardan índices de la tabla y el nivel de un proceso es el de la cola en la
+    que está. Los niveles no vacíos se llevan en un entero usado como mapa de bits: el nivel a
+    despachar es su bit menos significativo, así que elegirlo cuesta O(1) sin recorrer
+    los niveles vacíos.
+    """
+    def __init__(self, tabla, quantums, asignaciones=None, intervalo_boost=None):
+        if asignaciones is None:
+            asignaciones = quantums
+        if not quantums or len(asignaciones) != len(quantums):
+            raise ValueError("ModeloMLFQ: debe haber al menos un nivel y una asignación por nivel.")
+        self.tabla = tabla
+        self.quantums = list(quantums)
+        self.asignaciones = list(asignaciones)
+        self.intervalo_boost = intervalo_boost
+        parametros = self.quantums + self.asignaciones + ([intervalo_boost] if intervalo_boost is not None else [])
+        if any(type(valor) is not int for valor in parametros):
+            tabla.usar_listas() # Los tiempos flotantes no caben en array('q')
+
+    def simular(self):
+        """
+        Ejecuta la simulación completa.
+
+        Returns:
+            ResultadoSimulacion: Segmentos de ejecución en columnas, en orden cronológico,
+                  con el mismo formato que los de ModeloRR.
+        """
+        resultado = ResultadoSimulacion(self.tabla)
+        agregar = resultado.agregar
+        for idx_proceso, comienzo, final, _terminado in self.eventos():
+            agregar(idx_proceso, comienzo, final)
+        return resultado
+
+    def metricas(self):
+        """MetricasSimulacion de la planificación; los segmentos se cuentan sin guardarlos."""
+        return medir_eventos(self.tabla, self.eventos())
+
+    def eventos(self):
+        """
+        Generador de (índice de proceso, comienzo, final, terminado), uno por segmento,
+        como ModeloRR.eventos(). La memoria extra son las colas de los niveles y el tiempo
+        acumulado de cada proceso en su nivel.
+        """
+        tabla = self.tabla
+        llegada = tabla.llegada
+        restante = tabla.restante
+        completar = tabla.completar
+        quantums = self.quantums
+        asignaciones = self.asignaciones
+        intervalo_boost = self.intervalo_boost
+        ultimo_nivel = len(quantums) - 1
+        total_procesos = len(tabla)
+
+        orden_llegada = sorted((i for i in range(total_procesos) if restante[i] > 0),
+                               key=llegada.__getitem__)
+        total_llegadas = len(orden_llegada)
+        idx_proxima_llegada = 0
+
+        colas = [deque() for _ in quantums]
+        cola_superior = colas[0]
+        ocupados = 0 # Bit k encendido <=> colas[k] no está vacía
+        acumulado = [0] * total_procesos # Tiempo ejecutado en el nivel actual
+        indice_boost = 1 # proximo_boost = indice_boost * intervalo_boost, sin sumas acumuladas
+        proximo_boost = intervalo_boost
+        tiempo_actual = 0
+
+        while True:
+            if proximo_boost is not None and proximo_boost <= tiempo_actual:
+                # Primer múltiplo posterior a tiempo_actual, en O(1) aunque la CPU haya estado
+                # ociosa muchos intervalos (esos boosts no cambian nada); el bucle solo
+                # corrige el redondeo de la división flotante
+                indice_boost = max(indice_boost + 1, int(tiempo_actual // intervalo_boost))
+                proximo_boost = indice_boost * intervalo_boost
+                while proximo_boost <= tiempo_actual:
+                    indice_boost += 1
+                    proximo_boost = indice_boost * intervalo_boost
+                if ocupados:
+                    inferiores = ocupados & ~1 # Solo los niveles no vacíos, en orden
+                    while inferiores:
+                        k = (inferiores & -inferiores).bit_length() - 1
+                        cola_superior.extend(colas[k])
+                        colas[k].clear()
+                        inferiores &= inferiores - 1
+                    for i in cola_superior:
+                        acumulado[i] = 0
+                    ocupados = 1
+
+            # Las llegadas entran al nivel 0
+            while idx_proxima_llegada < total_llegadas and \
+                  llegada[orden_llegada[idx_proxima_llegada]] <= tiempo_actual:
+                i = orden_llegada[idx_proxima_llegada]
+                cola_superior.append(i)
+                ocupados |= 1
+                idx_proxima_llegada += 1
+
+            if not ocupados:
+                if idx_proxima_llegada >= total_llegadas:
+                    break
+                tiempo_actual = llegada[orden_llegada[idx_proxima_llegada]] # CPU ociosa
+                continue
+
+            nivel_actual = (ocupados & -ocupados).bit_length() - 1 # Bit encendido más bajo
+            cola = colas[nivel_actual]
+            idx_actual = cola.popleft()
+            if not cola:
+                ocupados &= ~(1 << nivel_actual)
+
+            resto_asignacion = asignaciones[nivel_actual] - acumulado[idx_actual]
+            rebanada = min(restante[idx_actual], quantums[nivel_actual], resto_asignacion)
+            fin = tiempo_actual + rebanada
+            corte = fin
+            # Solo una llegada (al nivel 0) puede expropiar a un proceso de un nivel inferior
+            if nivel_actual and idx_proxima_llegada < total_llegadas and \
+               llegada[orden_llegada[idx_proxima_llegada]] < corte:
+                corte = llegada[orden_llegada[idx_proxima_llegada]]
+            if proximo_boost is not None and proximo_boost < corte:
+                corte = proximo_boost
+
+            comienzo = tiempo_actual
+            tiempo_actual = corte
+            if corte == fin and rebanada == restante[idx_actual]:
+                restante[idx_actual] = 0
+                completar(idx_actual, fin)
+                yield idx_actual, comienzo, fin, True
+                continue
+
+            ejecutado = rebanada if corte == fin else corte - comienzo
+            restante[idx_actual] -= ejecutado
+            acumulado[idx_actual] += ejecutado
+            yield idx_actual, comienzo, corte, False
+
+            if corte == fin: # Agotó el quantum o la asignación del nivel
+                if rebanada == resto_asignacion: # Comparación exacta, sin sumas flotantes acumuladas
+                    acumulado[idx_actual] = 0
+                    if nivel_actual < ultimo_nivel:
+                        nivel_actual += 1
+                colas[nivel_actual].append(idx_actual)
+            elif proximo_boost is not None and corte == proximo_boost:
+                colas[nivel_actual].append(idx_actual) # Sube con los demás en el boost
+            else: # Expropiado por una llegada
+                colas[nivel_actual].appendleft(idx_actual)
+            ocupados |= 1 << nivel_actual
@@ -0,0 +1,258 @@
+"""
+Motor vectorizado (NumPy) para simular muchas cargas independientes a la vez.
+
+Pensado para barridos de parámetros sobre cargas pequeñas (decenas de procesos)
+repetidas miles o millones de veces, donde el costo por llamada de los motores
+escalares (crear la tabla, el heap o la cola, un segmento por iteración) domina.
+Aquí las cargas son filas de dos matrices (lotes, n) de llegadas y ráfagas y todas
+avanzan juntas: cada paso del bucle decide un segmento de cada carga activa con
+operaciones sobre columnas, sin objetos de Python por proceso ni por segmento.
+
+Las reglas son las de ModeloSRTF y ModeloRR, así que las métricas coinciden con las
+de medir_eventos sobre los motores escalares:
+    SRTF: el listo de menor (restante, llegada, desempate); el segmento se corta en
+          cada llegada.
+    RR:   cola FIFO; el proceso expropiado vuelve a la cola antes de los que llegaron
+          mientras se ejecutaba.
+Las ráfagas 0 también siguen a los motores escalares: en SRTF nunca se ejecutan; en RR
+producen un segmento de duración 0 si llegan con la CPU ociosa y, si llegan mientras
+otro se ejecuta, no entran a la cola. Los que no terminan quedan en NaN.
+La cola de RR no se guarda como lista: cada proceso encolado tiene una clave
+creciente de orden de entrada y el siguiente en salir es el de menor clave.
+
+Los tiempos se calculan en float64 (exactos para enteros de hasta 2**53). El lote se
+simula por bloques de FILAS_POR_BLOQUE cargas, y dentro de cada bloque las cargas que
+terminan se quitan del estado cuando son al menos la mitad, para que las más largas
+no arrastren a las ya resueltas.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+
+# Resultado de un lote de cargas:
+#   finalizacion, espera, turnaround, respuesta: matrices (lotes, n) por proceso (NaN si
+#                   el proceso no terminó o no se ejecutó).
+#   espera_promedio, turnaround_promedio, respuesta_promedio: vectores (lotes,), sobre los
+#                   procesos terminados como en MetricasSimulacion.
+#   cambios_contexto, segmentos: vectores (lotes,) de enteros, como en MetricasSimulacion.
+MetricasLote = namedtuple('MetricasLote',
+                          'finalizacion espera turnaround respuesta '
+                          'espera_promedio turnaround_promedio respuesta_promedio cambios_contexto segmentos')
+
+_FUERA_DE_COLA = np.iinfo(np.int64).max # Clave de RR de un proceso que no está en la cola
+FILAS_POR_BLOQUE = 4096 # Cargas simuladas juntas en cada pasada
+
+
+def _preparar(llegadas, rafagas, desempate):
+    """Valida las matrices de entrada y devuelve copias float64 (lotes, n) y el desempate entero."""
+    llegada = np.array(llegadas, dtype=np.float64, ndmin=2)
+    duracion = np.array(rafagas, dtype=np.float64, ndmin=2)
+    if llegada.ndim != 2 or llegada.shape != duracion.shape:
+        raise ValueError("Las llegadas y las ráfagas deben ser matrices (lotes, procesos) de la misma forma.")
+    if (llegada < 0).any() or not np.isfinite(llegada).all():
+        raise ValueError("Las llegadas deben ser finitas y >= 0.")
+    if (duracion < 0).any() or not np.isfinite(duracion).all():
+        raise ValueError("Las ráfagas deben ser finitas y >= 0.")
+    if desempate is None:
+        desempate = np.arange(llegada.shape[1], dtype=np.int64)
+    desempate = np.broadcast_to(np.asarray(desempate, dtype=np.int64), llegada.shape)
+    return llegada, duracion, desempate
+
+
+def orden_de_nombres(nombres):
+    """
+    Rango de cada nombre en orden alfabético, para usar como desempate: el mismo orden
+    que el campo 'nombre' del heap de ModeloSRTF ("AA" va antes que "B").
+    """
+    rango = np.empty(len(nombres), dtype=np.int64)
+    rango[sorted(range(len(nombres)), key=nombres.__getitem__)] = np.arange(len(nombres))
+    return rango
+
+
+def _metricas(llegada, duracion, finalizacion, primer_comienzo, cambios_contexto, segmentos):
+    turnaround = finalizacion - llegada
+    espera = turnaround - duracion
+    respuesta = primer_comienzo - llegada
+    # Como resumir_tabla: promedios sobre los procesos terminados (los demás quedan en NaN)
+    terminado = ~np.isnan(finalizacion)
+    terminados = terminado.sum(axis=1)
+    divisor = np.maximum(terminados, 1)
+    return MetricasLote(finalizacion, espera, turnaround, respuesta,
+                        np.where(terminado, espera, 0.0).sum(axis=1) / divisor,
+                        np.where(terminado, turnaround, 0.0).sum(axis=1) / divisor,
+                        np.where(np.isnan(respuesta), 0.0, respuesta).sum(axis=1) / divisor,
+                        cambios_contexto, segmentos)
+
+
+def simular_srtf_lote(llegadas, rafagas, desempate=None):
+    """
+    Simula SRTF sobre cada fila de las matrices (lotes, n) `llegadas` y `rafagas`.
+    `desempate` (n,) o (lotes, n) ordena los empates de restante y llegada; por defecto
+    el índice (ver orden_de_nombres para reproducir el orden por nombre del motor escalar).
+    Devuelve una MetricasLote. Lanza ValueError si las matrices no son válidas.
+    """
+    llegada, duracion, desempate = _preparar(llegadas, rafagas, desempate)
+    return _simular_por_bloques(_srtf_bloque, llegada, duracion, desempate)
+
+
+def _simular_por_bloques(simular_bloque, llegada, duracion, *extra):
+    """
+    Reserva las salidas y simula de a FILAS_POR_BLOQUE cargas: el estado de un bloque
+    cabe en la caché y la memoria temporal no crece con el tamaño del lote.
+    """
+    lotes, n = llegada.shape
+    finalizacion = np.full((lotes, n), np.nan)
+    primer_comienzo = np.full((lotes, n), np.nan)
+    cambios_contexto = np.zeros(lotes, dtype=np.int64)
+    segmentos = np.zeros(lotes, dtype=np.int64)
+    for desde in range(0, lotes, FILAS_POR_BLOQUE):
+        bloque = slice(desde, desde + FILAS_POR_BLOQUE)
+        simular_bloque(llegada[bloque], duracion[bloque], finalizacion[bloque], primer_comienzo[bloque],
+                       cambios_contexto[bloque], segmentos[bloque], *(arreglo[bloque] for arreglo in extra))
+    return _metricas(llegada, duracion, finalizacion, primer_comienzo, cambios_contexto, segmentos)
+
+
+def _srtf_bloque(llegada, duracion, finalizacion, primer_comienzo, cambios_contexto, segmentos, desempate):
+    """Simula SRTF en un bloque de cargas; escribe en las vistas de salida que recibe."""
+    lotes, n = llegada.shape
+    # Estado de las cargas activas; `filas` es su fila en las matrices de salida
+    filas = np.arange(lotes)
+    restante = duracion.copy()
+    tiempo = np.zeros(lotes)
+    anterior = np.full(lotes, -1)
+    pendientes = (duracion > 0).sum(axis=1) # Las ráfagas 0 nunca terminan
+
+    while filas.size:
+        activas = pendientes > 0
+        if activas.sum() * 2 <= filas.size:
+            filas, llegada, restante, desempate, tiempo, anterior, pendientes = (
+                arreglo[activas] for arreglo in (filas, llegada, restante, desempate, tiempo, anterior, pendientes))
+            if not filas.size:
+                break
+
+        vivos = restante > 0
+        listos = vivos & (llegada <= tiempo[:, None])
+        proxima_llegada = np.where(vivos & ~listos, llegada, np.inf).min(axis=1)
+        hay_listos = listos.any(axis=1)
+        # Mínimo lexicográfico (restante, llegada, desempate) entre los listos. Se calcula
+        # en todas las filas (sin extraer las que tienen listos) y se descarta donde no hay.
+        restante_listos = np.where(listos, restante, np.inf)
+        candidatos = restante_listos == restante_listos.min(axis=1)[:, None]
+        llegada_candidatos = np.where(candidatos, llegada, np.inf)
+        candidatos &= llegada_candidatos == llegada_candidatos.min(axis=1)[:, None]
+        actual = np.where(candidatos, desempate, _FUERA_DE_COLA).argmin(axis=1)
+
+        todas = np.arange(filas.size)
+        inicio = tiempo
+        pendiente = restante[todas, actual]
+        # Igual que el motor escalar: el segmento solo se corta si la llegada cae antes del final
+        duracion_segmento = np.where(proxima_llegada < inicio + pendiente, proxima_llegada - inicio, pendiente)
+        final = inicio + duracion_segmento
+        restante[todas, actual] = np.where(hay_listos, pendiente - duracion_segmento, pendiente)
+        # CPU ociosa: saltar a la próxima llegada (las cargas ya terminadas no se mueven)
+        tiempo = np.where(hay_listos, final, np.where(pendientes > 0, proxima_llegada, tiempo))
+
+        k = np.flatnonzero(hay_listos)
+        actual, inicio, final = actual[k], inicio[k], final[k]
+        filas_k = filas[k]
+        nuevos = np.isnan(primer_comienzo[filas_k, actual])
+        primer_comienzo[filas_k[nuevos], actual[nuevos]] = inicio[nuevos]
+        cambios_contexto[filas_k] += (anterior[k] != actual) & (anterior[k] != -1)
+        anterior[k] = actual
+        segmentos[filas_k] += 1
+        terminados = restante[k, actual] <= 0
+        finalizacion[filas_k[terminados], actual[terminados]] = final[terminados]
+        pendientes[k[terminados]] -= 1
+
+
+def simular_rr_lote(llegadas, rafagas, quantum):
+    """
+    Simula Round Robin con `quantum` sobre cada fila de las matrices (lotes, n)
+    `llegadas` y `rafagas`. Los empates de llegada se resuelven por índice (orden
+    estable, como ModeloRR). Devuelve una MetricasLote.
+    Lanza ValueError si las matrices no son válidas o el quantum no es > 0.
+    """
+    if not quantum > 0:
+        raise ValueError("El quantum debe ser mayor que 0.")
+    llegada, duracion, _desempate = _preparar(llegadas, rafagas, None)
+    return _simular_por_bloques(
+        lambda *bloque: _rr_bloque(*bloque, quantum), llegada, duracion)
+
+
+def _rr_bloque(llegada, duracion, finalizacion, primer_comienzo, cambios_contexto, segmentos, quantum):
+    """Simula Round Robin en un bloque de cargas; escribe en las vistas de salida que recibe."""
+    lotes, n = llegada.shape
+    # Llegadas ordenadas por fila y posición de cada proceso en ese orden
+    orden = np.argsort(llegada, axis=1, kind='stable')
+    llegada_ordenada = np.take_along_axis(llegada, orden, axis=1)
+    posicion = np.empty((lotes, n), dtype=np.int64)
+    np.put_along_axis(posicion, orden, np.arange(n, dtype=np.int64)[None, :], axis=1)
+
+    filas = np.arange(lotes)
+    restante = duracion.copy()
+    tiempo = np.zeros(lotes)
+    anterior = np.full(lotes, -1)
+    pendientes = np.full(lotes, n)
+    clave = np.full((lotes, n), _FUERA_DE_COLA) # Orden de entrada a la cola de listos
+    siguiente_clave = np.zeros(lotes, dtype=np.int64)
+    cursor = np.zeros(lotes, dtype=np.int64) # Llegadas ya encoladas
+
+    def encolar_llegadas(ejecutaron=None):
+        # Los que llegaron hasta `tiempo` entran al final de la cola, en orden de llegada.
+        # En las cargas que acaban de ejecutar un segmento (`ejecutaron`) las ráfagas 0 no
+        # entran, como en ModeloRR: nunca terminan, así que dejan de contar como pendientes
+        nonlocal clave, siguiente_clave, cursor
+        nuevo_cursor = (llegada_ordenada <= tiempo[:, None]).sum(axis=1)
+        entran = (posicion >= cursor[:, None]) & (posicion < nuevo_cursor[:, None])
+        if ejecutaron is not None:
+            descartadas = entran & ejecutaron[:, None] & (restante <= 0)
+            pendientes[:] -= descartadas.sum(axis=1)
+            entran &= ~descartadas
+        clave = np.where(entran, (siguiente_clave - cursor)[:, None] + posicion, clave)
+        siguiente_clave = siguiente_clave + (nuevo_cursor - cursor)
+        cursor = nuevo_cursor
+
+    encolar_llegadas()
+    while filas.size:
+        activas = pendientes > 0
+        if activas.sum() * 2 <= filas.size:
+            (filas, llegada_ordenada, posicion, restante, clave, siguiente_clave, cursor,
+             tiempo, anterior, pendientes) = (
+                arreglo[activas] for arreglo in (filas, llegada_ordenada, posicion, restante, clave,
+                                                 siguiente_clave, cursor, tiempo, anterior, pendientes))
+            if not filas.size:
+                break
+
+        cabeza = clave.argmin(axis=1)
+        hay_listos = clave[np.arange(filas.size), cabeza] != _FUERA_DE_COLA
+        # CPU ociosa con procesos por llegar: saltar a la próxima llegada
+        ociosas = np.flatnonzero(~hay_listos & (cursor < n))
+        tiempo[ociosas] = llegada_ordenada[ociosas, cursor[ociosas]]
+
+        k = np.flatnonzero(hay_listos)
+        actual = cabeza[k]
+        clave[k, actual] = _FUERA_DE_COLA
+        inicio = tiempo[k]
+        pendiente = restante[k, actual]
+        pendiente_nuevo = pendiente - np.minimum(pendiente, quantum)
+        final = inicio + np.minimum(pendiente, quantum)
+        restante[k, actual] = pendiente_nuevo
+        tiempo[k] = final
+
+        # El expropiado vuelve a la cola antes que los que llegaron durante su quantum
+        siguen = pendiente_nuevo > 0
+        k_siguen = k[siguen]
+        clave[k_siguen, actual[siguen]] = siguiente_clave[k_siguen]
+        siguiente_clave[k_siguen] += 1
+        encolar_llegadas(hay_listos)
+
+        filas_k = filas[k]
+        nuevos = np.isnan(primer_comienzo[filas_k, actual])
+        primer_comienzo[filas_k[nuevos], actual[nuevos]] = inicio[nuevos]
+        cambios_contexto[filas_k] += (anterior[k] != actual) & (anterior[k] != -1)
+        anterior[k] = actual
+        segmentos[filas_k] += 1
+        terminados = ~siguen
+        finalizacion[filas_k[terminados], actual[terminados]] = final[terminados]
+        pendientes[k[terminados]] -= 1
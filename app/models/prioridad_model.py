@@ -0,0 +1,168 @@
+import heapq # Cola de listos como min-heap de claves enteras
+from collections import deque # Agenda de envejecimientos, ya ordenada por tiempo
+
+from app.models.metricas import medir_eventos
+from app.models.resultado import ResultadoSimulacion
+
+
+class ModeloPrioridad:
+    """
+    Motor de planificación por prioridades expropiativo sobre una TablaProcesos, con
+    envejecimiento opcional. Menor número = más prioridad (0 es la máxima).
+
+    Reglas:
+      - Se ejecuta el listo de menor prioridad efectiva; los empates se resuelven por
+        llegada, nombre y orden de entrada, como en SRTF.
+      - Un proceso expropia al que está en ejecución solo si su prioridad efectiva es
+        estrictamente mejor. El segmento se corta solo cuando hay expropiación o el proceso termina.
+      - Con `envejecimiento` = E, cada E unidades de espera continua en la cola de listos
+        la prioridad efectiva mejora en 1, hasta 0. Mientras se ejecuta, un proceso conserva
+        la prioridad con la que fue despachado; si es expropiado vuelve a la cola con su
+        prioridad base y empieza a envejecer de nuevo.
+      - Los procesos con ráfaga 0 nunca se ejecutan ni terminan (como en SRTF).
+
+    La cola de listos es un min-heap (heapq) de claves enteras prioridad * n + rango,
+    donde el rango es la posición del proceso en el orden de desempate: la clave identifica
+    al proceso (rango = clave % n) y `clave[i]` guarda la clave vigente de cada uno (-1 si
+    no está en la cola). Envejecer es bajar la clave en n y empujar la nueva entrada, en
+    O(log n); la entrada anterior queda obsoleta y se descarta cuando llega al tope. Así
+    nunca se recorre la cola para envejecer. Los envejecimientos pendientes están en una
+    agenda con una versión por proceso, que se invalida al despacharlo. Cada
+    envejecimiento se programa para (ahora + E) y los vigentes se aplican justo en su
+    tiempo, así que la agenda se llena en orden y basta una cola FIFO (deque).
+    """
+    def __init__(self, tabla, prioridades, envejecimiento=None):
+        if len(prioridades) != len(tabla):
+            raise ValueError("ModeloPrioridad: debe haber una prioridad por proceso.")
+        self.tabla = tabla
+        self.prioridades = prioridades
+        self.envejecimiento = envejecimiento
+        if envejecimiento is not None and type(envejecimiento) is not int:
+            tabla.usar_listas() # Los tiempos de envejecimiento flotantes no caben en array('q')
+
+    def simular(self):
+        """
+        Ejecuta la simulación completa.
+
+        Returns:
+            ResultadoSimulacion: Segmentos de ejecución en columnas, en orden cronológico,
+                  con el mismo formato que los de ModeloRR y ModeloSRTF.
+        """
+        resultado = ResultadoSimulacion(self.tabla)
+        agregar = resultado.agregar
+        for idx_proceso, comienzo, final, _terminado in self.eventos():
+            agregar(idx_proceso, comienzo, final)
+        return resultado
+
+    def metricas(self):
+        """MetricasSimulacion de la planificación; los segmentos se cuentan sin guardarlos."""
+        return medir_eventos(self.tabla, self.eventos())
+
+    def eventos(self):
+        """
+        Generador de (índice de proceso, comienzo, final, terminado), uno por segmento,
+        como ModeloSRTF.eventos(). La memoria extra es la cola de listos y la agenda de
+        envejecimientos (a lo sumo una entrada vigente por proceso en espera).
+        """
+        tabla = self.tabla
+        nombres = tabla.nombres
+        llegada = tabla.llegada
+        restante = tabla.restante
+        completar = tabla.completar
+        base = self.prioridades
+        envejecimiento = self.envejecimiento
+        total_procesos = len(tabla)
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        orden_llegada = sorted((i for i in range(total_procesos) if restante[i] > 0),
+                               key=llegada.__getitem__)
+        total_llegadas = len(orden_llegada)
+        # Rango de desempate (llegada, nombre, índice): la clave del heap es un solo entero
+        por_rango = sorted(orden_llegada, key=lambda i: (llegada[i], nombres[i]))
+        rango = [0] * total_procesos
+        for posicion, i in enumerate(por_rango):
+            rango[i] = posicion
+        escala = total_procesos
+
+        cola_listos = [] # Claves; una entrada es vigente si es la clave actual de su proceso
+        clave = [-1] * total_procesos
+        efectiva = list(base)
+        agenda = deque() # Envejecimientos pendientes: (tiempo, índice, versión)
+        version = [0] * total_procesos
+
+        idx_proxima_llegada = 0
+        tiempo_actual = 0
+        actual = -1
+        inicio_segmento = 0
+
+        while True:
+            # Encolar las llegadas hasta tiempo_actual, con su prioridad base
+            while idx_proxima_llegada < total_llegadas and \
+                  llegada[orden_llegada[idx_proxima_llegada]] <= tiempo_actual:
+                i = orden_llegada[idx_proxima_llegada]
+                idx_proxima_llegada += 1
+                efectiva[i] = base[i]
+                clave[i] = base[i] * escala + rango[i]
+                heappush(cola_listos, clave[i])
+                if envejecimiento is not None and base[i] > 0:
+                    agenda.append((tiempo_actual + envejecimiento, i, version[i]))
+
+            # Aplicar los envejecimientos vencidos (los de procesos ya despachados se descartan)
+            while agenda and agenda[0][0] <= tiempo_actual:
+                tiempo_envejecimiento, i, version_i = agenda.popleft()
+                if version_i != version[i]:
+                    continue
+                efectiva[i] -= 1
+                clave[i] -= escala
+                heappush(cola_listos, clave[i])
+                if efectiva[i] > 0:
+                    agenda.append((tiempo_envejecimiento + envejecimiento, i, version_i))
+
+            # Descartar las entradas obsoletas del tope de la cola de listos
+            while cola_listos and clave[por_rango[cola_listos[0] % escala]] != cola_listos[0]:
+                heappop(cola_listos)
+
+            # Expropiación: solo si el mejor listo tiene prioridad estrictamente mejor
+            if actual != -1 and cola_listos and cola_listos[0] // escala < efectiva[actual]:
+                yield actual, inicio_segmento, tiempo_actual, False
+                efectiva[actual] = base[actual]
+                clave[actual] = base[actual] * escala + rango[actual]
+                heappush(cola_listos, clave[actual])
+                if envejecimiento is not None and base[actual] > 0:
+                    agenda.append((tiempo_actual + envejecimiento, actual, version[actual]))
+                actual = -1
+                while clave[por_rango[cola_listos[0] % escala]] != cola_listos[0]:
+                    heappop(cola_listos)
+
+            if actual == -1:
+                if not cola_listos:
+                    if idx_proxima_llegada >= total_llegadas:
+                        break
+                    tiempo_actual = llegada[orden_llegada[idx_proxima_llegada]] # CPU ociosa
+                    continue
+                actual = por_rango[heappop(cola_listos) % escala]
+                clave[actual] = -1
+                version[actual] += 1 # Sus envejecimientos pendientes quedan obsoletos
+                inicio_segmento = tiempo_actual
+
+            # Próximo evento: fin del proceso, próxima llegada o próximo envejecimiento vigente
+            fin = tiempo_actual + restante[actual]
+            proximo = fin
+            if idx_proxima_llegada < total_llegadas:
+                llegada_siguiente = llegada[orden_llegada[idx_proxima_llegada]]
+                if llegada_siguiente < proximo:
+                    proximo = llegada_siguiente
+            while agenda and agenda[0][2] != version[agenda[0][1]]:
+                agenda.popleft()
+            if agenda and agenda[0][0] < proximo:
+                proximo = agenda[0][0]
+
+            if proximo == fin:
+                restante[actual] = 0
+                tiempo_actual = fin
+                completar(actual, fin)
+                yield actual, inicio_segmento, fin, True
+                actual = -1
+            else:
+                restante[actual] -= proximo - tiempo_actual
+                tiempo_actual = proximo
@@ -0,0 +1,103 @@
+from array import array # Columnas compactas para los segmentos del Gantt
+from collections.abc import Sequence
+from itertools import accumulate
+
+
+class ResultadoSimulacion(Sequence):
+    """
+    Resultado columnar de una simulación: tres columnas paralelas (índice de proceso,
+    comienzo y final) con un elemento por segmento de ejecución, más la TablaProcesos
+    de la que salen las métricas por proceso.
+
+    Se comporta como una secuencia de solo lectura de los diccionarios de segmento que
+    devuelven los controladores ('proceso', 'llegada', 'cpu_original', 'comienzo', 'final',
+    'espera_final', 'turnaround_final'), pero cada diccionario se construye solo cuando
+    se pide; así ResultsView puede recorrerlo sin que la simulación materialice la lista.
+    """
+    __slots__ = ('tabla', 'indices', 'comienzos', 'finales', '_por_proceso')
+
+    def __init__(self, tabla):
+        self.tabla = tabla
+        self.indices = array('i')
+        self._por_proceso = None # Caché de indice_por_proceso(): (segmentos al calcularlo, inicios, posiciones)
+        # Las columnas de tiempo usan el mismo tipo que la columna de finalización
+        # de la tabla (array('q'), array('d') o lista si los tipos se mezclan).
+        finalizacion = tabla.finalizacion
+        if isinstance(finalizacion, array):
+            self.comienzos = array(finalizacion.typecode)
+            self.finales = array(finalizacion.typecode)
+        else:
+            self.comienzos = []
+            self.finales = []
+
+    def agregar(self, indice_proceso, comienzo, final):
+        self.indices.append(indice_proceso)
+        self.comienzos.append(comienzo)
+        self.finales.append(final)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self._segmento(j) for j in range(*k.indices(len(self.indices)))]
+        if k < 0:
+            k += len(self.indices)
+        if not 0 <= k < len(self.indices):
+            raise IndexError("ResultadoSimulacion: índice de segmento fuera de rango")
+        return self._segmento(k)
+
+    def __iter__(self):
+        for k in range(len(self.indices)):
+            yield self._segmento(k)
+
+    def metricas(self, i):
+        """
+        Devuelve (espera, turnaround) del proceso i tal como se calcularon al terminar,
+        o "No Term." si no terminó. No recorre segmentos: es una lectura por índice.
+        """
+        tabla = self.tabla
+        if tabla.finalizacion[i] == -1: # No debería pasar si la simulación terminó todos los procesos
+            return "No Term.", "No Term."
+        return tabla.espera[i], tabla.turnaround[i]
+
+    def indice_por_proceso(self):
+        """
+        Devuelve (inicios, posiciones): las posiciones de segmento del proceso i, en orden
+        cronológico, son posiciones[inicios[i]:inicios[i + 1]]. Se calcula una vez (un
+        conteo y un ordenamiento estable) y se reutiliza mientras no se agreguen segmentos.
+        """
+        total = len(self.indices)
+        if self._por_proceso is None or self._por_proceso[0] != total:
+            conteos = [0] * (len(self.tabla) + 1)
+            for i in self.indices:
+                conteos[i + 1] += 1
+            inicios = array('i', accumulate(conteos))
+            posiciones = array('i', sorted(range(total), key=self.indices.__getitem__))
+            self._por_proceso = (total, inicios, posiciones)
+        return self._por_proceso[1], self._por_proceso[2]
+
+    def tiempos_de_proceso(self, i):
+        """Devuelve (comienzos, finales) de los segmentos del proceso i, en orden cronológico."""
+        inicios, posiciones = self.indice_por_proceso()
+        propias = posiciones[inicios[i]:inicios[i + 1]]
+        comienzos, finales = self.comienzos, self.finales
+        return [comienzos[k] for k in propias], [finales[k] for k in propias]
+
+    def _segmento(self, k):
+        tabla = self.tabla
+        i = self.indices[k]
+        espera, turnaround = self.metricas(i)
+        return {
+            'proceso': tabla.nombres[i],
+            'llegada': tabla.llegada[i],
+            'cpu_original': tabla.duracion[i],
+            'comienzo': self.comienzos[k],
+            'final': self.finales[k],
+            'espera_final': espera,
+            'turnaround_final': turnaround
+        }
+
+    def a_dicts(self):
+        """Materializa la lista de diccionarios de segmento (formato de salida clásico)."""
+        return list(self)
@@ -0,0 +1,255 @@
+from array import array
+from collections import deque # Cola de listos con popleft/append en O(1)
+
+from app.models.eventos import fusionar_adyacentes
+from app.models.metricas import resumir_tabla
+from app.models.resultado import ResultadoSimulacion
+
+
+class ModeloRR:
+    """
+    Motor de simulación Round Robin sobre una TablaProcesos.
+    Trabaja solo con índices de la tabla; la conversión a diccionarios la hace RRController.
+
+    Cuando el proceso que sale de la cola es el único listo, su racha de quantums hasta
+    terminar o hasta la próxima llegada se resuelve en un solo paso, sin volver a
+    encolarlo ni revisar llegadas en cada quantum. Con fusionar_segmentos=True los
+    segmentos consecutivos del mismo proceso (sin hueco entre ellos) salen como uno solo;
+    si no, se produce un segmento por quantum, como siempre.
+    """
+    def __init__(self, tabla, quantum, fusionar_segmentos=False):
+        self.tabla = tabla
+        self.quantum = quantum
+        self.fusionar_segmentos = fusionar_segmentos
+        if type(quantum) is not int:
+            tabla.usar_listas() # Un quantum no entero produce tiempos que array('q') no admite
+
+    def simular(self):
+        """
+        Ejecuta la simulación completa.
+
+        Returns:
+            ResultadoSimulacion: Segmentos de ejecución en columnas (índice de proceso,
+                  comienzo, final), en orden cronológico. Actualiza las columnas
+                  'restante', 'finalizacion', 'espera' y 'turnaround' de la tabla.
+        """
+        resultado = ResultadoSimulacion(self.tabla)
+        agregar_indice = resultado.indices.append
+        agregar_comienzo = resultado.comienzos.append
+        agregar_final = resultado.finales.append
+        for idx_proceso, comienzo, final, _terminado in self.eventos():
+            agregar_indice(idx_proceso)
+            agregar_comienzo(comienzo)
+            agregar_final(final)
+        return resultado
+
+    def eventos(self):
+        """
+        Generador con la simulación paso a paso: produce una tupla
+        (índice de proceso, comienzo, final, terminado) por cada segmento, en cuanto se
+        decide. Si `terminado` es True el proceso acabó en ese segmento y sus métricas ya
+        están en la tabla (finalizacion, espera, turnaround). No guarda los segmentos: la
+        memoria extra es la cola de listos más el orden de llegada.
+        Con fusionar_segmentos cada segmento sale cuando empieza el siguiente de otro proceso.
+        """
+        if self.fusionar_segmentos:
+            return fusionar_adyacentes(self._eventos())
+        return self._eventos()
+
+    def _rachas_enteras(self):
+        # La racha en solitario se calcula en forma cerrada solo con tiempos enteros; con
+        # flotantes se suman los quantums uno a uno, en el mismo orden que quantum a quantum
+        return type(self.quantum) is int and all(
+            isinstance(columna, array) and columna.typecode == 'q'
+            for columna in (self.tabla.llegada, self.tabla.restante))
+
+    def _racha_en_solitario(self, tiempo, pendiente, proxima_llegada, enteros):
+        """
+        Quantums completos que el proceso, solo en la CPU desde `tiempo` con `pendiente`
+        de ráfaga, ejecuta antes del quantum en el que termina o en el que llega el
+        siguiente (`proxima_llegada`, None si no quedan). Mientras nadie llega vuelve a
+        la cabeza de la cola vacía, así que esos quantums no dependen de nadie más.
+
+        Returns:
+            tuple: (quantums, tiempo, pendiente) tras la racha; el quantum siguiente se
+                   simula por el camino normal.
+        """
+        quantum = self.quantum
+        if enteros:
+            quantums = -(-pendiente // quantum) - 1
+            if proxima_llegada is not None:
+                quantums = min(quantums, -(-(proxima_llegada - tiempo) // quantum) - 1)
+            return quantums, tiempo + quantums * quantum, pendiente - quantums * quantum
+        quantums = 0
+        while pendiente > quantum and (proxima_llegada is None or tiempo + quantum < proxima_llegada):
+            tiempo += quantum
+            pendiente -= quantum
+            quantums += 1
+        return quantums, tiempo, pendiente
+
+    def _eventos(self):
+        tabla = self.tabla
+        quantum = self.quantum
+        fusionar = self.fusionar_segmentos
+        llegada = tabla.llegada
+        restante = tabla.restante
+        completar = tabla.completar
+        total_procesos = len(tabla)
+        enteros = self._rachas_enteras()
+
+        # Orden de llegada estable (índices de la tabla, que conserva el orden de entrada)
+        orden_llegada = sorted(range(total_procesos), key=llegada.__getitem__)
+
+        tiempo_actual = 0
+        cola_listos = deque()
+        # Marca por índice de "ya está en la cola de listos"
+        en_cola = bytearray(total_procesos)
+        idx_proceso_entrante = 0
+        procesos_terminados_count = 0
+
+        while procesos_terminados_count < total_procesos:
+            # Añadir procesos que han llegado a la cola de listos
+            while idx_proceso_entrante < total_procesos and \
+                  llegada[orden_llegada[idx_proceso_entrante]] <= tiempo_actual:
+                i = orden_llegada[idx_proceso_entrante]
+                if not en_cola[i]:
+                    en_cola[i] = 1
+                    cola_listos.append(i)
+                idx_proceso_entrante += 1
+
+            if not cola_listos:
+                if idx_proceso_entrante < total_procesos:
+                    tiempo_actual = llegada[orden_llegada[idx_proceso_entrante]]
+                else: # No hay más procesos por llegar y la cola está vacía
+                    break
+                continue # Re-evaluar llegadas con el nuevo tiempo_actual
+
+            idx_actual = cola_listos.popleft()
+            en_cola[idx_actual] = 0
+
+            if not cola_listos and restante[idx_actual] > quantum:
+                # Solo en la CPU: la racha de quantums sin competencia se resuelve de una vez
+                proxima_llegada = llegada[orden_llegada[idx_proceso_entrante]] \
+                    if idx_proceso_entrante < total_procesos else None
+                quantums, tiempo_racha, restante[idx_actual] = self._racha_en_solitario(
+                    tiempo_actual, restante[idx_actual], proxima_llegada, enteros)
+                if quantums and fusionar:
+                    yield idx_actual, tiempo_actual, tiempo_racha, False
+                else:
+                    for _ in range(quantums):
+                        yield idx_actual, tiempo_actual, tiempo_actual + quantum, False
+                        tiempo_actual += quantum
+                tiempo_actual = tiempo_racha
+
+            tiempo_inicio_segmento = tiempo_actual
+            tiempo_ejecucion_este_quantum = min(restante[idx_actual], quantum)
+            restante[idx_actual] -= tiempo_ejecucion_este_quantum
+            tiempo_actual += tiempo_ejecucion_este_quantum
+
+            # El proceso expropiado vuelve a la cola ANTES de los que llegaron
+            # mientras se ejecutaba (regla de orden de esta implementación de RR).
+            if restante[idx_actual] > 0:
+                en_cola[idx_actual] = 1
+                cola_listos.append(idx_actual)
+                yield idx_actual, tiempo_inicio_segmento, tiempo_actual, False
+            else: # Proceso terminado
+                completar(idx_actual, tiempo_actual)
+                procesos_terminados_count += 1
+                yield idx_actual, tiempo_inicio_segmento, tiempo_actual, True
+
+            # Añadir los procesos que llegaron MIENTRAS este se ejecutaba, al final de la cola
+            while idx_proceso_entrante < total_procesos and \
+                  llegada[orden_llegada[idx_proceso_entrante]] <= tiempo_actual:
+                i = orden_llegada[idx_proceso_entrante]
+                if not en_cola[i] and restante[i] > 0:
+                    en_cola[i] = 1
+                    cola_listos.append(i)
+                idx_proceso_entrante += 1
+
+    def metricas(self):
+        """
+        Simulación solo de métricas: la misma planificación que eventos(), sin producir
+        ni guardar segmentos (las rachas en solitario también se resuelven de una vez).
+        Completa la tabla (finalizacion, espera, turnaround) y devuelve sus
+        MetricasSimulacion, idénticas a medir_eventos(tabla, eventos()); la cantidad de
+        segmentos cuenta los fusionados si fusionar_segmentos es True.
+        """
+        tabla = self.tabla
+        quantum = self.quantum
+        fusionar = self.fusionar_segmentos
+        llegada = tabla.llegada
+        restante = tabla.restante
+        completar = tabla.completar
+        total_procesos = len(tabla)
+        enteros = self._rachas_enteras()
+
+        orden_llegada = sorted(range(total_procesos), key=llegada.__getitem__)
+        primer_comienzo = array('d', [-1.0]) * total_procesos
+        cambios_contexto = 0
+        segmentos = 0
+        anterior = -1
+        final_anterior = None
+
+        tiempo_actual = 0
+        cola_listos = deque()
+        en_cola = bytearray(total_procesos)
+        idx_proceso_entrante = 0
+        procesos_terminados_count = 0
+
+        while procesos_terminados_count < total_procesos:
+            while idx_proceso_entrante < total_procesos and \
+                  llegada[orden_llegada[idx_proceso_entrante]] <= tiempo_actual:
+                i = orden_llegada[idx_proceso_entrante]
+                if not en_cola[i]:
+                    en_cola[i] = 1
+                    cola_listos.append(i)
+                idx_proceso_entrante += 1
+
+            if not cola_listos:
+                if idx_proceso_entrante < total_procesos:
+                    tiempo_actual = llegada[orden_llegada[idx_proceso_entrante]]
+                else:
+                    break
+                continue
+
+            idx_actual = cola_listos.popleft()
+            en_cola[idx_actual] = 0
+            if idx_actual != anterior:
+                if primer_comienzo[idx_actual] < 0:
+                    primer_comienzo[idx_actual] = tiempo_actual
+                if anterior != -1:
+                    cambios_contexto += 1
+                anterior = idx_actual
+                segmentos += 1
+            elif not fusionar or tiempo_actual != final_anterior:
+                segmentos += 1
+
+            if not cola_listos and restante[idx_actual] > quantum:
+                proxima_llegada = llegada[orden_llegada[idx_proceso_entrante]] \
+                    if idx_proceso_entrante < total_procesos else None
+                quantums, tiempo_actual, restante[idx_actual] = self._racha_en_solitario(
+                    tiempo_actual, restante[idx_actual], proxima_llegada, enteros)
+                if not fusionar:
+                    segmentos += quantums
+
+            tiempo_ejecucion_este_quantum = min(restante[idx_actual], quantum)
+            restante[idx_actual] -= tiempo_ejecucion_este_quantum
+            tiempo_actual += tiempo_ejecucion_este_quantum
+            final_anterior = tiempo_actual
+
+            if restante[idx_actual] > 0:
+                en_cola[idx_actual] = 1
+                cola_listos.append(idx_actual)
+            else:
+                completar(idx_actual, tiempo_actual)
+                procesos_terminados_count += 1
+
+            while idx_proceso_entrante < total_procesos and \
+                  llegada[orden_llegada[idx_proceso_entrante]] <= tiempo_actual:
+                i = orden_llegada[idx_proceso_entrante]
+                if not en_cola[i] and restante[i] > 0:
+                    en_cola[i] = 1
+                    cola_listos.append(i)
+                idx_proceso_entrante += 1
+
+        return resumir_tabla(tabla, primer_comienzo, cambios_contexto, segmentos)
@@ -0,0 +1,169 @@
+import heapq # Cola de listos como min-heap ordenado por (restante, llegada, id)
+from array import array
+
+from app.models.metricas import resumir_tabla
+from app.models.resultado import ResultadoSimulacion
+
+
+class ModeloSRTF:
+    """
+    Motor de simulación Shortest Remaining Time First sobre una TablaProcesos.
+    Dirigido por eventos: min-heap de listos más un cursor sobre las llegadas ordenadas,
+    de modo que cada punto de expropiación cuesta O(log n).
+    """
+    def __init__(self, tabla):
+        self.tabla = tabla
+
+    def simular(self):
+        """
+        Ejecuta la simulación completa.
+
+        Returns:
+            ResultadoSimulacion: Segmentos de ejecución en columnas (índice de proceso,
+                  comienzo, final), en orden cronológico. Un segmento se corta en cada
+                  llegada, aunque el proceso en ejecución no sea expropiado.
+        """
+        resultado = ResultadoSimulacion(self.tabla)
+        agregar_indice = resultado.indices.append
+        agregar_comienzo = resultado.comienzos.append
+        agregar_final = resultado.finales.append
+        for idx_proceso, comienzo, final, _terminado in self.eventos():
+            agregar_indice(idx_proceso)
+            agregar_comienzo(comienzo)
+            agregar_final(final)
+        return resultado
+
+    def eventos(self):
+        """
+        Generador con la simulación paso a paso: produce una tupla
+        (índice de proceso, comienzo, final, terminado) por cada segmento, en cuanto se
+        decide. Si `terminado` es True el proceso acabó en ese segmento y sus métricas ya
+        están en la tabla. No guarda los segmentos: la memoria extra es el heap de listos
+        más el cursor de llegadas.
+        """
+        tabla = self.tabla
+        nombres = tabla.nombres
+        llegada = tabla.llegada
+        restante = tabla.restante
+        completar = tabla.completar
+        total_procesos = len(tabla)
+
+        # Cursor de llegadas: índices ordenados por tiempo de llegada (orden estable).
+        # Los procesos sin ráfaga positiva nunca están listos ni generan eventos de llegada.
+        orden_llegada = sorted((i for i in range(total_procesos) if restante[i] > 0),
+                               key=llegada.__getitem__)
+        total_llegadas = len(orden_llegada)
+        idx_proxima_llegada = 0
+
+        # Cola de listos: (restante, llegada, id, índice). El índice es el último desempate
+        # y conserva el orden de entrada entre procesos idénticos.
+        cola_listos = []
+        tiempo_actual = 0
+
+        while True:
+            # Encolar todo lo que ya llegó en tiempo_actual
+            while idx_proxima_llegada < total_llegadas and \
+                  llegada[orden_llegada[idx_proxima_llegada]] <= tiempo_actual:
+                i = orden_llegada[idx_proxima_llegada]
+                heapq.heappush(cola_listos, (restante[i], llegada[i], nombres[i], i))
+                idx_proxima_llegada += 1
+
+            if not cola_listos:
+                # CPU ociosa: saltar directamente a la próxima llegada
+                if idx_proxima_llegada >= total_llegadas:
+                    break
+                tiempo_actual = llegada[orden_llegada[idx_proxima_llegada]]
+                continue
+
+            idx_actual = heapq.heappop(cola_listos)[3]
+            tiempo_inicio_segmento = tiempo_actual
+            tiempo_ejecucion_este_slot = restante[idx_actual]
+
+            # El único evento que puede interrumpir el slot es la próxima llegada
+            # (todas las anteriores ya están en el heap).
+            if idx_proxima_llegada < total_llegadas:
+                llegada_siguiente = llegada[orden_llegada[idx_proxima_llegada]]
+                if llegada_siguiente < tiempo_actual + tiempo_ejecucion_este_slot:
+                    tiempo_ejecucion_este_slot = llegada_siguiente - tiempo_actual
+
+            restante[idx_actual] -= tiempo_ejecucion_este_slot
+            tiempo_actual += tiempo_ejecucion_este_slot
+
+            if restante[idx_actual] <= 0:
+                completar(idx_actual, tiempo_actual)
+                yield idx_actual, tiempo_inicio_segmento, tiempo_actual, True
+            else:
+                # Interrumpido por una llegada: vuelve al heap con su nuevo restante
+                heapq.heappush(cola_listos, (restante[idx_actual], llegada[idx_actual], nombres[idx_actual], idx_actual))
+                yield idx_actual, tiempo_inicio_segmento, tiempo_actual, False
+
+    def metricas(self):
+        """
+        Simulación solo de métricas: la misma planificación que eventos(), sin producir
+        ni guardar segmentos. Completa la tabla y devuelve sus MetricasSimulacion,
+        idénticas a medir_eventos(tabla, eventos()).
+        Cuando una llegada corta el segmento, el proceso en ejecución y el mejor de los
+        listos se comparan con un solo heappushpop en lugar de reinsertar y volver a sacar.
+        """
+        tabla = self.tabla
+        nombres = tabla.nombres
+        llegada = tabla.llegada
+        restante = tabla.restante
+        completar = tabla.completar
+        total_procesos = len(tabla)
+        heappush, heappop, heappushpop = heapq.heappush, heapq.heappop, heapq.heappushpop
+
+        orden_llegada = sorted((i for i in range(total_procesos) if restante[i] > 0),
+                               key=llegada.__getitem__)
+        total_llegadas = len(orden_llegada)
+        idx_proxima_llegada = 0
+        primer_comienzo = array('d', [-1.0]) * total_procesos
+        cambios_contexto = 0
+        segmentos = 0
+        anterior = -1
+
+        cola_listos = []
+        interrumpido = None # Entrada del heap del proceso cortado por la última llegada
+        tiempo_actual = 0
+
+        while True:
+            while idx_proxima_llegada < total_llegadas and \
+                  llegada[orden_llegada[idx_proxima_llegada]] <= tiempo_actual:
+                i = orden_llegada[idx_proxima_llegada]
+                heappush(cola_listos, (restante[i], llegada[i], nombres[i], i))
+                idx_proxima_llegada += 1
+
+            if interrumpido is not None:
+                idx_actual = heappushpop(cola_listos, interrumpido)[3]
+                interrumpido = None
+            elif cola_listos:
+                idx_actual = heappop(cola_listos)[3]
+            elif idx_proxima_llegada < total_llegadas:
+                tiempo_actual = llegada[orden_llegada[idx_proxima_llegada]]
+                continue
+            else:
+                break
+
+            if idx_actual != anterior:
+                if primer_comienzo[idx_actual] < 0:
+                    primer_comienzo[idx_actual] = tiempo_actual
+                if anterior != -1:
+                    cambios_contexto += 1
+                anterior = idx_actual
+            segmentos += 1
+
+            tiempo_ejecucion_este_slot = restante[idx_actual]
+            if idx_proxima_llegada < total_llegadas:
+                llegada_siguiente = llegada[orden_llegada[idx_proxima_llegada]]
+                if llegada_siguiente < tiempo_actual + tiempo_ejecucion_este_slot:
+                    tiempo_ejecucion_este_slot = llegada_siguiente - tiempo_actual
+
+            restante[idx_actual] -= tiempo_ejecucion_este_slot
+            tiempo_actual += tiempo_ejecucion_este_slot
+
+            if restante[idx_actual] <= 0:
+                completar(idx_actual, tiempo_actual)
+            else:
+                interrumpido = (restante[idx_actual], llegada[idx_actual], nombres[idx_actual], idx_actual)
+
+        return resumir_tabla(tabla, primer_comienzo, cambios_contexto, segmentos)
@@ -0,0 +1,147 @@
+from array import array # Columnas compactas de enteros/flotantes (struct-of-arrays)
+
+
+def _columna(valores):
+    """
+    Construye una columna compacta a partir de una secuencia de tiempos.
+    Usa array('q') si todos son enteros y array('d') si todos son flotantes, para que los
+    valores devueltos conserven exactamente su tipo original. Si los tipos se mezclan
+    (o un entero no cabe en 64 bits) se conserva una lista normal; si las dos columnas
+    de la tabla no tienen el mismo tipo, _iniciar_estado pasa ambas a listas.
+    """
+    valores = list(valores)
+    try:
+        if all(type(v) is int for v in valores):
+            return array('q', valores)
+        if all(type(v) is float for v in valores):
+            return array('d', valores)
+    except OverflowError:
+        pass
+    return valores
+
+
+class TablaProcesos:
+    """
+    Tabla de procesos en formato columnar: una columna por atributo en lugar de un
+    diccionario por proceso. Los motores de simulación (ModeloRR, ModeloSRTF) trabajan
+    sobre sus índices; los diccionarios solo se construyen en el borde de la API (ver ResultadoSimulacion).
+
+    Columnas:
+        nombres (list): Identificador de cada proceso.
+        llegada (array): Tiempo de llegada.
+        duracion (array): Ráfaga total de CPU original.
+        restante (array): Ráfaga pendiente (la modifica el motor).
+        finalizacion (array): Tiempo de finalización (-1 mientras no haya terminado).
+        espera (array): Tiempo total de espera, fijado una sola vez al terminar.
+        turnaround (array): Tiempo total de turnaround, fijado una sola vez al terminar.
+    """
+    __slots__ = ('nombres', 'llegada', 'duracion', 'restante', 'finalizacion', 'espera', 'turnaround')
+
+    def __init__(self, nombres, llegadas, duraciones):
+        self.nombres = list(nombres)
+        self.llegada = _columna(llegadas)
+        self.duracion = _columna(duraciones)
+        self._iniciar_estado()
+
+    def _iniciar_estado(self):
+        """Crea las columnas que modifica la simulación a partir de nombres/llegada/duracion."""
+        if len(self.llegada) != len(self.nombres) or len(self.duracion) != len(self.nombres):
+            raise ValueError("TablaProcesos: las columnas nombres, llegadas y duraciones deben tener la misma longitud.")
+        if isinstance(self.llegada, array) and isinstance(self.duracion, array) and self.llegada.typecode == self.duracion.typecode:
+            self.finalizacion = array(self.llegada.typecode, [-1]) * len(self.nombres)
+        else:
+            # El tipo es de la tabla entera, no de cada columna: con llegadas flotantes y
+            # ráfagas enteras los motores restan tiempos flotantes a `restante`, que en
+            # array('q') fallaría. Con tipos mezclados todas las columnas son listas.
+            if not isinstance(self.llegada, list):
+                self.llegada = list(self.llegada)
+            if not isinstance(self.duracion, list):
+                self.duracion = list(self.duracion)
+            self.finalizacion = [-1] * len(self.nombres)
+        self.restante = self.duracion[:] # Copia de la columna (mismo tipo)
+        self.espera = self.finalizacion[:]
+        self.turnaround = self.finalizacion[:]
+
+    @classmethod
+    def desde_dicts(cls, procesos_iniciales, origen="TablaProcesos"):
+        """
+        Crea la tabla a partir de la lista de diccionarios que reciben los controladores
+        ('nombre', 'llegada' y 'duracion_original' o 'duracion').
+        `origen` solo se usa para identificar al llamador en las advertencias.
+        """
+        nombres, llegadas, duraciones = [], [], []
+        for i, p_orig in enumerate(procesos_iniciales):
+            nombre = p_orig.get('nombre', f"Proceso_{i+1}")
+            duracion_key = 'duracion_original' if 'duracion_original' in p_orig else 'duracion'
+            if duracion_key not in p_orig:
+                print(f"ADVERTENCIA ({origen}): Proceso {nombre} no tiene clave de duración ('duracion' o 'duracion_original'). Asumiendo 1.")
+                duracion = 1
+            else:
+                duracion = p_orig[duracion_key]
+            nombres.append(nombre)
+            llegadas.append(p_orig['llegada'])
+            duraciones.append(duracion)
+        return cls(nombres, llegadas, duraciones)
+
+    @classmethod
+    def desde_columnas(cls, nombres, llegada, duracion):
+        """
+        Crea la tabla usando directamente columnas ya construidas (list/array), sin
+        copiarlas ni revisar sus tipos; lo usan los cargadores de archivos (ver app.models.carga).
+        """
+        tabla = cls.__new__(cls)
+        tabla.nombres = nombres
+        tabla.llegada = llegada
+        tabla.duracion = duracion
+        tabla._iniciar_estado()
+        return tabla
+
+    @classmethod
+    def preparar(cls, procesos, origen="TablaProcesos"):
+        """
+        Devuelve una tabla lista para simular a partir de lo que reciben los controladores:
+        una lista de diccionarios o una TablaProcesos (por ejemplo, una carga importada).
+        Una tabla se reutiliza con nueva_ejecucion(), así que puede simularse varias veces.
+        """
+        if isinstance(procesos, cls):
+            return procesos.nueva_ejecucion()
+        return cls.desde_dicts(procesos, origen=origen)
+
+    def nueva_ejecucion(self):
+        """
+        Tabla para una nueva simulación: comparte las columnas de entrada (nombres, llegada,
+        duracion), que los motores no modifican, y crea columnas de estado nuevas.
+        """
+        return TablaProcesos.desde_columnas(self.nombres, self.llegada, self.duracion)
+
+    def usar_listas(self):
+        """
+        Convierte las columnas numéricas en listas normales. Lo usan los motores cuando
+        un parámetro (por ejemplo un quantum flotante) produciría valores de un tipo que
+        la columna compacta no admite.
+        """
+        self.llegada = list(self.llegada)
+        self.duracion = list(self.duracion)
+        self.restante = list(self.restante)
+        self.finalizacion = list(self.finalizacion)
+        self.espera = list(self.espera)
+        self.turnaround = list(self.turnaround)
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def terminado(self, i):
+        return self.finalizacion[i] != -1
+
+    def completar(self, i, tiempo_final):
+        """
+        Registra la finalización del proceso i y calcula sus métricas en ese momento,
+        una única vez; los segmentos las consultan después por índice.
+        La finalización se escribe al final: quien lea la tabla desde otro hilo mientras
+        la simulación avanza (ver SimulacionEnHilo) nunca ve un proceso terminado sin métricas.
+        """
+        turnaround = tiempo_final - self.llegada[i]
+        self.turnaround[i] = turnaround
+        self.espera[i] = turnaround - self.duracion[i]
+        self.finalizacion[i] = tiempo_final
+
@@ -0,0 +1,34 @@
+from collections.abc import Sequence
+
+
+def nombre_proceso(indice):
+    """
+    Nombre por defecto del proceso `indice` (desde 0) al estilo de las columnas de una
+    hoja de cálculo: A..Z, AA..AZ, BA..., sin límite de cantidad.
+    """
+    nombre = ""
+    indice += 1
+    while indice > 0:
+        indice, resto = divmod(indice - 1, 26)
+        nombre = chr(65 + resto) + nombre
+    return nombre
+
+
+class NombresProceso(Sequence):
+    """Secuencia de solo lectura con los nombres por defecto de `cantidad` procesos, generados al pedirlos."""
+    __slots__ = ('cantidad',)
+
+    def __init__(self, cantidad):
+        self.cantidad = cantidad
+
+    def __len__(self):
+        return self.cantidad
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [nombre_proceso(j) for j in range(*i.indices(self.cantidad))]
+        if i < 0:
+            i += self.cantidad
+        if not 0 <= i < self.cantidad:
+            raise IndexError("NombresProceso: índice fuera de rango")
+        return nombre_proceso(i)
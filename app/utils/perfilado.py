@@ -0,0 +1,136 @@
+"""
+Instrumentación opcional por fases: tiempo de reloj y cantidad de llamadas de cada fase
+de la simulación (preparar la tabla, planificar, construir los diccionarios de segmento)
+y de ResultsView (fondo, tabla, Gantt), con un volcado opcional de cProfile.
+
+Activación:
+    with perfilar() as perfil:              # o perfilar("simulacion.prof") para cProfile
+        RRController.simular_rr(procesos, 2)
+    print(perfil.texto())                   # o perfil.informe(): lista de diccionarios
+
+    SIMULADOR_PERFIL=1 python main.py       # todo el proceso; informe en stderr al salir
+    SIMULADOR_PERFIL=sim.prof python main.py   # además, volcado pstats en sim.prof
+
+Las fases se marcan con `with fase("rr.simulacion"):`. Sin un perfil activo fase()
+devuelve siempre el mismo contexto nulo, así que el costo desactivado es una llamada por
+fase (las fases son de grano grueso: ninguna está dentro de un bucle por segmento).
+Las fases anidadas cuentan su tiempo también en la fase que las contiene. cProfile solo
+perfila el hilo que llamó a perfilar(); las fases se miden en todos los hilos.
+"""
+import atexit
+import cProfile
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+VARIABLE_ENTORNO = "SIMULADOR_PERFIL"
+_FASE_NULA = nullcontext() # Reutilizable: no guarda estado entre usos
+_perfil_activo = None
+
+
+class _Fase:
+    __slots__ = ('perfil', 'nombre', 'inicio')
+
+    def __init__(self, perfil, nombre):
+        self.perfil = perfil
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *_excepcion):
+        self.perfil.registrar(self.nombre, time.perf_counter() - self.inicio)
+        return False
+
+
+class Perfil:
+    """Tiempos acumulados por fase: nombre -> [llamadas, segundos]."""
+    def __init__(self):
+        self.fases = {}
+        self._lock = threading.Lock() # La GUI simula en un hilo secundario
+
+    def fase(self, nombre):
+        return _Fase(self, nombre)
+
+    def registrar(self, nombre, segundos):
+        with self._lock:
+            acumulado = self.fases.get(nombre)
+            if acumulado is None:
+                self.fases[nombre] = [1, segundos]
+            else:
+                acumulado[0] += 1
+                acumulado[1] += segundos
+
+    def informe(self):
+        """Lista de {'fase', 'llamadas', 'total_s', 'promedio_s'}, de mayor a menor tiempo total."""
+        with self._lock:
+            filas = [{'fase': nombre, 'llamadas': llamadas, 'total_s': segundos, 'promedio_s': segundos / llamadas}
+                     for nombre, (llamadas, segundos) in self.fases.items()]
+        return sorted(filas, key=lambda fila: fila['total_s'], reverse=True)
+
+    def texto(self):
+        """El informe como tabla de texto."""
+        lineas = [f"{'fase':<28} {'llamadas':>9} {'total (ms)':>11} {'promedio (ms)':>14}"]
+        for fila in self.informe():
+            lineas.append(f"{fila['fase']:<28} {fila['llamadas']:>9} {fila['total_s'] * 1000:>11.3f} "
+                          f"{fila['promedio_s'] * 1000:>14.3f}")
+        return "\n".join(lineas) + "\n"
+
+
+def fase(nombre):
+    """Contexto que mide la fase `nombre` en el perfil activo (o no hace nada si no hay)."""
+    perfil = _perfil_activo
+    if perfil is None:
+        return _FASE_NULA
+    return perfil.fase(nombre)
+
+
+def perfil_activo():
+    """El Perfil en curso, o None si la instrumentación está desactivada."""
+    return _perfil_activo
+
+
+@contextmanager
+def perfilar(volcado=None):
+    """
+    Activa la instrumentación dentro del bloque y entrega el Perfil con sus fases. Con
+    `volcado` (ruta) también corre cProfile y guarda sus estadísticas al salir, para
+    abrirlas con pstats o snakeviz. Al terminar se restaura el perfil anterior, si había.
+    """
+    global _perfil_activo
+    anterior = _perfil_activo
+    perfil = Perfil()
+    perfilador = cProfile.Profile() if volcado else None
+    _perfil_activo = perfil
+    if perfilador is not None:
+        perfilador.enable()
+    try:
+        yield perfil
+    finally:
+        if perfilador is not None:
+            perfilador.disable()
+            try:
+                perfilador.dump_stats(volcado)
+            except OSError as e:
+                print(f"ERROR (perfilado): No se pudo guardar el volcado de cProfile en {volcado}: {e}")
+        _perfil_activo = anterior
+
+
+def _activar_desde_entorno():
+    valor = os.environ.get(VARIABLE_ENTORNO, "").strip()
+    if not valor or valor == "0":
+        return
+    contexto = perfilar(None if valor == "1" else valor)
+    perfil = contexto.__enter__()
+
+    def _terminar():
+        contexto.__exit__(None, None, None)
+        sys.stderr.write(f"Perfil ({VARIABLE_ENTORNO}):\n{perfil.texto()}")
+    atexit.register(_terminar)
+
+
+_activar_desde_entorno()
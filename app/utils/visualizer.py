@@ -0,0 +1,347 @@
+import math
+from bisect import bisect_left, bisect_right
+
+from app.models.resultado import ResultadoSimulacion
+
+
+DURACION_MINIMA_VISIBLE = 0.1 # Duración mínima dibujada para que un segmento sea visible
+ALTURA_BARRA = 0.6
+FACTOR_ZOOM_RUEDA = 1.25 # Cuánto acerca/aleja cada paso de la rueda del ratón
+
+
+def color_texto_para(color_hex, color_oscuro, color_claro):
+    """Elige el color de la etiqueta según la luminancia del color de la barra."""
+    try:
+        hex_color = color_hex.lstrip('#')
+        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+        return color_oscuro if luminance > 0.6 else color_claro # Ajustar umbral
+    except Exception:
+        return color_claro # Fallback
+
+
+def agrupar_segmentos(datos):
+    """
+    Agrupa por proceso una lista de diccionarios de segmento (los ResultadoSimulacion
+    se indexan directamente, ver ResultadoSimulacion.indice_por_proceso).
+
+    Returns:
+        dict: nombre -> (lista de comienzos, lista de finales), ordenadas por comienzo.
+    """
+    grupos = {}
+    for item_idx, item in enumerate(datos):
+        if not item:
+            continue
+        nombre = item.get("proceso", f"P_indef_{item_idx}")
+        comienzo, final_val = item.get("comienzo", 0), item.get("final", item.get("comienzo", 0))
+        # Validar que comienzo y final_val sean numéricos
+        if not (isinstance(comienzo, (int, float)) and isinstance(final_val, (int, float))):
+            print(f"ADVERTENCIA (Gantt): Segmento para '{nombre}' tiene tiempos no numéricos: comienzo={comienzo}, final={final_val}. Saltando segmento.")
+            continue
+        grupo = grupos.get(nombre)
+        if grupo is None:
+            grupo = grupos[nombre] = ([], [])
+        grupo[0].append(comienzo)
+        grupo[1].append(final_val)
+
+    # Las listas de diccionarios pueden venir de otra fuente: asegurar el orden para la búsqueda binaria
+    for nombre, (comienzos, finales) in grupos.items():
+        if any(comienzos[k] > comienzos[k + 1] for k in range(len(comienzos) - 1)):
+            pares = sorted(zip(comienzos, finales))
+            grupos[nombre] = ([c for c, _ in pares], [f for _, f in pares])
+    return grupos
+
+
+def fusionar_huecos(comienzos, finales, hueco_maximo):
+    """
+    Une los segmentos consecutivos de un proceso separados por menos de `hueco_maximo`
+    unidades de tiempo cuando al menos uno de los dos dura menos de `hueco_maximo`
+    (y corrige solapamientos). Dos segmentos largos no se unen aunque se toquen (hueco 0,
+    como dos quantums seguidos): el borde entre ellos se ve. Devuelve nuevas listas
+    (comienzos, finales).
+    """
+    nuevos_comienzos, nuevos_finales = [], []
+    if not comienzos:
+        return nuevos_comienzos, nuevos_finales
+    actual_comienzo, actual_final = comienzos[0], finales[0]
+    corto_anterior = actual_final - actual_comienzo < hueco_maximo
+    for k in range(1, len(comienzos)):
+        comienzo, final = comienzos[k], finales[k]
+        hueco = comienzo - actual_final
+        corto = final - comienzo < hueco_maximo
+        if hueco < 0 or (hueco < hueco_maximo and (corto or corto_anterior)):
+            if final > actual_final:
+                actual_final = final
+        else:
+            nuevos_comienzos.append(actual_comienzo)
+            nuevos_finales.append(actual_final)
+            actual_comienzo, actual_final = comienzo, final
+        corto_anterior = corto
+    nuevos_comienzos.append(actual_comienzo)
+    nuevos_finales.append(actual_final)
+    return nuevos_comienzos, nuevos_finales
+
+
+class IndiceSegmentos:
+    """
+    Segmentos de un proceso indexados por tiempo, con niveles de detalle.
+
+    El nivel k une los segmentos separados por huecos menores que 2**k unidades si uno
+    de ellos también es más corto (ver fusionar_huecos); se calcula la primera vez que
+    se pide y queda en caché. Como los segmentos de un
+    proceso no se solapan, tanto los comienzos como los finales de cada nivel están
+    ordenados y la ventana visible se localiza con dos búsquedas binarias.
+    """
+    __slots__ = ('niveles',)
+
+    def __init__(self, comienzos, finales):
+        self.niveles = {None: (comienzos, finales)} # None = segmentos originales, sin fusionar
+
+    def nivel(self, k):
+        niveles = self.niveles
+        if k not in niveles:
+            comienzos, finales = niveles[None]
+            fusionados = fusionar_huecos(comienzos, finales, 2.0 ** k)
+            # Si no se unió nada, reutilizar las listas originales
+            niveles[k] = (comienzos, finales) if len(fusionados[0]) == len(comienzos) else fusionados
+        return niveles[k]
+
+    def visibles(self, x_min, x_max, k=None):
+        """Devuelve (comienzos, finales) del nivel k que intersectan [x_min, x_max]."""
+        comienzos, finales = self.nivel(k)
+        desde = bisect_left(finales, x_min)
+        hasta = bisect_right(comienzos, x_max)
+        if desde >= hasta:
+            return (), ()
+        return comienzos[desde:hasta], finales[desde:hasta]
+
+
+class DiagramaGantt:
+    """
+    Diagrama de Gantt interactivo (zoom y desplazamiento) con una colección de barras
+    por fila visible, de modo que el número de artistas de matplotlib depende de cuántos
+    procesos se ven y no de la cantidad de procesos ni de segmentos.
+
+    Cada vez que cambian los límites de los ejes solo se pasan a matplotlib los segmentos
+    dentro de la ventana visible (búsqueda binaria en IndiceSegmentos) y, con poco zoom,
+    los segmentos separados por menos de un píxel se dibujan como una sola barra agregada.
+    Las etiquetas se colocan solo en las barras lo bastante anchas para leerse.
+
+    Las filas (un proceso con segmentos cada una, ordenadas por nombre) se determinan al
+    construir el objeto, antes de crear la figura, para poder dimensionarla; los tiempos
+    de cada fila se extraen la primera vez que esa fila queda a la vista.
+    """
+    FILAS_VISIBLES_INICIALES = 25 # Con más procesos, la vista inicial muestra solo estas filas
+    MAX_FILAS_DIBUJADAS = 200 # Tope de filas dibujadas a la vez al alejar el eje Y
+    MAX_ETIQUETAS_FIJAS = 50 # Hasta aquí, una marca con nombre por fila en el eje Y
+    MAX_FILAS_EN_CACHE = 2000
+
+    def __init__(self, datos):
+        if isinstance(datos, ResultadoSimulacion):
+            # Sin agrupar en diccionarios: índice por proceso sobre las columnas del resultado
+            nombres = datos.tabla.nombres
+            inicios, _posiciones = datos.indice_por_proceso()
+            procesos = sorted((i for i in range(len(datos.tabla)) if inicios[i + 1] > inicios[i]),
+                              key=nombres.__getitem__)
+            self.nombres_filas = [nombres[i] for i in procesos]
+            self._cargar_fila = lambda fila: datos.tiempos_de_proceso(procesos[fila])
+            self.min_comienzo = min(datos.comienzos, default=0)
+            self.max_final = max(datos.finales, default=0)
+        else:
+            grupos = agrupar_segmentos(datos)
+            self.nombres_filas = sorted(grupos)
+            self._cargar_fila = lambda fila: grupos[self.nombres_filas[fila]]
+            self.min_comienzo = min((c[0] for c, _ in grupos.values()), default=0)
+            self.max_final = max((max(f) for _, f in grupos.values()), default=0)
+        self._indices_filas = {} # fila -> IndiceSegmentos, solo para filas ya vistas
+        self.ax = None
+        self.estilos = {} # fila -> (color de barra, color de etiqueta), calculado una vez
+        self.colecciones = {} # fila visible -> PolyCollection reutilizada en cada redibujado
+        self.tamano_fuente = 9
+        self._colores = None
+        self._etiquetas = []
+        self._limites_dibujados = None
+
+    @property
+    def num_procesos(self):
+        return len(self.nombres_filas)
+
+    @property
+    def filas_iniciales(self):
+        """Cantidad de filas que muestra la vista inicial (para dimensionar la figura)."""
+        return min(self.num_procesos, self.FILAS_VISIBLES_INICIALES)
+
+    def dibujar(self, ax, colores, color_defecto, color_borde, color_texto_oscuro, color_texto_claro,
+                color_ejes=None, tamano_fuente=9):
+        """
+        Prepara el eje `ax` y devuelve el tiempo final máximo (0 si no hay). Las barras se
+        crean y rellenan en actualizar_vista(), que se llama sola al cambiar los límites.
+        """
+        self.ax = ax
+        self.tamano_fuente = tamano_fuente
+        self._colores = (colores, color_defecto, color_borde, color_texto_oscuro, color_texto_claro)
+        num_filas = self.num_procesos
+
+        if num_filas <= self.MAX_ETIQUETAS_FIJAS:
+            ax.set_yticks(list(range(num_filas)))
+            if color_ejes is not None:
+                ax.set_yticklabels(self.nombres_filas, color=color_ejes)
+            else:
+                ax.set_yticklabels(self.nombres_filas)
+        else:
+            # Demasiadas filas para una marca fija por proceso: marcas enteras según el zoom
+            from matplotlib.ticker import MaxNLocator, FuncFormatter # matplotlib ya está cargado si hay un eje
+            nombres_filas = self.nombres_filas
+            ax.yaxis.set_major_locator(MaxNLocator(nbins=self.FILAS_VISIBLES_INICIALES, integer=True))
+            ax.yaxis.set_major_formatter(FuncFormatter(
+                lambda y, _pos: str(nombres_filas[int(y)]) if 0 <= y < len(nombres_filas) and y == int(y) else ""))
+            if color_ejes is not None:
+                ax.tick_params(axis='y', labelcolor=color_ejes)
+        # Las colecciones se añaden sin autoescalado: fijar el rango vertical inicial
+        ax.set_ylim(-0.5 - ALTURA_BARRA / 2, max(self.filas_iniciales, 1) - 0.5 + ALTURA_BARRA / 2)
+        ax.callbacks.connect('xlim_changed', lambda _ax: self.actualizar_vista())
+        ax.callbacks.connect('ylim_changed', lambda _ax: self.actualizar_vista())
+        return self.max_final
+
+    def _indice_fila(self, fila):
+        indice = self._indices_filas.get(fila)
+        if indice is None:
+            if len(self._indices_filas) >= self.MAX_FILAS_EN_CACHE:
+                self._indices_filas.clear()
+            indice = self._indices_filas[fila] = IndiceSegmentos(*self._cargar_fila(fila))
+        return indice
+
+    def _coleccion_fila(self, fila):
+        coleccion = self.colecciones.get(fila)
+        if coleccion is None:
+            from matplotlib.collections import PolyCollection
+            colores, color_defecto, color_borde, color_texto_oscuro, color_texto_claro = self._colores
+            color_proceso = colores.get(self.nombres_filas[fila], color_defecto)
+            self.estilos[fila] = (color_proceso, color_texto_para(color_proceso, color_texto_oscuro, color_texto_claro))
+            coleccion = PolyCollection([], facecolors=color_proceso, edgecolors=color_borde)
+            self.ax.add_collection(coleccion, autolim=False)
+            self.colecciones[fila] = coleccion
+        return coleccion
+
+    def _unidades_por_pixel(self):
+        x_min, x_max = self.ax.get_xlim()
+        ancho_px = self.ax.get_window_extent().width
+        if ancho_px <= 0 or x_max <= x_min:
+            return None
+        return (x_max - x_min) / ancho_px
+
+    def actualizar_vista(self, forzar=False):
+        """
+        Vuelve a llenar las colecciones y las etiquetas con los segmentos visibles para los
+        límites actuales. Se llama desde los callbacks de xlim/ylim y tras el layout inicial.
+        """
+        if self.ax is None:
+            return
+        unidades_por_pixel = self._unidades_por_pixel()
+        if unidades_por_pixel is None:
+            return
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = sorted(self.ax.get_ylim())
+        limites = (x_min, x_max, y_min, y_max, unidades_por_pixel)
+        if limites == self._limites_dibujados and not forzar:
+            return # xlim_changed e ylim_changed llegan juntos al hacer zoom: dibujar una vez
+        self._limites_dibujados = limites
+
+        for texto in self._etiquetas:
+            texto.remove()
+        self._etiquetas = []
+
+        mitad = ALTURA_BARRA / 2
+        primera = max(0, math.ceil(y_min - mitad))
+        ultima = min(self.num_procesos - 1, math.floor(y_max + mitad), primera + self.MAX_FILAS_DIBUJADAS - 1)
+        filas_visibles = range(primera, ultima + 1)
+        # Quitar las colecciones de las filas que salieron de la vista
+        for fila in [f for f in self.colecciones if f not in filas_visibles]:
+            self.colecciones.pop(fila).remove()
+
+        # Nivel de detalle: unir huecos y segmentos menores que un píxel (potencia de 2
+        # inmediatamente inferior). Con zoom suficiente para que todo segmento dibujado
+        # ocupe al menos un píxel se usan los segmentos originales, sin fusionar.
+        if unidades_por_pixel < DURACION_MINIMA_VISIBLE:
+            k = None
+        else:
+            k = math.floor(math.log2(unidades_por_pixel))
+        ancho_minimo_barra = max(DURACION_MINIMA_VISIBLE, unidades_por_pixel)
+        for fila in filas_visibles:
+            coleccion = self._coleccion_fila(fila)
+            comienzos, finales = self._indice_fila(fila).visibles(x_min, x_max, k)
+            y0, y1 = fila - mitad, fila + mitad
+            vertices = []
+            for comienzo, final in zip(comienzos, finales):
+                final = max(final, comienzo + ancho_minimo_barra)
+                vertices.append(((comienzo, y0), (comienzo, y1), (final, y1), (final, y0)))
+            coleccion.set_verts(vertices)
+            self._colocar_etiquetas(fila, comienzos, finales, unidades_por_pixel)
+
+    def _colocar_etiquetas(self, fila, comienzos, finales, unidades_por_pixel):
+        nombre = self.nombres_filas[fila]
+        # Ancho aproximado de la etiqueta en píxeles (caracteres * ~0.7 em) más margen
+        ancho_minimo = (len(str(nombre)) * self.tamano_fuente * 0.7 + 4) * unidades_por_pixel
+        color_texto = self.estilos[fila][1]
+        for comienzo, final in zip(comienzos, finales):
+            if final - comienzo < ancho_minimo:
+                continue
+            self._etiquetas.append(self.ax.text((comienzo + final) / 2, fila, nombre, ha='center', va='center',
+                                                color=color_texto, fontsize=self.tamano_fuente, fontweight='bold',
+                                                clip_on=True))
+
+    def zoom_con_rueda(self, evento):
+        """Callback de 'scroll_event': acerca o aleja el eje X alrededor de la posición del ratón."""
+        if self.ax is None or evento.inaxes is not self.ax or evento.xdata is None:
+            return
+        factor = 1 / FACTOR_ZOOM_RUEDA if evento.button == 'up' else FACTOR_ZOOM_RUEDA
+        x_min, x_max = self.ax.get_xlim()
+        x = evento.xdata
+        nuevo_min, nuevo_max = x - (x - x_min) * factor, x + (x_max - x) * factor
+        # No alejar más allá de la traza completa (con el mismo margen que la vista inicial)
+        limite_izq, limite_der = self.min_comienzo - 0.5, self.max_final + 0.5
+        if nuevo_max - nuevo_min >= limite_der - limite_izq:
+            nuevo_min, nuevo_max = limite_izq, limite_der
+        self.ax.set_xlim(nuevo_min, nuevo_max)
+        self.ax.figure.canvas.draw_idle()
+
+
+def dibujar_barrido_quantum(fig, filas, colores_series=("#FF0000", "#FFFF00", "#FFA07A"), color_barras="#B22222",
+                            color_ejes=None, color_fondo=None):
+    """
+    Dibuja en `fig` (vacía) el resultado de un barrido de quantum: arriba los tiempos
+    promedio de espera, turnaround y respuesta por quantum; abajo los cambios de contexto.
+    `filas` es la lista de (quantum, MetricasSimulacion) ordenada por quantum.
+    Devuelve los dos ejes.
+    """
+    quantums = [q for q, _ in filas]
+    ax_tiempos, ax_cambios = fig.subplots(2, 1, sharex=True, gridspec_kw={'height_ratios': (2, 1)})
+    series = (("Espera", [m.espera_promedio for _, m in filas]),
+              ("Turnaround", [m.turnaround_promedio for _, m in filas]),
+              ("Respuesta", [m.respuesta_promedio for _, m in filas]))
+    for (etiqueta, valores), color in zip(series, colores_series):
+        ax_tiempos.plot(quantums, valores, marker='o', markersize=4, color=color, label=etiqueta)
+    ax_tiempos.set_ylabel("Tiempo promedio")
+    ax_tiempos.legend(loc='best')
+    # Ancho de barra según la menor separación entre quantums (admite pasos no enteros)
+    separacion = min((b - a for a, b in zip(quantums, quantums[1:])), default=1)
+    ax_cambios.bar(quantums, [m.cambios_contexto for _, m in filas], width=separacion * 0.8, color=color_barras)
+    ax_cambios.set_ylabel("Cambios de contexto")
+    ax_cambios.set_xlabel("Quantum")
+    ax_tiempos.set_title("Barrido de quantum - Round Robin", fontweight='bold')
+
+    for ax in (ax_tiempos, ax_cambios):
+        ax.grid(True, linestyle=':', alpha=0.7)
+        if color_fondo is not None:
+            ax.set_facecolor(color_fondo)
+        if color_ejes is not None:
+            ax.tick_params(colors=color_ejes)
+            ax.xaxis.label.set_color(color_ejes)
+            ax.yaxis.label.set_color(color_ejes)
+            ax.title.set_color(color_ejes)
+            for spine in ax.spines.values():
+                spine.set_color(color_ejes)
+    if color_fondo is not None:
+        fig.patch.set_facecolor(color_fondo)
+    fig.tight_layout()
+    return ax_tiempos, ax_cambios
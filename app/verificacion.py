@@ -0,0 +1,689 @@
+"""
+Verificación diferencial de los motores de planificación contra implementaciones de
+referencia congeladas.
+
+Las referencias (_referencia_rr, _referencia_srtf, _referencia_prioridad,
+_referencia_mlfq) son la especificación: simples,
+con listas y búsquedas lineales, sin ninguna optimización, y no deben cambiar cuando
+se optimizan los motores. Cada caso genera una carga aleatoria (empates de llegada y
+de ráfaga, llegadas sin hueco, CPU ociosa, nombres repetidos, ráfagas 0, tiempos
+flotantes, y llegadas flotantes con ráfagas enteras o al revés) y exige que todos los
+caminos rápidos den exactamente lo mismo:
+
+    RR:   ModeloRR.eventos() (con y sin fusionar_segmentos), ModeloRR.metricas(),
+          RRController.simular_rr / iter_rr, iter_barrido_quantum y simular_rr_lote.
+    SRTF: ModeloSRTF.eventos(), ModeloSRTF.metricas(), SRTFController.simular_srtf /
+          iter_srtf y simular_srtf_lote.
+    Prioridades (con y sin envejecimiento): ModeloPrioridad.eventos(), metricas() y
+          PrioridadController.simular_prioridad / iter_prioridad.
+    MLFQ: ModeloMLFQ.eventos(), metricas() y MLFQController.simular_mlfq / iter_mlfq;
+          con un solo nivel y sin boost, además, la referencia MLFQ debe dar lo mismo que
+          la de Round Robin.
+    Archivos: la carga escrita como CSV y como JSONL y leída con app.models.carga debe
+          dar las mismas columnas y, con cada motor, lo mismo que la referencia.
+
+Se comparan los segmentos (proceso, comienzo, final y si terminó), la finalización,
+espera y turnaround de cada proceso y las MetricasSimulacion. El motor vectorizado
+trabaja en float64: sus tiempos por proceso se comparan exactos y los promedios con
+tolerancia cuando la carga tiene tiempos flotantes.
+
+Ante una diferencia se reduce la carga (se quitan procesos mientras la diferencia
+siga) y se informa el contraejemplo mínimo.
+
+Uso:
+    python -m app.verificacion                      # 2000 cargas de hasta 12 procesos
+    python -m app.verificacion --casos 20000 --max-procesos 40 --semilla 7
+"""
+import argparse
+import io
+import json
+import math
+import random
+import sys
+
+import numpy as np
+
+from app.controllers.mlfq_controller import MLFQController
+from app.controllers.prioridad_controller import PrioridadController
+from app.controllers.rr_controller import RRController
+from app.controllers.srtf_controller import SRTFController
+from app.models.barrido_quantum import iter_barrido_quantum
+from app.models.carga import leer_csv, leer_jsonl
+from app.models.eventos import EventoFin, EventoSegmento
+from app.models.metricas import MetricasSimulacion
+from app.models.mlfq_model import ModeloMLFQ
+from app.models.prioridad_model import ModeloPrioridad
+from app.models.motor_vectorizado import orden_de_nombres, simular_rr_lote, simular_srtf_lote
+from app.models.rr_model import ModeloRR
+from app.models.srtf_model import ModeloSRTF
+from app.models.tabla_procesos import TablaProcesos
+
+
+# --- Referencias congeladas ---
+
+def _referencia_rr(nombres, llegadas, duraciones, quantum):
+    """
+    Round Robin de referencia. Devuelve (segmentos, finalizacion) con segmentos como
+    (índice, comienzo, final, terminado).
+    Reglas: cola FIFO en orden de llegada (empates por orden de entrada); el proceso
+    expropiado vuelve a la cola ANTES de los que llegaron mientras se ejecutaba (o
+    justo al terminar su quantum); la CPU ociosa salta a la próxima llegada. Un proceso
+    con ráfaga 0 que llega mientras otro se ejecuta no entra a la cola: nunca se ejecuta
+    ni termina (si llega con la CPU libre, produce un segmento de duración 0).
+    """
+    total = len(nombres)
+    restante = list(duraciones)
+    finalizacion = [-1] * total
+    pendientes = sorted(range(total), key=lambda i: llegadas[i]) # Por llegar, en orden
+    cola = []
+    segmentos = []
+    tiempo = 0
+    while True:
+        while pendientes and llegadas[pendientes[0]] <= tiempo:
+            cola.append(pendientes.pop(0))
+        if not cola:
+            if not pendientes:
+                break
+            tiempo = llegadas[pendientes[0]]
+            continue
+        i = cola.pop(0)
+        ejecucion = min(restante[i], quantum)
+        comienzo = tiempo
+        restante[i] -= ejecucion
+        tiempo += ejecucion
+        if restante[i] > 0:
+            cola.append(i)
+            segmentos.append((i, comienzo, tiempo, False))
+        else:
+            finalizacion[i] = tiempo
+            segmentos.append((i, comienzo, tiempo, True))
+        while pendientes and llegadas[pendientes[0]] <= tiempo:
+            j = pendientes.pop(0)
+            if restante[j] > 0:
+                cola.append(j)
+    return segmentos, finalizacion
+
+
+def _referencia_srtf(nombres, llegadas, duraciones):
+    """
+    SRTF de referencia. Devuelve (segmentos, finalizacion) como _referencia_rr.
+    Reglas: entre los procesos que llegaron y tienen ráfaga pendiente se ejecuta el de
+    menor (restante, llegada, nombre, orden de entrada); el segmento se corta en la
+    próxima llegada anterior a su fin, aunque no expropie. Los procesos con ráfaga 0
+    nunca se ejecutan ni terminan.
+    """
+    total = len(nombres)
+    restante = list(duraciones)
+    finalizacion = [-1] * total
+    segmentos = []
+    tiempo = 0
+    while True:
+        listos = [i for i in range(total) if llegadas[i] <= tiempo and restante[i] > 0]
+        futuros = [llegadas[i] for i in range(total) if llegadas[i] > tiempo and restante[i] > 0]
+        if not listos:
+            if not futuros:
+                break
+            tiempo = min(futuros)
+            continue
+        i = min(listos, key=lambda j: (restante[j], llegadas[j], nombres[j], j))
+        ejecucion = restante[i]
+        cortes = [llegada for llegada in futuros if llegada < tiempo + restante[i]]
+        if cortes:
+            ejecucion = min(ejecucion, min(cortes) - tiempo)
+        comienzo = tiempo
+        restante[i] -= ejecucion
+        tiempo += ejecucion
+        if restante[i] <= 0:
+            finalizacion[i] = tiempo
+        segmentos.append((i, comienzo, tiempo, restante[i] <= 0))
+    return segmentos, finalizacion
+
+
+def _referencia_prioridad(nombres, llegadas, duraciones, prioridades, envejecimiento):
+    """
+    Planificación por prioridades expropiativa de referencia. Devuelve (segmentos, finalizacion).
+    Reglas: se ejecuta el listo de menor (prioridad efectiva, llegada, nombre, orden de
+    entrada); expropia solo una prioridad efectiva estrictamente mejor y el segmento se
+    corta solo entonces o al terminar. Al entrar en la cola (al llegar o al ser
+    expropiado) un proceso toma su prioridad base y, con envejecimiento E, la mejora en 1
+    cada E unidades de espera, hasta 0. Los procesos con ráfaga 0 nunca se ejecutan.
+    """
+    total = len(nombres)
+    restante = list(duraciones)
+    finalizacion = [-1] * total
+    efectiva = list(prioridades)
+    proximo_envejecimiento = [None] * total
+    por_llegar = [i for i in range(total) if restante[i] > 0]
+    cola = []
+    segmentos = []
+    tiempo = 0
+    actual = None
+    comienzo = None
+
+    def encolar(i):
+        efectiva[i] = prioridades[i]
+        proximo_envejecimiento[i] = tiempo + envejecimiento if envejecimiento is not None and efectiva[i] > 0 else None
+        cola.append(i)
+
+    def mejor():
+        return min(cola, key=lambda j: (efectiva[j], llegadas[j], nombres[j], j))
+
+    while True:
+        for i in [i for i in por_llegar if llegadas[i] <= tiempo]:
+            por_llegar.remove(i)
+            encolar(i)
+        for i in cola:
+            while proximo_envejecimiento[i] is not None and proximo_envejecimiento[i] <= tiempo:
+                efectiva[i] -= 1
+                proximo_envejecimiento[i] = proximo_envejecimiento[i] + envejecimiento if efectiva[i] > 0 else None
+        if actual is not None and cola and efectiva[mejor()] < efectiva[actual]:
+            segmentos.append((actual, comienzo, tiempo, False))
+            encolar(actual)
+            actual = None
+        if actual is None:
+            if not cola:
+                if not por_llegar:
+                    break
+                tiempo = min(llegadas[i] for i in por_llegar)
+                continue
+            actual = mejor()
+            cola.remove(actual)
+            comienzo = tiempo
+        fin = tiempo + restante[actual]
+        eventos = [llegadas[i] for i in por_llegar] + \
+                  [proximo_envejecimiento[i] for i in cola if proximo_envejecimiento[i] is not None]
+        proximo = min([fin] + [e for e in eventos if e < fin])
+        if proximo == fin:
+            restante[actual] = 0
+            tiempo = fin
+            finalizacion[actual] = fin
+            segmentos.append((actual, comienzo, fin, True))
+            actual = None
+        else:
+            restante[actual] -= proximo - tiempo
+            tiempo = proximo
+    return segmentos, finalizacion
+
+
+def _referencia_mlfq(nombres, llegadas, duraciones, quantums, asignaciones, intervalo_boost):
+    """
+    MLFQ de referencia, con una lista por nivel que se recorre para elegir el primero no
+    vacío. Devuelve (segmentos, finalizacion).
+    Reglas: se llega al nivel 0; un despacho en el nivel k dura a lo sumo quantums[k] y
+    al acumular asignaciones[k] en el nivel se baja al siguiente (en el último se sigue en
+    Round Robin); agotar el quantum sin completar la asignación devuelve al final del
+    nivel. Una llegada expropia a un proceso de un nivel inferior al 0, que vuelve al
+    frente de su nivel. En cada múltiplo de intervalo_boost todos los listos suben al
+    nivel 0 en orden de nivel, con el acumulado en 0; el boost corta el segmento en curso
+    y ese proceso vuelve antes al final de su nivel. Tras un quantum el proceso vuelve a
+    la cola antes que las llegadas. Los procesos con ráfaga 0 nunca se ejecutan.
+    """
+    asignaciones = asignaciones or quantums
+    total = len(nombres)
+    restante = list(duraciones)
+    finalizacion = [-1] * total
+    acumulado = [0] * total
+    niveles = [[] for _ in quantums]
+    por_llegar = sorted((i for i in range(total) if restante[i] > 0), key=lambda i: llegadas[i])
+    segmentos = []
+    tiempo = 0
+    indice_boost = 1
+    proximo_boost = intervalo_boost
+    while True:
+        if intervalo_boost is not None and proximo_boost <= tiempo:
+            # El siguiente múltiplo de intervalo_boost posterior a tiempo
+            indice_boost = max(indice_boost + 1, int(tiempo // intervalo_boost))
+            proximo_boost = indice_boost * intervalo_boost
+            while proximo_boost <= tiempo:
+                indice_boost += 1
+                proximo_boost = indice_boost * intervalo_boost
+            todos = [i for nivel in niveles for i in nivel]
+            for i in todos:
+                acumulado[i] = 0
+            niveles = [todos] + [[] for _ in quantums[1:]]
+        while por_llegar and llegadas[por_llegar[0]] <= tiempo:
+            niveles[0].append(por_llegar.pop(0))
+        no_vacios = [k for k, nivel in enumerate(niveles) if nivel]
+        if not no_vacios:
+            if not por_llegar:
+                break
+            tiempo = llegadas[por_llegar[0]]
+            continue
+        k = no_vacios[0]
+        i = niveles[k].pop(0)
+        resto_asignacion = asignaciones[k] - acumulado[i]
+        rebanada = min(restante[i], quantums[k], resto_asignacion)
+        fin = tiempo + rebanada
+        cortes = [fin]
+        if k > 0 and por_llegar and llegadas[por_llegar[0]] < fin:
+            cortes.append(llegadas[por_llegar[0]])
+        if intervalo_boost is not None and proximo_boost < fin:
+            cortes.append(proximo_boost)
+        corte = min(cortes)
+        comienzo = tiempo
+        tiempo = corte
+        if corte == fin and rebanada == restante[i]:
+            restante[i] = 0
+            finalizacion[i] = fin
+            segmentos.append((i, comienzo, fin, True))
+            continue
+        ejecutado = rebanada if corte == fin else corte - comienzo
+        restante[i] -= ejecutado
+        acumulado[i] += ejecutado
+        segmentos.append((i, comienzo, corte, False))
+        if corte == fin:
+            if rebanada == resto_asignacion:
+                acumulado[i] = 0
+                k = min(k + 1, len(quantums) - 1)
+            niveles[k].append(i)
+        elif intervalo_boost is not None and corte == proximo_boost:
+            niveles[k].append(i)
+        else:
+            niveles[k].insert(0, i)
+    return segmentos, finalizacion
+
+
+def _fusionar(segmentos):
+    fusionados = []
+    for segmento in segmentos:
+        if fusionados and fusionados[-1][0] == segmento[0] and fusionados[-1][2] == segmento[1]:
+            fusionados[-1] = (segmento[0], fusionados[-1][1], segmento[2], segmento[3])
+        else:
+            fusionados.append(segmento)
+    return fusionados
+
+
+def _metricas_referencia(llegadas, duraciones, segmentos, finalizacion):
+    """MetricasSimulacion calculadas directamente de los segmentos y finalizaciones de referencia."""
+    total = len(llegadas)
+    if not total:
+        return MetricasSimulacion(0, 0.0, 0.0, 0.0, 0, 0)
+    primer_comienzo = {}
+    cambios = 0
+    for k, (i, comienzo, _final, _terminado) in enumerate(segmentos):
+        primer_comienzo.setdefault(i, comienzo)
+        if k and segmentos[k - 1][0] != i:
+            cambios += 1
+    # Los promedios son sobre los procesos que terminaron; uno que nunca termina (ráfaga 0)
+    # no tiene espera ni turnaround
+    terminados = [i for i in range(total) if finalizacion[i] != -1]
+    if not terminados:
+        return MetricasSimulacion(total, 0.0, 0.0, 0.0, cambios, len(segmentos))
+    turnaround = [finalizacion[i] - llegadas[i] for i in terminados]
+    espera = [turnaround[k] - duraciones[i] for k, i in enumerate(terminados)]
+    respuesta = sum(float(primer_comienzo[i]) - llegadas[i] for i in terminados if i in primer_comienzo)
+    return MetricasSimulacion(total, sum(espera) / len(terminados), sum(turnaround) / len(terminados),
+                              respuesta / len(terminados), cambios, len(segmentos))
+
+
+# --- Generación de cargas ---
+
+def generar_carga(rng, max_procesos, flotantes=False):
+    """
+    Carga aleatoria como (nombres, llegadas, duraciones), con uno de varios patrones de
+    llegada: todos juntos, pocos instantes muy repetidos, uniformes, o con huecos largos
+    (CPU ociosa). Incluye nombres repetidos y ráfagas 0 de vez en cuando.
+    Con `flotantes` True hay tiempos flotantes mezclados con enteros en ambas columnas;
+    con 'llegada' o 'duracion' solo esa columna es flotante (todos sus valores) y la
+    otra queda entera.
+    """
+    total = rng.randint(0, max_procesos)
+    patron = rng.choice(('simultaneas', 'empates', 'uniformes', 'huecos'))
+    nombres, llegadas, duraciones = [], [], []
+    tiempo = 0
+    for i in range(total):
+        if patron == 'simultaneas':
+            llegada = 0
+        elif patron == 'empates':
+            llegada = rng.choice((0, 3, 3, 3, 8, 8))
+        elif patron == 'uniformes':
+            llegada = rng.randint(0, 3 * max_procesos)
+        else:
+            tiempo += rng.choice((0, 0, 1, 2, 15, 40)) # Sin hueco, cortos y largos
+            llegada = tiempo
+        duracion = rng.choice((1, 1, 2, 3, 5, 8, 13, 30))
+        if flotantes is True and rng.random() < 0.5:
+            llegada += rng.choice((0.5, 0.25, 0.1))
+            duracion += rng.choice((0.5, 0.0, 0.3))
+        elif flotantes == 'llegada':
+            llegada += rng.choice((0.0, 0.5, 0.25))
+        elif flotantes == 'duracion':
+            duracion += rng.choice((0.0, 0.5, 0.3))
+        nombres.append(f"P{rng.randint(0, 3)}" if rng.random() < 0.1 else f"P{i}")
+        llegadas.append(llegada)
+        duraciones.append(duracion)
+    if total and rng.random() < 0.15:
+        for _ in range(rng.randint(1, 2)):
+            duraciones[rng.randrange(total)] = 0
+    orden = list(range(total))
+    rng.shuffle(orden)
+    return [nombres[i] for i in orden], [llegadas[i] for i in orden], [duraciones[i] for i in orden]
+
+
+# --- Comparaciones ---
+
+def _tabla(carga):
+    return TablaProcesos(*carga)
+
+
+def _procesos(carga, prioridades=None):
+    procesos = [{'nombre': n, 'llegada': l, 'duracion_original': d} for n, l, d in zip(*carga)]
+    if prioridades is not None:
+        for proceso, prioridad in zip(procesos, prioridades):
+            proceso['prioridad'] = prioridad
+    return procesos
+
+
+def _columna(tabla, nombre):
+    return list(getattr(tabla, nombre))
+
+
+def _esperar_igual(descripcion, obtenido, esperado):
+    if obtenido != esperado:
+        raise AssertionError(f"{descripcion}:\n  obtenido: {obtenido!r}\n  esperado: {esperado!r}")
+
+
+def _esperar_cercano(descripcion, obtenido, esperado, exacto):
+    if exacto:
+        _esperar_igual(descripcion, obtenido, esperado)
+    elif not all(math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12) for a, b in zip(obtenido, esperado)):
+        raise AssertionError(f"{descripcion}:\n  obtenido: {obtenido!r}\n  esperado: {esperado!r}")
+
+
+def _por_proceso(llegadas, duraciones, finalizacion):
+    turnaround = [f - l if f != -1 else -1 for f, l in zip(finalizacion, llegadas)]
+    espera = [t - d if t != -1 else -1 for t, d in zip(turnaround, duraciones)]
+    return finalizacion, espera, turnaround
+
+
+def _dicts_referencia(nombres, llegadas, duraciones, segmentos, finalizacion):
+    _fin, espera, turnaround = _por_proceso(llegadas, duraciones, finalizacion)
+    return [{'proceso': nombres[i], 'llegada': llegadas[i], 'cpu_original': duraciones[i],
+             'comienzo': comienzo, 'final': final,
+             'espera_final': espera[i] if finalizacion[i] != -1 else "No Term.",
+             'turnaround_final': turnaround[i] if finalizacion[i] != -1 else "No Term."}
+            for i, comienzo, final, _terminado in segmentos]
+
+
+def _eventos_referencia(nombres, llegadas, duraciones, segmentos, finalizacion):
+    _fin, espera, turnaround = _por_proceso(llegadas, duraciones, finalizacion)
+    eventos = []
+    for i, comienzo, final, terminado in segmentos:
+        eventos.append(EventoSegmento(nombres[i], comienzo, final))
+        if terminado:
+            eventos.append(EventoFin(nombres[i], llegadas[i], duraciones[i], finalizacion[i], espera[i], turnaround[i]))
+    return eventos
+
+
+def _comparar_tabla(descripcion, tabla, carga, finalizacion):
+    nombres, llegadas, duraciones = carga
+    esperado = _por_proceso(llegadas, duraciones, finalizacion)
+    for columna, valores in zip(('finalizacion', 'espera', 'turnaround'), esperado):
+        _esperar_igual(f"{descripcion}: {columna}", _columna(tabla, columna), valores)
+
+
+def verificar_rr(carga, quantum):
+    """Compara todos los caminos de Round Robin con la referencia; lanza AssertionError si difieren."""
+    nombres, llegadas, duraciones = carga
+    segmentos, finalizacion = _referencia_rr(nombres, llegadas, duraciones, quantum)
+    for fusionar in (False, True):
+        esperados = _fusionar(segmentos) if fusionar else segmentos
+        etiqueta = f"RR q={quantum}{' fusionado' if fusionar else ''}"
+        tabla = _tabla(carga)
+        _esperar_igual(f"{etiqueta}: ModeloRR.eventos()", list(ModeloRR(tabla, quantum, fusionar).eventos()), esperados)
+        _comparar_tabla(f"{etiqueta}: ModeloRR.eventos()", tabla, carga, finalizacion)
+        tabla = _tabla(carga)
+        _esperar_igual(f"{etiqueta}: ModeloRR.metricas()", ModeloRR(tabla, quantum, fusionar).metricas(),
+                       _metricas_referencia(llegadas, duraciones, esperados, finalizacion))
+        _comparar_tabla(f"{etiqueta}: ModeloRR.metricas()", tabla, carga, finalizacion)
+
+    procesos = _procesos(carga)
+    _esperar_igual(f"RR q={quantum}: RRController.simular_rr", RRController.simular_rr(procesos, quantum),
+                   _dicts_referencia(nombres, llegadas, duraciones, segmentos, finalizacion))
+    _esperar_igual(f"RR q={quantum}: RRController.iter_rr", list(RRController.iter_rr(procesos, quantum)),
+                   _eventos_referencia(nombres, llegadas, duraciones, segmentos, finalizacion))
+    if carga[0]:
+        _esperar_igual(f"RR q={quantum}: iter_barrido_quantum", list(iter_barrido_quantum(_tabla(carga), [quantum], 1)),
+                       [(quantum, _metricas_referencia(llegadas, duraciones, segmentos, finalizacion))])
+    if carga[0]:
+        _verificar_lote(f"RR q={quantum}: simular_rr_lote", simular_rr_lote([llegadas], [duraciones], quantum),
+                        carga, segmentos, finalizacion)
+
+
+def verificar_srtf(carga):
+    """Compara todos los caminos de SRTF con la referencia; lanza AssertionError si difieren."""
+    nombres, llegadas, duraciones = carga
+    segmentos, finalizacion = _referencia_srtf(nombres, llegadas, duraciones)
+    tabla = _tabla(carga)
+    _esperar_igual("SRTF: ModeloSRTF.eventos()", list(ModeloSRTF(tabla).eventos()), segmentos)
+    _comparar_tabla("SRTF: ModeloSRTF.eventos()", tabla, carga, finalizacion)
+    tabla = _tabla(carga)
+    _esperar_igual("SRTF: ModeloSRTF.metricas()", ModeloSRTF(tabla).metricas(),
+                   _metricas_referencia(llegadas, duraciones, segmentos, finalizacion))
+    _comparar_tabla("SRTF: ModeloSRTF.metricas()", tabla, carga, finalizacion)
+
+    procesos = _procesos(carga)
+    _esperar_igual("SRTF: SRTFController.simular_srtf", SRTFController.simular_srtf(procesos),
+                   _dicts_referencia(nombres, llegadas, duraciones, segmentos, finalizacion))
+    _esperar_igual("SRTF: SRTFController.iter_srtf", list(SRTFController.iter_srtf(procesos)),
+                   _eventos_referencia(nombres, llegadas, duraciones, segmentos, finalizacion))
+    if carga[0]:
+        _verificar_lote("SRTF: simular_srtf_lote",
+                        simular_srtf_lote([llegadas], [duraciones], orden_de_nombres(nombres)),
+                        carga, segmentos, finalizacion)
+
+
+def _verificar_lote(descripcion, lote, carga, segmentos, finalizacion):
+    nombres, llegadas, duraciones = carga
+    exacto = all(type(v) is int for v in llegadas + duraciones)
+    _esperar_igual(f"{descripcion}: finalizacion", [-1 if math.isnan(f) else f for f in lote.finalizacion[0].tolist()],
+                   [float(f) for f in finalizacion])
+    esperadas = _metricas_referencia(llegadas, duraciones, segmentos, finalizacion)
+    _esperar_igual(f"{descripcion}: cambios de contexto y segmentos",
+                   (int(lote.cambios_contexto[0]), int(lote.segmentos[0])),
+                   (esperadas.cambios_contexto, esperadas.segmentos))
+    _esperar_cercano(f"{descripcion}: promedios",
+                     [float(lote.espera_promedio[0]), float(lote.turnaround_promedio[0]), float(lote.respuesta_promedio[0])],
+                     [esperadas.espera_promedio, esperadas.turnaround_promedio, esperadas.respuesta_promedio], exacto)
+
+
+def verificar_prioridad(carga, prioridades, envejecimiento):
+    """Compara el motor de prioridades con la referencia; lanza AssertionError si difieren."""
+    nombres, llegadas, duraciones = carga
+    segmentos, finalizacion = _referencia_prioridad(nombres, llegadas, duraciones, prioridades, envejecimiento)
+    etiqueta = f"Prioridad envejecimiento={envejecimiento}"
+    tabla = _tabla(carga)
+    _esperar_igual(f"{etiqueta}: ModeloPrioridad.eventos()",
+                   list(ModeloPrioridad(tabla, prioridades, envejecimiento).eventos()), segmentos)
+    _comparar_tabla(f"{etiqueta}: ModeloPrioridad.eventos()", tabla, carga, finalizacion)
+    _esperar_igual(f"{etiqueta}: ModeloPrioridad.metricas()",
+                   ModeloPrioridad(_tabla(carga), prioridades, envejecimiento).metricas(),
+                   _metricas_referencia(llegadas, duraciones, segmentos, finalizacion))
+
+    procesos = _procesos(carga, prioridades)
+    _esperar_igual(f"{etiqueta}: PrioridadController.simular_prioridad",
+                   PrioridadController.simular_prioridad(procesos, envejecimiento),
+                   _dicts_referencia(nombres, llegadas, duraciones, segmentos, finalizacion))
+    _esperar_igual(f"{etiqueta}: PrioridadController.iter_prioridad",
+                   list(PrioridadController.iter_prioridad(procesos, envejecimiento)),
+                   _eventos_referencia(nombres, llegadas, duraciones, segmentos, finalizacion))
+
+
+def verificar_mlfq(carga, quantums, asignaciones, intervalo_boost):
+    """Compara el motor MLFQ con la referencia; lanza AssertionError si difieren."""
+    nombres, llegadas, duraciones = carga
+    segmentos, finalizacion = _referencia_mlfq(nombres, llegadas, duraciones, quantums, asignaciones, intervalo_boost)
+    etiqueta = f"MLFQ quantums={quantums} asignaciones={asignaciones} boost={intervalo_boost}"
+    if len(quantums) == 1 and asignaciones is None and intervalo_boost is None and all(d > 0 for d in duraciones):
+        _esperar_igual(f"{etiqueta}: referencia de un nivel frente a la de RR", segmentos,
+                       _referencia_rr(nombres, llegadas, duraciones, quantums[0])[0])
+    tabla = _tabla(carga)
+    _esperar_igual(f"{etiqueta}: ModeloMLFQ.eventos()",
+                   list(ModeloMLFQ(tabla, quantums, asignaciones, intervalo_boost).eventos()), segmentos)
+    _comparar_tabla(f"{etiqueta}: ModeloMLFQ.eventos()", tabla, carga, finalizacion)
+    _esperar_igual(f"{etiqueta}: ModeloMLFQ.metricas()",
+                   ModeloMLFQ(_tabla(carga), quantums, asignaciones, intervalo_boost).metricas(),
+                   _metricas_referencia(llegadas, duraciones, segmentos, finalizacion))
+
+    procesos = _procesos(carga)
+    _esperar_igual(f"{etiqueta}: MLFQController.simular_mlfq",
+                   MLFQController.simular_mlfq(procesos, quantums, asignaciones, intervalo_boost),
+                   _dicts_referencia(nombres, llegadas, duraciones, segmentos, finalizacion))
+    _esperar_igual(f"{etiqueta}: MLFQController.iter_mlfq",
+                   list(MLFQController.iter_mlfq(procesos, quantums, asignaciones, intervalo_boost)),
+                   _eventos_referencia(nombres, llegadas, duraciones, segmentos, finalizacion))
+
+
+def verificar_archivos(carga, prioridades, quantum, envejecimiento, mlfq):
+    """
+    Escribe la carga como CSV y como JSONL, la lee con app.models.carga y compara las
+    columnas y cada motor sobre la tabla leída con la referencia. Las ráfagas 0 se quitan
+    antes: los cargadores las rechazan.
+    """
+    filas = [(n, l, d, p) for n, l, d, p in zip(*carga, prioridades) if d > 0]
+    if not filas:
+        return
+    nombres, llegadas, duraciones, prioridades = (list(columna) for columna in zip(*filas))
+    textos = (("CSV", leer_csv, "".join(f"{n},{l!r},{d!r}\n" for n, l, d, _ in filas)),
+              ("JSONL", leer_jsonl, "".join(json.dumps({"nombre": n, "llegada": l, "duracion": d}) + "\n"
+                                            for n, l, d, _ in filas)))
+    referencias = (
+        ("ModeloRR", lambda tabla: ModeloRR(tabla, quantum).eventos(),
+         _referencia_rr(nombres, llegadas, duraciones, quantum)[0]),
+        ("ModeloSRTF", lambda tabla: ModeloSRTF(tabla).eventos(),
+         _referencia_srtf(nombres, llegadas, duraciones)[0]),
+        ("ModeloPrioridad", lambda tabla: ModeloPrioridad(tabla, prioridades, envejecimiento).eventos(),
+         _referencia_prioridad(nombres, llegadas, duraciones, prioridades, envejecimiento)[0]),
+        ("ModeloMLFQ", lambda tabla: ModeloMLFQ(tabla, *mlfq).eventos(),
+         _referencia_mlfq(nombres, llegadas, duraciones, *mlfq)[0]),
+    )
+    for formato, leer, texto in textos:
+        tabla = leer(io.StringIO(texto))
+        _esperar_igual(f"{formato}: columnas leídas", (tabla.nombres, list(tabla.llegada), list(tabla.duracion)),
+                       (nombres, llegadas, duraciones))
+        for motor, eventos, segmentos in referencias:
+            _esperar_igual(f"{formato}: {motor}.eventos()", list(eventos(tabla.nueva_ejecucion())), segmentos)
+
+
+def _parametros_mlfq(rng, flotantes):
+    """(quantums, asignaciones, intervalo_boost) aleatorios; a veces un solo nivel sin boost."""
+    if rng.random() < 0.2:
+        return [rng.choice((1, 2, 3))], None, None
+    niveles = rng.randint(2, 4)
+    quantums = [rng.choice((1, 2, 4)) * (k + 1) for k in range(niveles)]
+    if flotantes:
+        quantums = [q / 2 for q in quantums]
+    asignaciones = None if rng.random() < 0.5 else [q * rng.choice((1, 2, 3)) for q in quantums]
+    intervalo_boost = rng.choice((None, 10, 25, 7.5 if flotantes else 40))
+    return quantums, asignaciones, intervalo_boost
+
+
+def _verificar_caso(carga, prioridades, quantum, envejecimiento, mlfq):
+    try:
+        verificar_rr(carga, quantum)
+        verificar_srtf(carga)
+        verificar_prioridad(carga, prioridades, envejecimiento)
+        verificar_mlfq(carga, *mlfq)
+        verificar_archivos(carga, prioridades, quantum, envejecimiento, mlfq)
+    except AssertionError:
+        raise
+    except Exception as e: # Un motor que falla con una carga válida también difiere de la referencia
+        raise AssertionError(f"excepción en un motor: {type(e).__name__}: {e}") from e
+
+
+def reducir(carga, prioridades, quantum, envejecimiento, mlfq):
+    """
+    Quita procesos de `carga` (y sus `prioridades`) uno a uno mientras la verificación
+    siga fallando. Devuelve (carga, prioridades) reducidas.
+    """
+    cambio = True
+    while cambio:
+        cambio = False
+        for k in range(len(carga[0])):
+            candidata = tuple(columna[:k] + columna[k + 1:] for columna in carga)
+            prioridades_candidata = prioridades[:k] + prioridades[k + 1:]
+            try:
+                _verificar_caso(candidata, prioridades_candidata, quantum, envejecimiento, mlfq)
+            except AssertionError:
+                carga, prioridades = candidata, prioridades_candidata
+                cambio = True
+                break
+    return carga, prioridades
+
+
+# Cargas que alguna vez hicieron fallar a un motor; se verifican antes que las aleatorias.
+# Cada una: (carga, prioridades, quantum, envejecimiento, parámetros MLFQ)
+REGRESIONES = [
+    # Llegada flotante con ráfagas enteras: `restante` quedaba en array('q') y la resta
+    # de un tiempo flotante lanzaba TypeError
+    ((['A', 'B'], [0, 1.5], [5, 1]), [0, 0], 1, None, ([1], None, None)),
+    # Lo mismo en el motor de prioridades: B expropia a A en t = 1.5 y C envejece con E entero
+    ((['A', 'B', 'C'], [0, 1.5, 0.5], [5, 1, 2]), [3, 0, 4], 2, 2, ([1], None, None)),
+    # Y en MLFQ: B llega en t = 2.5 y expropia a A en el nivel 1, con quantums enteros
+    ((['A', 'B'], [0, 2.5], [5, 1]), [0, 0], 1, None, ([2, 4], None, None)),
+]
+
+
+def verificar(casos, max_procesos, semilla, progreso=None):
+    """
+    Verifica las REGRESIONES y `casos` cargas aleatorias (reproducibles con `semilla`).
+    Devuelve None si todo coincide o (carga, prioridades, quantum, envejecimiento,
+    parámetros MLFQ, mensaje) del primer contraejemplo, ya reducido.
+    """
+    for carga, prioridades, quantum, envejecimiento, mlfq in REGRESIONES:
+        try:
+            _verificar_caso(carga, prioridades, quantum, envejecimiento, mlfq)
+        except AssertionError as e:
+            return carga, prioridades, quantum, envejecimiento, mlfq, str(e)
+    rng = random.Random(semilla)
+    for k in range(casos):
+        # Parámetros flotantes solo con flotantes en ambas columnas: con una sola, los
+        # motores trabajan sobre la tabla mixta tal como llega
+        flotantes = k % 4 == 3
+        mixta = {1: 'llegada', 5: 'duracion'}.get(k % 8, False)
+        carga = generar_carga(rng, max_procesos, flotantes=flotantes or mixta)
+        prioridades = [rng.randint(0, 4) for _ in carga[0]]
+        quantum = rng.choice((1, 1.5, 0.5)) if flotantes else rng.choice((1, 2, 3, 5))
+        envejecimiento = rng.choice((None, 1, 2.5) if flotantes else (None, 1, 2, 4))
+        mlfq = _parametros_mlfq(rng, flotantes)
+        try:
+            _verificar_caso(carga, prioridades, quantum, envejecimiento, mlfq)
+        except AssertionError:
+            carga, prioridades = reducir(carga, prioridades, quantum, envejecimiento, mlfq)
+            try:
+                _verificar_caso(carga, prioridades, quantum, envejecimiento, mlfq)
+            except AssertionError as e:
+                return carga, prioridades, quantum, envejecimiento, mlfq, str(e)
+        if progreso and (k + 1) % 500 == 0:
+            progreso(k + 1)
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.verificacion",
+                                     description="Compara los motores RR, SRTF, de prioridades y MLFQ con las implementaciones de referencia.")
+    parser.add_argument("--casos", "-n", type=int, default=2000, help="Cantidad de cargas aleatorias (por defecto 2000)")
+    parser.add_argument("--max-procesos", "-p", type=int, default=12, help="Procesos por carga, como máximo (por defecto 12)")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de las cargas (por defecto 0)")
+    args = parser.parse_args(argv)
+    if args.casos < 1 or args.max_procesos < 1:
+        parser.error("la cantidad de casos y de procesos debe ser al menos 1")
+
+    np.seterr(all="raise") # Un NaN o inf en el motor vectorizado también es un error
+    falla = verificar(args.casos, args.max_procesos, args.semilla,
+                      progreso=lambda k: print(f"{k} cargas verificadas", file=sys.stderr))
+    if falla is None:
+        print(f"OK: {args.casos} cargas, todos los motores coinciden con la referencia.")
+        return 0
+    carga, prioridades, quantum, envejecimiento, (quantums, asignaciones, boost), mensaje = falla
+    print("ERROR (verificacion): un motor difiere de la referencia.", file=sys.stderr)
+    print(f"Contraejemplo (quantum {quantum}, envejecimiento {envejecimiento}, MLFQ quantums {quantums}, "
+          f"asignaciones {asignaciones}, boost {boost}):", file=sys.stderr)
+    for (nombre, llegada, duracion), prioridad in zip(zip(*carga), prioridades):
+        print(f"  {nombre}, llegada {llegada}, duración {duracion}, prioridad {prioridad}", file=sys.stderr)
+    print(mensaje, file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
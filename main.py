@@ -1,12 +1,30 @@
+import time
+_T_INICIO = time.perf_counter() # Referencia para medir el tiempo hasta el primer frame
+
 import customtkinter as ctk
 import os
+import threading
 import app.config as config
 from app.config import APP_ICON_PATH, ASSETS_DIR, BG_IMAGE_RR_PATH, BG_IMAGE_SRTF_PATH, COLOR_AMARILLO
 
-# Importar las vistas desde views.py dentro de app/gui
-from app.gui.views import RRView, SRTFView
+# Las vistas (app.gui.views) NO se importan aquí: arrastran PIL y, al dibujar el Gantt,
+# matplotlib. Se importan en segundo plano una vez visible el menú (ver
+# _precargar_vistas) y, si el usuario es más rápido, al abrir RR o SRTF.
 # Nota: ResultsView es llamada por RRView y SRTFView, no directamente aquí a menos que tengas un menú más complejo.
 
+
+def _precargar_vistas(tamano_ventana):
+    try:
+        from app.gui.cache_imagenes import cache_imagenes
+        # Decodificar y escalar los fondos de RR/SRTF mientras el usuario mira el menú
+        for ruta_fondo in (BG_IMAGE_RR_PATH, BG_IMAGE_SRTF_PATH):
+            if os.path.exists(ruta_fondo):
+                cache_imagenes.precargar(ruta_fondo, tamano_ventana)
+        from app.gui import views
+        views.cargar_backend_graficos() # Ya estamos en un hilo secundario
+    except Exception as e:
+        print(f"ADVERTENCIA (MainApp): Falló la precarga de vistas: {e}")
+
 class MainApplication(ctk.CTk):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -29,6 +47,15 @@ class MainApplication(ctk.CTk):
 
         self.current_view = None
         self.create_main_menu_buttons() # Crear botones para seleccionar RR o SRTF
+        self.after_idle(self._primer_frame_mostrado)
+
+    def _primer_frame_mostrado(self):
+        # after_idle se ejecuta cuando Tk terminó de procesar la geometría y el dibujado pendientes
+        print(f"INFO (MainApp): Tiempo hasta el primer frame: {(time.perf_counter() - _T_INICIO) * 1000:.0f} ms")
+        tamano_ventana = (self.winfo_width(), self.winfo_height())
+        if tamano_ventana[0] <= 1 or tamano_ventana[1] <= 1:
+            tamano_ventana = (1280, 720)
+        threading.Thread(target=_precargar_vistas, args=(tamano_ventana,), name="precarga-vistas", daemon=True).start()
 
     def create_main_menu_buttons(self):
         # Limpiar cualquier vista anterior
@@ -49,7 +76,7 @@ class MainApplication(ctk.CTk):
             ctk.CTkLabel(menu_frame, text="Simulador de Planificación", font=font_titulo_menu, text_color=config.COLOR_AMARILLO).pack(pady=(20, 40))
 
 
-        # Botones para RR y SRTF
+        # Botones para RR, SRTF y la comparación entre ambos
         button_font = ("space age", 18)
         try: ctk.CTkButton(menu_frame, text="", font=button_font).destroy() # Check font
         except: button_font = ("Arial", 16, "bold")
@@ -66,6 +93,12 @@ class MainApplication(ctk.CTk):
                                  text_color=config.COLOR_AMARILLO)
         btn_srtf.pack(pady=20)
 
+        btn_dual = ctk.CTkButton(menu_frame, text="RR vs SRTF (Monte Carlo)", command=self.show_dual_view,
+                                 font=button_font, width=300, height=60,
+                                 fg_color="#800080", hover_color="#4B004B",
+                                 text_color=config.COLOR_AMARILLO)
+        btn_dual.pack(pady=20)
+
         # Botón de Salir
         btn_salir = ctk.CTkButton(menu_frame, text="Salir", command=self.quit,
                                  font=button_font, width=200, height=50,
@@ -74,17 +107,25 @@ class MainApplication(ctk.CTk):
 
 
     def show_rr_view(self):
+        from app.gui.views import RRView
         if self.current_view:
             self.current_view.destroy()
         self.current_view = RRView(master=self, volver_callback_menu_principal=self.create_main_menu_buttons)
         # RRView se empaqueta a sí misma en su __init__
 
     def show_srtf_view(self):
+        from app.gui.views import SRTFView
         if self.current_view:
             self.current_view.destroy()
         self.current_view = SRTFView(master=self, volver_callback_menu_principal=self.create_main_menu_buttons)
         # SRTFView se empaqueta a sí misma en su __init__
 
+    def show_dual_view(self):
+        from app.gui.dual_view import DualView
+        if self.current_view:
+            self.current_view.destroy()
+        self.current_view = DualView(master=self, volver_callback_menu_principal=self.create_main_menu_buttons)
+
 if __name__ == "__main__":
     # --- Verificación de Rutas (Importante para Depuración) ---
     print(f"--- INICIANDO APLICACIÓN ---")